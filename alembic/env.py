@@ -12,6 +12,7 @@ from app.config.settings import settings
 from app.core.base import Base
 from app.models.user import User  # noqa: F401
 from app.modules.teacher.models import TeacherProfile 
+from app.modules.auth.models import RefreshToken  # noqa: F401
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
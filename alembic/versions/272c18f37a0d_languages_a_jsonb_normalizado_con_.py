@@ -0,0 +1,64 @@
+"""languages a jsonb normalizado con indice gin
+
+Revision ID: 272c18f37a0d
+Revises: ed673de428e0
+Create Date: 2026-10-18 12:24:19.313761
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '272c18f37a0d'
+down_revision: Union[str, Sequence[str], None] = 'ed673de428e0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Misma normalización que app.modules.teacher.languages: subtag primario en
+    # minúsculas, sin repetidos (orden de aparición); códigos inválidos se descartan.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION teacher_languages_normalize(value json) RETURNS jsonb AS $$
+            SELECT coalesce(jsonb_agg(code ORDER BY first_pos), '[]'::jsonb)
+            FROM (
+                SELECT code, min(pos) AS first_pos
+                FROM (
+                    SELECT split_part(replace(lower(btrim(e.v)), '_', '-'), '-', 1) AS code, e.pos
+                    FROM json_array_elements_text(
+                        CASE WHEN json_typeof(value) = 'array' THEN value ELSE '[]'::json END
+                    ) WITH ORDINALITY AS e(v, pos)
+                ) AS raw
+                WHERE code ~ '^[a-z]{2,3}$'
+                GROUP BY code
+            ) AS codes
+        $$ LANGUAGE sql IMMUTABLE
+    """)
+    op.alter_column(
+        'teacher_profiles',
+        'languages',
+        existing_type=sa.JSON(),
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        existing_nullable=False,
+        postgresql_using='teacher_languages_normalize(languages)',
+    )
+    op.execute("DROP FUNCTION teacher_languages_normalize(json)")
+    op.create_index('ix_teacher_profiles_languages', 'teacher_profiles', ['languages'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_teacher_profiles_languages', table_name='teacher_profiles', postgresql_using='gin')
+    op.alter_column(
+        'teacher_profiles',
+        'languages',
+        existing_type=postgresql.JSONB(astext_type=sa.Text()),
+        type_=sa.JSON(),
+        existing_nullable=False,
+        postgresql_using='languages::json',
+    )
@@ -0,0 +1,29 @@
+"""agregar photo_hash a teacher_profiles
+
+Revision ID: 3c9d1b7e4a20
+Revises: e11e05163b2e
+Create Date: 2026-10-18 13:20:41.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9d1b7e4a20'
+down_revision: Union[str, Sequence[str], None] = 'e11e05163b2e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # sha256 de la foto subida (key de sus variantes); NULL => photo_url externa / sin foto
+    op.add_column('teacher_profiles', sa.Column('photo_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('teacher_profiles', 'photo_hash')
@@ -0,0 +1,42 @@
+"""indice parcial para listado publico de docentes
+
+Revision ID: 835a06b665df
+Revises: 05fefae1215c
+Create Date: 2026-10-18 12:20:58.846429
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '835a06b665df'
+down_revision: Union[str, Sequence[str], None] = '05fefae1215c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY: no bloquea escrituras en tablas grandes (fuera de la transacción)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_teacher_profiles_public_order',
+            'teacher_profiles',
+            [sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False,
+            postgresql_where=sa.text("status = 'APPROVED'"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_teacher_profiles_public_order',
+            table_name='teacher_profiles',
+            postgresql_concurrently=True,
+        )
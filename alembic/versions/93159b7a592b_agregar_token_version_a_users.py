@@ -0,0 +1,50 @@
+"""agregar token_version a users
+
+Revision ID: 93159b7a592b
+Revises: 8d2ee28b9cf0
+Create Date: 2026-10-18 12:10:28.202164
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '93159b7a592b'
+down_revision: Union[str, Sequence[str], None] = '8d2ee28b9cf0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'users',
+        sa.Column('token_version', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    )
+
+    # Cualquier cambio de role/status (ORM, bulk o manual) revoca los tokens emitidos
+    op.execute("""
+        CREATE OR REPLACE FUNCTION users_bump_token_version() RETURNS trigger AS $$
+        BEGIN
+            NEW.token_version := OLD.token_version + 1;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_users_bump_token_version
+        BEFORE UPDATE OF role, status ON users
+        FOR EACH ROW
+        WHEN (OLD.role IS DISTINCT FROM NEW.role OR OLD.status IS DISTINCT FROM NEW.status)
+        EXECUTE FUNCTION users_bump_token_version()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS trg_users_bump_token_version ON users")
+    op.execute("DROP FUNCTION IF EXISTS users_bump_token_version()")
+    op.drop_column('users', 'token_version')
@@ -0,0 +1,29 @@
+"""indice session_expires_at en refresh_tokens
+
+Revision ID: a4f2c8e61d3b
+Revises: 3c9d1b7e4a20
+Create Date: 2026-10-18 14:05:12.481937
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4f2c8e61d3b'
+down_revision: Union[str, Sequence[str], None] = '3c9d1b7e4a20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Purga de sesiones terminadas (scripts/purge_refresh_tokens.py)
+    op.create_index(op.f('ix_refresh_tokens_session_expires_at'), 'refresh_tokens', ['session_expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_refresh_tokens_session_expires_at'), table_name='refresh_tokens')
@@ -0,0 +1,68 @@
+"""log de revocaciones de tokens
+
+Revision ID: b7e3d91f5c24
+Revises: a4f2c8e61d3b
+Create Date: 2026-10-18 15:32:08.207315
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e3d91f5c24'
+down_revision: Union[str, Sequence[str], None] = 'a4f2c8e61d3b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('token_revocations',
+    sa.Column('id', sa.BigInteger(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('token_version', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_token_revocations_created_at'), 'token_revocations', ['created_at'], unique=False)
+
+    # Cada revocación (token_version incrementado o usuario borrado) queda en el log:
+    # los workers en modo claims-only recargan solo las recientes, no toda la tabla users
+    op.execute("""
+        CREATE OR REPLACE FUNCTION users_log_token_revocation() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                INSERT INTO token_revocations (user_id, token_version) VALUES (OLD.id, NULL);
+                RETURN OLD;
+            END IF;
+            INSERT INTO token_revocations (user_id, token_version) VALUES (NEW.id, NEW.token_version);
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    # Sin "OF token_version": lo cambia el trigger BEFORE, no el SET del UPDATE
+    op.execute("""
+        CREATE TRIGGER trg_users_log_token_version
+        AFTER UPDATE ON users
+        FOR EACH ROW
+        WHEN (OLD.token_version IS DISTINCT FROM NEW.token_version)
+        EXECUTE FUNCTION users_log_token_revocation()
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_users_log_delete
+        AFTER DELETE ON users
+        FOR EACH ROW
+        EXECUTE FUNCTION users_log_token_revocation()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS trg_users_log_delete ON users")
+    op.execute("DROP TRIGGER IF EXISTS trg_users_log_token_version ON users")
+    op.execute("DROP FUNCTION IF EXISTS users_log_token_revocation()")
+    op.drop_index(op.f('ix_token_revocations_created_at'), table_name='token_revocations')
+    op.drop_table('token_revocations')
@@ -0,0 +1,49 @@
+"""agregar version a teacher_profiles
+
+Revision ID: e11e05163b2e
+Revises: fff7f2ee72ae
+Create Date: 2026-10-18 12:48:27.464469
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e11e05163b2e'
+down_revision: Union[str, Sequence[str], None] = 'fff7f2ee72ae'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'teacher_profiles',
+        sa.Column('version', sa.Integer(), server_default=sa.text('1'), nullable=False),
+    )
+
+    # Toda escritura (ORM, bulk o manual) sube la versión => If-Match / ETag confiables
+    op.execute("""
+        CREATE OR REPLACE FUNCTION teacher_profiles_bump_version() RETURNS trigger AS $$
+        BEGIN
+            NEW.version := OLD.version + 1;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_teacher_profiles_bump_version
+        BEFORE UPDATE ON teacher_profiles
+        FOR EACH ROW
+        EXECUTE FUNCTION teacher_profiles_bump_version()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS trg_teacher_profiles_bump_version ON teacher_profiles")
+    op.execute("DROP FUNCTION IF EXISTS teacher_profiles_bump_version()")
+    op.drop_column('teacher_profiles', 'version')
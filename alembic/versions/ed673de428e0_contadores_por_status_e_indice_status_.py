@@ -0,0 +1,95 @@
+"""contadores por status e indice status id en teacher_profiles
+
+Revision ID: ed673de428e0
+Revises: 835a06b665df
+Create Date: 2026-10-18 12:22:17.071272
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ed673de428e0'
+down_revision: Union[str, Sequence[str], None] = '835a06b665df'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('teacher_profile_status_counts',
+    sa.Column('status', postgresql.ENUM(name='teacher_profile_status', create_type=False), nullable=False),
+    sa.Column('total', sa.BigInteger(), server_default=sa.text('0'), nullable=False),
+    sa.PrimaryKeyConstraint('status')
+    )
+    op.create_index('ix_teacher_profiles_status_id', 'teacher_profiles', ['status', 'id'], unique=False)
+
+    # Triggers por sentencia (transition tables): un UPDATE/COPY masivo ajusta
+    # cada contador una sola vez, no una vez por fila.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION teacher_profile_status_counts_apply() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                INSERT INTO teacher_profile_status_counts AS c (status, total)
+                SELECT status, count(*) FROM new_rows GROUP BY status
+                ON CONFLICT (status) DO UPDATE SET total = c.total + EXCLUDED.total;
+            ELSIF TG_OP = 'DELETE' THEN
+                UPDATE teacher_profile_status_counts AS c SET total = c.total - d.n
+                FROM (SELECT status, count(*) AS n FROM old_rows GROUP BY status) AS d
+                WHERE c.status = d.status;
+            ELSE
+                INSERT INTO teacher_profile_status_counts AS c (status, total)
+                SELECT status, sum(delta) FROM (
+                    SELECT status, 1 AS delta FROM new_rows
+                    UNION ALL
+                    SELECT status, -1 AS delta FROM old_rows
+                ) AS d
+                GROUP BY status
+                HAVING sum(delta) <> 0
+                ON CONFLICT (status) DO UPDATE SET total = c.total + EXCLUDED.total;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_teacher_profile_status_counts_insert
+        AFTER INSERT ON teacher_profiles
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION teacher_profile_status_counts_apply()
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_teacher_profile_status_counts_update
+        AFTER UPDATE ON teacher_profiles
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION teacher_profile_status_counts_apply()
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_teacher_profile_status_counts_delete
+        AFTER DELETE ON teacher_profiles
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION teacher_profile_status_counts_apply()
+    """)
+
+    # Estado inicial (todas las claves del enum, aunque estén en 0)
+    op.execute("""
+        INSERT INTO teacher_profile_status_counts (status, total)
+        SELECT s.status, count(p.id)
+        FROM unnest(enum_range(NULL::teacher_profile_status)) AS s(status)
+        LEFT JOIN teacher_profiles AS p ON p.status = s.status
+        GROUP BY s.status
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS trg_teacher_profile_status_counts_delete ON teacher_profiles")
+    op.execute("DROP TRIGGER IF EXISTS trg_teacher_profile_status_counts_update ON teacher_profiles")
+    op.execute("DROP TRIGGER IF EXISTS trg_teacher_profile_status_counts_insert ON teacher_profiles")
+    op.execute("DROP FUNCTION IF EXISTS teacher_profile_status_counts_apply()")
+    op.drop_index('ix_teacher_profiles_status_id', table_name='teacher_profiles')
+    op.drop_table('teacher_profile_status_counts')
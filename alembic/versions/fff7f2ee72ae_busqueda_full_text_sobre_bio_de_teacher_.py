@@ -0,0 +1,44 @@
+"""busqueda full text sobre bio de teacher_profiles
+
+Revision ID: fff7f2ee72ae
+Revises: 272c18f37a0d
+Create Date: 2026-10-18 12:26:28.250082
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fff7f2ee72ae'
+down_revision: Union[str, Sequence[str], None] = '272c18f37a0d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Columna generada (Postgres la mantiene): stems en español + inglés
+    op.add_column(
+        'teacher_profiles',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "to_tsvector('spanish'::regconfig, coalesce(bio, '')) || "
+                "to_tsvector('english'::regconfig, coalesce(bio, ''))",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index('ix_teacher_profiles_search_vector', 'teacher_profiles', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_teacher_profiles_search_vector', table_name='teacher_profiles', postgresql_using='gin')
+    op.drop_column('teacher_profiles', 'search_vector')
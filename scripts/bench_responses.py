@@ -0,0 +1,126 @@
+"""
+Costo por request de serializar listados (200 items por defecto): camino
+"validado" (modelo + revalidación de FastAPI contra response_model) vs camino
+rápido (model_response / ORJSONResponse desde filas confiables).
+
+No usa la DB: monta una app mínima con los schemas reales y datos sintéticos,
+así la diferencia medida es solo construcción + validación + serialización.
+
+Uso:
+    python scripts/bench_responses.py
+    python scripts/bench_responses.py --items 200 --requests 3000
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Permite ejecutar el script desde /backend sin instalar el paquete
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.core.enums import TeacherProfileStatus  # noqa: E402
+from app.core.responses import ORJSONResponse, model_response  # noqa: E402
+from app.modules.teacher.catalog import CatalogEntry  # noqa: E402
+from app.modules.teacher.schemas import (  # noqa: E402
+    PublicTeacherItem,
+    PublicTeachersResponse,
+    TeacherProfileListResponse,
+    TeacherProfilePublic,
+)
+
+
+def _build_app(items: int) -> FastAPI:
+    now = datetime.now(timezone.utc)
+    bio = "Profesora de español con experiencia en conversación y gramática. " * 5
+    entries = [
+        CatalogEntry(
+            id=i,
+            bio=bio,
+            languages=("es", "en"),
+            photo_url=None,
+            created_at=now - timedelta(minutes=i),
+            updated_at=now,
+        )
+        for i in range(items)
+    ]
+    # Lo que devuelve TeacherService (snapshots cacheados)
+    profiles = [
+        TeacherProfilePublic(
+            id=e.id,
+            user_id=e.id,
+            bio=e.bio,
+            languages=list(e.languages),
+            photo_url=e.photo_url,
+            status=TeacherProfileStatus.APPROVED,
+            created_at=e.created_at,
+            updated_at=e.updated_at,
+            version=1,
+        )
+        for e in entries
+    ]
+
+    app = FastAPI()
+
+    @app.get("/admin/validated", response_model=TeacherProfileListResponse)
+    def admin_validated():
+        return TeacherProfileListResponse(items=profiles, total=items, limit=items, offset=0)
+
+    @app.get("/admin/fast", response_model=TeacherProfileListResponse)
+    def admin_fast():
+        return model_response(TeacherProfileListResponse(items=profiles, total=items, limit=items, offset=0))
+
+    @app.get("/public/validated", response_model=PublicTeachersResponse)
+    def public_validated():
+        return PublicTeachersResponse(items=[PublicTeacherItem.from_profile(e) for e in entries])
+
+    @app.get("/public/fast", response_model=PublicTeachersResponse)
+    def public_fast():
+        return ORJSONResponse({"items": [PublicTeacherItem.payload(e) for e in entries], "next_cursor": None})
+
+    return app
+
+
+def _measure(client: TestClient, path: str, requests: int) -> list[float]:
+    for _ in range(min(100, requests)):  # warmup
+        client.get(path)
+    timings = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        resp = client.get(path)
+        timings.append((time.perf_counter() - started) * 1e6)
+        assert resp.status_code == 200
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    client = TestClient(_build_app(args.items))
+    for endpoint in ("admin", "public"):
+        validated, fast = f"/{endpoint}/validated", f"/{endpoint}/fast"
+        # Mismo JSON por los dos caminos
+        assert client.get(validated).json() == client.get(fast).json()
+
+        results = {path: _measure(client, path, args.requests) for path in (validated, fast)}
+        for path, timings in results.items():
+            print(
+                f"{path:<20} p50={statistics.median(timings):8.0f}µs "
+                f"p95={statistics.quantiles(timings, n=20)[-1]:8.0f}µs "
+                f"mean={statistics.fmean(timings):8.0f}µs"
+            )
+        saved = statistics.median(results[validated]) - statistics.median(results[fast])
+        print(f"{'ahorro p50':<20} {saved:8.0f}µs por request ({args.items} items)\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Calibra los parámetros argon2 para el host actual.
+
+Mide el tiempo real de hash y elige el mayor `time_cost` que cabe en la
+latencia objetivo sin superar el presupuesto de memoria por hash. Si ni
+siquiera time_cost=1 entra en el objetivo, reduce la memoria a la mitad.
+
+Uso:
+    python scripts/calibrate_argon2.py --target-ms 250 --max-memory-mib 64
+
+Imprime las variables ARGON2_* para copiar al `.env`. Los usuarios con
+hashes antiguos se re-hashean en su siguiente login.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import time
+
+from argon2 import PasswordHasher
+
+MIN_MEMORY_KIB = 8 * 1024
+MAX_TIME_COST = 16
+SAMPLE_PASSWORD = "Calibrate123*"
+
+
+def _measure_ms(*, time_cost: int, memory_cost: int, parallelism: int, samples: int) -> float:
+    hasher = PasswordHasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+    hasher.hash(SAMPLE_PASSWORD)  # warm-up (reserva de memoria)
+
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        hasher.hash(SAMPLE_PASSWORD)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate(*, target_ms: float, max_memory_kib: int, parallelism: int, samples: int) -> dict:
+    memory_cost = max_memory_kib
+
+    while True:
+        elapsed = _measure_ms(time_cost=1, memory_cost=memory_cost, parallelism=parallelism, samples=samples)
+        print(f"  m={memory_cost // 1024}MiB t=1 -> {elapsed:.1f}ms")
+
+        if elapsed <= target_ms or memory_cost // 2 < MIN_MEMORY_KIB:
+            break
+        memory_cost //= 2
+
+    time_cost = 1
+    while time_cost < MAX_TIME_COST:
+        candidate = _measure_ms(
+            time_cost=time_cost + 1,
+            memory_cost=memory_cost,
+            parallelism=parallelism,
+            samples=samples,
+        )
+        print(f"  m={memory_cost // 1024}MiB t={time_cost + 1} -> {candidate:.1f}ms")
+        if candidate > target_ms:
+            break
+        time_cost += 1
+        elapsed = candidate
+
+    return {
+        "time_cost": time_cost,
+        "memory_cost": memory_cost,
+        "parallelism": parallelism,
+        "elapsed_ms": elapsed,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Calibra parámetros argon2 para este host")
+    parser.add_argument("--target-ms", type=float, default=250.0, help="Latencia objetivo por hash (ms)")
+    parser.add_argument("--max-memory-mib", type=int, default=64, help="Memoria máxima por hash (MiB)")
+    parser.add_argument(
+        "--parallelism",
+        type=int,
+        default=min(4, os.cpu_count() or 1),
+        help="Lanes argon2 por hash",
+    )
+    parser.add_argument("--samples", type=int, default=5, help="Mediciones por combinación")
+    args = parser.parse_args()
+
+    print(f"Calibrando argon2 (objetivo {args.target_ms:.0f}ms, máx {args.max_memory_mib}MiB)...")
+    result = calibrate(
+        target_ms=args.target_ms,
+        max_memory_kib=args.max_memory_mib * 1024,
+        parallelism=args.parallelism,
+        samples=args.samples,
+    )
+
+    if result["elapsed_ms"] > args.target_ms:
+        print(f"Aviso: ni con la memoria mínima se alcanza el objetivo ({result['elapsed_ms']:.1f}ms)")
+
+    print()
+    print(f"# ~{result['elapsed_ms']:.0f}ms por hash, {result['memory_cost'] // 1024}MiB por hash en curso")
+    print(f"ARGON2_TIME_COST={result['time_cost']}")
+    print(f"ARGON2_MEMORY_COST={result['memory_cost']}")
+    print(f"ARGON2_PARALLELISM={result['parallelism']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,7 @@ from app.core.database import SessionLocal
 from app.core.security import hash_password
 from app.core.enums import UserRole, UserStatus
 from app.models.user import User
+import app.modules.teacher.models  # noqa: F401  (registra TeacherProfile para el mapper de User)
 
 
 def _get_env(name: str) -> str:
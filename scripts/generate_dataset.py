@@ -0,0 +1,222 @@
+"""
+Genera un dataset sintético grande (users + teacher_profiles) para pruebas de rendimiento.
+
+Uso:
+    python scripts/generate_dataset.py --users 1000000 --seed 42
+    python scripts/generate_dataset.py --users 200000 --teacher-ratio 0.5 \\
+        --profile-status-mix APPROVED=0.6,IN_REVIEW=0.25,DRAFT=0.1,PAUSED=0.05 \\
+        --languages es=0.7,en=0.5,it=0.15,fr=0.1,pt=0.1,de=0.05 --replace
+
+- Determinista: misma semilla + mismos parámetros => mismas filas (emails,
+  estados, idiomas, bios y fechas; `--until` fija el ancla temporal).
+- Carga con COPY por lotes (`--batch-size`), un commit por lote.
+- Emails `synth-<seed>-<n>@<domain>`; `--replace` borra antes los del dominio.
+- Todos comparten un único hash argon2 de `--password` (hashear millones no
+  aporta nada a un benchmark de lecturas).
+- Los ids de users se reservan en bloque avanzando la secuencia.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Permite ejecutar el script desde /backend sin instalar el paquete
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from sqlalchemy import text  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.core.bulk import copy_rows  # noqa: E402
+from app.core.database import SessionLocal  # noqa: E402
+from app.core.enums import TeacherProfileStatus, UserRole, UserStatus  # noqa: E402
+from app.core.security import hash_password  # noqa: E402
+from app.modules.teacher.languages import normalize_language_code  # noqa: E402
+
+USER_COLUMNS = ("id", "email", "password_hash", "role", "status", "created_at")
+PROFILE_COLUMNS = ("user_id", "bio", "languages", "photo_url", "status", "created_at", "updated_at")
+
+WORDS = (
+    "profesor clases idiomas conversación gramática nativo experiencia alumnos "
+    "método práctica online preparación exámenes niveles principiantes avanzados "
+    "cultura viajes negocios pronunciación vocabulario paciencia dinámico años "
+    "enseño certificado universidad literatura escritura lectura escucha fluidez"
+).split()
+
+
+def _parse_mix(value: str, allowed: set[str] | None = None) -> dict[str, float]:
+    """'A=0.5,B=0.3' -> {'A': 0.5, 'B': 0.3}"""
+    mix: dict[str, float] = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if allowed is not None and name not in allowed:
+            raise argparse.ArgumentTypeError(f"Valor desconocido: {name}")
+        mix[name] = float(weight)
+    return mix
+
+
+def _parse_language_mix(value: str) -> dict[str, float]:
+    """Como _parse_mix, con los códigos normalizados igual que la API ('EN', 'es-ES' -> 'en', 'es')."""
+    mix: dict[str, float] = {}
+    for name, weight in _parse_mix(value).items():
+        try:
+            code = normalize_language_code(name)
+        except ValueError as exc:
+            raise argparse.ArgumentTypeError(str(exc)) from None
+        if code in mix:
+            raise argparse.ArgumentTypeError(f"Idioma repetido: {name} ({code})")
+        mix[code] = weight
+    return mix
+
+
+class DatasetGenerator:
+    def __init__(self, args: argparse.Namespace) -> None:
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.password_hash = hash_password(args.password)
+
+        self.user_statuses, self.user_status_weights = zip(*args.user_status_mix.items())
+        self.profile_statuses, self.profile_status_weights = zip(*args.profile_status_mix.items())
+        self.languages = list(args.languages.items())
+
+        self.until = args.until
+        self.span_seconds = args.days * 86400
+
+    def created_at(self) -> datetime:
+        # skew > 1 concentra las altas en fechas recientes
+        return self.until - timedelta(seconds=self.span_seconds * self.rng.random() ** self.args.created_skew)
+
+    def bio(self) -> str:
+        words = max(0, int(self.rng.lognormvariate(self.args.bio_mu, self.args.bio_sigma)))
+        words = min(words, self.args.bio_max_words)
+        return " ".join(self.rng.choices(WORDS, k=words))
+
+    def profile_languages(self) -> list[str]:
+        picked = [code for code, p in self.languages if self.rng.random() < p]
+        return picked or [self.languages[0][0]]
+
+    def batch(self, first_id: int, offset: int, size: int) -> tuple[list[tuple], list[tuple]]:
+        users, profiles = [], []
+        for n in range(offset, offset + size):
+            user_id = first_id + n
+            created_at = self.created_at()
+            is_teacher = self.rng.random() < self.args.teacher_ratio
+            users.append((
+                user_id,
+                f"synth-{self.args.seed}-{n}@{self.args.domain}",
+                self.password_hash,
+                (UserRole.TEACHER if is_teacher else UserRole.STUDENT).value,
+                self.rng.choices(self.user_statuses, self.user_status_weights)[0],
+                created_at,
+            ))
+            if is_teacher:
+                profile_created = created_at + timedelta(seconds=self.rng.randint(0, 7 * 86400))
+                profiles.append((
+                    user_id,
+                    self.bio(),
+                    json.dumps(self.profile_languages()),
+                    f"https://cdn.example.com/photos/{user_id}.jpg" if self.rng.random() < self.args.photo_ratio else None,
+                    self.rng.choices(self.profile_statuses, self.profile_status_weights)[0],
+                    profile_created,
+                    profile_created + timedelta(seconds=self.rng.randint(0, 30 * 86400)),
+                ))
+        return users, profiles
+
+
+def _reserve_user_ids(db: Session, count: int) -> int:
+    """Avanza la secuencia de users.id `count` posiciones y devuelve el primer id del bloque."""
+    first_id = db.execute(text("SELECT nextval(pg_get_serial_sequence('users', 'id'))")).scalar_one()
+    db.execute(
+        text("SELECT setval(pg_get_serial_sequence('users', 'id'), :last_id)"),
+        {"last_id": first_id + count - 1},
+    )
+    db.commit()
+    return first_id
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--teacher-ratio", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--domain", default="synth.parladach.test")
+    parser.add_argument("--password", default="Synthetic123*")
+    parser.add_argument("--batch-size", type=int, default=50_000)
+    parser.add_argument(
+        "--user-status-mix",
+        type=lambda v: _parse_mix(v, {s.value for s in UserStatus}),
+        default="ACTIVE=0.95,INACTIVE=0.03,SUSPENDED=0.015,DELETED=0.005",
+    )
+    parser.add_argument(
+        "--profile-status-mix",
+        type=lambda v: _parse_mix(v, {s.value for s in TeacherProfileStatus}),
+        default="APPROVED=0.55,IN_REVIEW=0.15,DRAFT=0.2,PAUSED=0.1",
+    )
+    parser.add_argument(
+        "--languages",
+        type=_parse_language_mix,
+        default="es=0.7,en=0.55,it=0.15,fr=0.12,pt=0.1,de=0.08",
+        help="probabilidad independiente por idioma (mínimo uno por perfil)",
+    )
+    parser.add_argument("--bio-mu", type=float, default=3.5, help="lognormal de palabras por bio (mediana ~e^mu)")
+    parser.add_argument("--bio-sigma", type=float, default=0.8)
+    parser.add_argument("--bio-max-words", type=int, default=400)
+    parser.add_argument("--photo-ratio", type=float, default=0.6)
+    parser.add_argument("--days", type=int, default=3 * 365, help="ventana de created_at hacia atrás desde --until")
+    parser.add_argument("--created-skew", type=float, default=2.0, help="1 => uniforme; >1 => más altas recientes")
+    parser.add_argument(
+        "--until",
+        type=lambda v: datetime.fromisoformat(v).replace(tzinfo=timezone.utc),
+        default="2026-01-01T00:00:00",
+    )
+    parser.add_argument("--replace", action="store_true", help="borra antes los usuarios del dominio")
+    args = parser.parse_args()
+
+    generator = DatasetGenerator(args)
+    start = time.perf_counter()
+
+    db = SessionLocal()
+    try:
+        if args.replace:
+            deleted = db.execute(
+                text("DELETE FROM users WHERE email LIKE :pattern"),
+                {"pattern": f"%@{args.domain}"},
+            ).rowcount
+            db.commit()
+            print(f"Borrados {deleted} usuarios de {args.domain}", file=sys.stderr)
+
+        first_id = _reserve_user_ids(db, args.users)
+        total_profiles = 0
+        for offset in range(0, args.users, args.batch_size):
+            size = min(args.batch_size, args.users - offset)
+            users, profiles = generator.batch(first_id, offset, size)
+            copy_rows(db, "users", USER_COLUMNS, users)
+            copy_rows(db, "teacher_profiles", PROFILE_COLUMNS, profiles)
+            db.commit()
+
+            total_profiles += len(profiles)
+            elapsed = time.perf_counter() - start
+            done = offset + size
+            print(f"users={done}/{args.users} profiles={total_profiles} ({done / elapsed:,.0f} users/s)", file=sys.stderr)
+
+        # Estadísticas frescas para que el planner vea el volumen real
+        db.execute(text("ANALYZE users"))
+        db.execute(text("ANALYZE teacher_profiles"))
+        db.commit()
+    finally:
+        db.close()
+
+    print(
+        f"Dataset generado en {time.perf_counter() - start:.1f}s: "
+        f"{args.users} usuarios, {total_profiles} perfiles (seed={args.seed}).",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Genera una clave privada PEM para firmar access tokens (rotación de claves).
+
+Uso:
+    python scripts/generate_jwt_key.py --alg EdDSA --out keys/jwt-2026-10.pem
+
+Rotación: anteponer el nuevo PEM en JWT_PRIVATE_KEY_FILES y mantener el
+anterior en la lista hasta que expiren los tokens que firmó.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+
+
+def _generate(alg: str):
+    if alg == "EdDSA":
+        return ed25519.Ed25519PrivateKey.generate()
+    if alg == "ES256":
+        return ec.generate_private_key(ec.SECP256R1())
+    return rsa.generate_private_key(public_exponent=65537, key_size=3072)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Genera una clave de firma JWT")
+    parser.add_argument("--alg", choices=["EdDSA", "ES256", "RS256"], default="EdDSA")
+    parser.add_argument("--out", required=True, help="Ruta del PEM privado a crear")
+    args = parser.parse_args()
+
+    out = Path(args.out)
+    if out.exists():
+        raise SystemExit(f"Ya existe: {out}")
+
+    pem = _generate(args.alg).private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+
+    out.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(out, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "wb") as fh:
+        fh.write(pem)
+
+    print(f"Clave {args.alg} creada: {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Import masivo de usuarios desde CSV (con cabecera) o NDJSON.
+
+Columnas / claves: email, password, role (STUDENT | TEACHER), status (opcional, ACTIVE).
+
+Uso:
+    python scripts/import_users.py alumnos.csv
+    python scripts/import_users.py alumnos.ndjson --errors errores.ndjson --workers 8
+    cat alumnos.csv | python scripts/import_users.py - --format csv
+
+El progreso se imprime por stderr tras cada chunk. Los errores por fila se
+escriben como NDJSON en --errors (o en stdout si no se indica).
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import sys
+from pathlib import Path
+
+# Permite ejecutar el script desde /backend sin instalar el paquete
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from app.config.settings import settings  # noqa: E402
+from app.core.database import SessionLocal  # noqa: E402
+import app.modules.teacher.models  # noqa: E402,F401  (registra TeacherProfile para el mapper de User)
+from app.modules.users.importer import READERS, UserImporter  # noqa: E402
+from app.modules.users.schemas import ImportReport, ImportRowError  # noqa: E402
+
+
+def _print_progress(report: ImportReport) -> None:
+    print(
+        f"procesadas={report.processed} creadas={report.created} "
+        f"existentes={report.skipped_existing} duplicadas={report.skipped_duplicate} "
+        f"fallidas={report.failed}",
+        file=sys.stderr,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", help="archivo CSV/NDJSON, o '-' para stdin")
+    parser.add_argument("--format", choices=sorted(READERS), help="por defecto, según la extensión")
+    parser.add_argument("--chunk-size", type=int, default=settings.USER_IMPORT_CHUNK_SIZE)
+    parser.add_argument("--workers", type=int, default=settings.USER_IMPORT_HASH_WORKERS,
+                        help="procesos de hashing (por defecto uno por core; 0 => inline)")
+    parser.add_argument("--errors", help="archivo NDJSON para los errores por fila (por defecto stdout)")
+    args = parser.parse_args()
+
+    fmt = args.format
+    if fmt is None:
+        suffix = Path(args.path).suffix.lower()
+        fmt = "csv" if suffix == ".csv" else "ndjson" if suffix in {".ndjson", ".jsonl"} else None
+    if fmt is None:
+        parser.error("No se puede deducir el formato: usa --format")
+
+    errors_out = open(args.errors, "w", encoding="utf-8") if args.errors else sys.stdout
+    source = (
+        io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8-sig", newline="")
+        if args.path == "-"
+        else open(args.path, encoding="utf-8-sig", newline="")
+    )
+
+    def _write_error(error: ImportRowError) -> None:
+        errors_out.write(json.dumps(error.model_dump(), ensure_ascii=False) + "\n")
+
+    importer = UserImporter(
+        chunk_size=args.chunk_size,
+        hash_workers=args.workers,
+        max_errors=0,  # se emiten en streaming, no se acumulan
+        progress=_print_progress,
+        on_error=_write_error,
+    )
+
+    db = SessionLocal()
+    try:
+        with source:
+            report = importer.run(db, READERS[fmt](source))
+    finally:
+        db.close()
+        if errors_out is not sys.stdout:
+            errors_out.close()
+
+    print(
+        f"Import completado. Usuarios creados: {report.created}, "
+        f"existentes: {report.skipped_existing}, duplicados: {report.skipped_duplicate}, "
+        f"con error: {report.failed}.",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Borra los refresh tokens de sesiones terminadas (session_expires_at vencido)
+y las revocaciones de JWT más viejas que la vida de un access token.
+
+Pensado para un cron diario; el login ya limpia las sesiones del propio
+usuario, esto cubre a quienes no vuelven a entrar.
+
+Uso:
+    python scripts/purge_refresh_tokens.py --batch-size 10000
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+# Permite ejecutar el script desde /backend sin instalar el paquete
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from app.core.database import SessionLocal
+from app.modules.auth.service import AuthService
+from app.modules.auth.token_versions import purge_token_revocations
+import app.modules.teacher.models  # noqa: F401  (registra TeacherProfile para el mapper de User)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        purged = AuthService().purge_expired_refresh_tokens(db, batch_size=args.batch_size)
+        revocations = purge_token_revocations(db)
+    print(f"Refresh tokens purgados: {purged}")
+    print(f"Revocaciones purgadas: {revocations}")
+
+
+if __name__ == "__main__":
+    main()
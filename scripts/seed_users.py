@@ -10,6 +10,7 @@ from app.core.database import SessionLocal  # noqa: E402
 from app.core.enums import UserRole, UserStatus  # noqa: E402
 from app.core.security import hash_password  # noqa: E402
 from app.models.user import User  # noqa: E402
+import app.modules.teacher.models  # noqa: E402,F401  (registra TeacherProfile para el mapper de User)
 
 
 SEED_USERS = [
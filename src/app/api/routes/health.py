@@ -1,9 +1,44 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from app.config.settings import settings
+from app.core.hashing import password_hashing_pool
+from app.modules.auth.dependencies import require_roles
+from app.modules.auth.principal import principal_cache
+from app.modules.auth.security import verified_token_cache
+from app.modules.teacher import cache as teacher_cache
+from app.modules.teacher.catalog import catalog_index
+from app.modules.teacher.photos import thumbnail_pool
+from app.modules.teacher.snapshot import catalog_snapshot
 
 router = APIRouter(tags=["health"])
 
+# Métricas internas (pools, caches): solo ADMIN. /health queda público (liveness)
+_admin_only = [Depends(require_roles("ADMIN"))]
+
 
 @router.get("/health")
 def health_check() -> dict:
     return {"status": "ok", "env": settings.app_env}
+
+
+@router.get("/health/hashing", dependencies=_admin_only)
+def hashing_health() -> dict:
+    # Profundidad de cola y latencia del pool argon2
+    return password_hashing_pool.stats()
+
+
+@router.get("/health/photos", dependencies=_admin_only)
+def photos_health() -> dict:
+    # Trabajos en curso / rechazados del pool de miniaturas
+    return thumbnail_pool.stats()
+
+
+@router.get("/health/caches", dependencies=_admin_only)
+def caches_health() -> dict:
+    # Hit ratio de los caches en memoria de este worker
+    return {
+        "principal": principal_cache.stats(),
+        "verified_jwt": verified_token_cache.stats(),
+        "teacher_catalog": catalog_index.stats(),
+        "teacher_catalog_snapshot": catalog_snapshot.stats(),
+        "teacher": teacher_cache.stats(),
+    }
@@ -0,0 +1,30 @@
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import FileResponse
+
+from app.modules.teacher import photos
+
+router = APIRouter(tags=["media"])
+
+
+@router.get("/media/photos/{photo_hash}/{name}", operation_id="media_get_photo")
+def get_photo(photo_hash: str, name: str) -> FileResponse:
+    """
+    Miniaturas del storage local (con object store las sirve el bucket / CDN).
+    El original no se expone. La key es el hash del contenido => el ETag es
+    la key y el cache, inmutable.
+    """
+    storage = photos.photo_storage
+    key = f"{photo_hash}/{name}"
+    if (
+        not isinstance(storage, photos.LocalPhotoStorage)
+        or not name.endswith(".jpg")
+        or not photos.is_valid_key(key)
+        or not storage.exists(key)
+    ):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Foto no encontrada")
+
+    return FileResponse(
+        storage.path(key),
+        media_type="image/jpeg",
+        headers={"Cache-Control": photos.IMMUTABLE_CACHE_CONTROL, "ETag": f'"{key}"'},
+    )
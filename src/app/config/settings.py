@@ -8,7 +8,101 @@ class Settings(BaseSettings):
     database_url: str = Field(..., alias="DATABASE_URL")
     SECRET_KEY: str = Field(...)
     ACCESS_TOKEN_EXPIRES_MINUTES: int = Field(default=60)
+    # Refresh tokens rotativos: inactividad máxima y duración absoluta de sesión
+    REFRESH_TOKEN_EXPIRES_DAYS: int = Field(default=14, ge=1)
+    REFRESH_TOKEN_MAX_SESSION_DAYS: int = Field(default=60, ge=1)
     JWT_ALGORITHM: str = Field(default="HS256")
+    # Firma asimétrica (RS256/ES256/EdDSA): PEMs privados, el primero firma y el
+    # resto siguen verificando (rotación). Públicos sueltos: solo verificación.
+    # Sin claves => HS256 con SECRET_KEY.
+    JWT_PRIVATE_KEY_FILES: list[str] = Field(default_factory=list)
+    JWT_PUBLIC_KEY_FILES: list[str] = Field(default_factory=list)
+    JWKS_MAX_AGE_SECONDS: int = Field(default=300, ge=0)
+    # Cache de JWT verificados (digest del token -> payload, hasta su exp). 0 => off
+    JWT_CACHE_MAX_ENTRIES: int = Field(default=10_000, ge=0)
+
+    # Parámetros argon2 (calibrar por host con scripts/calibrate_argon2.py).
+    # Los hashes con parámetros antiguos se re-hashean en el siguiente login.
+    ARGON2_TIME_COST: int = Field(default=3, ge=1)
+    ARGON2_MEMORY_COST: int = Field(default=65536, ge=8)  # KiB
+    ARGON2_PARALLELISM: int = Field(default=4, ge=1)
+
+    # Throttling de /auth/login (fallos por email y por IP, ventana deslizante).
+    # Sin URL => contadores en memoria del worker; "redis://..." => compartidos.
+    LOGIN_THROTTLE_ENABLED: bool = Field(default=True)
+    LOGIN_THROTTLE_EMAIL_MAX_FAILURES: int = Field(default=10, ge=1)
+    LOGIN_THROTTLE_EMAIL_WINDOW_SECONDS: int = Field(default=300, ge=1)
+    LOGIN_THROTTLE_IP_MAX_FAILURES: int = Field(default=100, ge=1)
+    LOGIN_THROTTLE_IP_WINDOW_SECONDS: int = Field(default=60, ge=1)
+    LOGIN_THROTTLE_BACKEND_URL: str | None = Field(default=None)
+    # Detrás de un reverse proxy: IPs/CIDRs de los proxies propios. Solo si el
+    # peer TCP es uno de ellos se toma el cliente de X-Forwarded-For (el último
+    # salto no confiable). Vacío => siempre la IP del peer TCP.
+    TRUSTED_PROXIES: list[str] = Field(default_factory=list)
+
+    # Cache de principal (id/role/status) para get_current_user.
+    # Se invalida al commitear cambios de role/status en este proceso; el TTL
+    # acota la desactualización entre workers. TTL 0 => deshabilitado.
+    PRINCIPAL_CACHE_TTL_SECONDS: int = Field(default=30, ge=0)
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = Field(default=10_000, ge=0)
+
+    # Modo claims-only: autoriza con role/status/ver del JWT, sin SELECT a users.
+    # Los tokens revocados (token_version incrementado o usuario borrado) se
+    # rechazan tras, como mucho, TOKEN_VERSION_REFRESH_SECONDS en otros workers;
+    # cada recarga lee solo las revocaciones recientes (tabla token_revocations).
+    AUTH_CLAIMS_ONLY: bool = Field(default=False)
+    TOKEN_VERSION_REFRESH_SECONDS: int = Field(default=15, ge=1)
+
+    # Hashing de contraseñas (argon2) en pool de procesos dedicado.
+    # None => un proceso por core disponible; 0 => hashing inline (scripts/debug).
+    PASSWORD_HASH_WORKERS: int | None = Field(default=None, ge=0)
+    PASSWORD_HASH_MAX_QUEUE: int = Field(default=32, ge=0)
+    PASSWORD_HASH_RETRY_AFTER_SECONDS: int = Field(default=1, ge=1)
+
+    # Import masivo de usuarios (scripts/import_users.py y POST /admin/users/import).
+    # Pool de hashing propio, separado del de logins; 0 => inline.
+    # API: uno compartido, None => mitad de los cores; un import a la vez.
+    # Script: None => un proceso por core (--workers).
+    USER_IMPORT_CHUNK_SIZE: int = Field(default=1000, ge=1)
+    USER_IMPORT_HASH_WORKERS: int | None = Field(default=None, ge=0)
+    USER_IMPORT_MAX_BYTES: int = Field(default=50 * 1024 * 1024, ge=1)
+    USER_IMPORT_MAX_ERRORS: int = Field(default=1000, ge=0)
+
+    # Catálogo público en memoria (perfiles APPROVED): /public/teachers y facets.
+    # Los commits de este worker se aplican como deltas; la recarga completa
+    # periódica recoge los cambios de otros workers.
+    CATALOG_INDEX_ENABLED: bool = Field(default=True)
+    CATALOG_REFRESH_SECONDS: int = Field(default=60, ge=1)
+
+    # Snapshot de las primeras páginas de /public/teachers ya serializadas
+    # (JSON + gzip/br) en un archivo que todos los workers leen vía mmap.
+    # Mismo path para todos los workers del host (idealmente tmpfs, p.ej.
+    # /dev/shm/parladach-catalog.bin). None => deshabilitado.
+    CATALOG_SNAPSHOT_PATH: str | None = Field(default=None)
+    CATALOG_SNAPSHOT_PAGES: int = Field(default=5, ge=1)
+    CATALOG_SNAPSHOT_PAGE_SIZE: int = Field(default=50, ge=1, le=200)
+    CATALOG_SNAPSHOT_MAX_AGE_SECONDS: int = Field(default=60, ge=1)
+
+    # Fotos de perfil (POST /teacher/me/profile/photo): original + miniaturas
+    # cuadradas guardadas por hash de contenido (URLs inmutables).
+    # Sin URL => archivos en PHOTO_STORAGE_DIR servidos por /media/photos;
+    # "s3://bucket/prefijo" => object store (requiere boto3) y
+    # PHOTO_PUBLIC_BASE_URL apunta al bucket / CDN.
+    PHOTO_STORAGE_DIR: str = Field(default="media/photos")
+    PHOTO_STORAGE_BACKEND_URL: str | None = Field(default=None)
+    PHOTO_PUBLIC_BASE_URL: str = Field(default="/media/photos")
+    PHOTO_MAX_BYTES: int = Field(default=10 * 1024 * 1024, ge=1)
+    # Lados en px; la menor se usa en los listados, la mayor en el perfil
+    PHOTO_THUMBNAIL_SIZES: list[int] = Field(default_factory=lambda: [160, 480])
+    # Miniaturas (Pillow) en pool de procesos propio, chico (0 => inline)
+    PHOTO_WORKERS: int = Field(default=1, ge=0)
+    PHOTO_MAX_QUEUE: int = Field(default=4, ge=0)
+
+    # Cache de lecturas de TeacherService (listados público/admin).
+    # Los commits de este worker invalidan solo las entradas afectadas; el TTL
+    # acota la desactualización entre workers. TTL 0 => deshabilitado.
+    TEACHER_CACHE_TTL_SECONDS: int = Field(default=30, ge=0)
+    TEACHER_CACHE_MAX_ENTRIES: int = Field(default=2048, ge=0)
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from typing import Any, Iterable, Sequence
+
+from psycopg import sql
+from sqlalchemy.orm import Session
+
+
+def copy_rows(db: Session, table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> int:
+    """
+    Carga filas con `COPY ... FROM STDIN` (psycopg 3) dentro de la transacción
+    actual de la sesión. Órdenes de magnitud más rápido que INSERTs fila a fila.
+    Devuelve cuántas filas se escribieron.
+    """
+    raw = db.connection().connection.driver_connection
+    statement = sql.SQL("COPY {} ({}) FROM STDIN").format(
+        sql.Identifier(table),
+        sql.SQL(", ").join(sql.Identifier(c) for c in columns),
+    )
+
+    written = 0
+    with raw.cursor() as cur:
+        with cur.copy(statement) as copy:
+            for row in rows:
+                copy.write_row(row)
+                written += 1
+    return written
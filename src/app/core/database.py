@@ -16,10 +16,14 @@ engine = create_engine(
 
 
 # Session factory (SQLAlchemy 2.0 style)
+# expire_on_commit=False: la sesión vive una request; los valores generados por
+# la DB ya llegan por RETURNING (eager_defaults), así que releerlos tras el
+# commit sería un SELECT de más (db.refresh / lazy load por atributo).
 SessionLocal = sessionmaker(
     bind=engine,
     autoflush=False,
     autocommit=False,
+    expire_on_commit=False,
 )
 
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from fastapi import Request
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 from starlette.status import (
     HTTP_400_BAD_REQUEST,
@@ -8,28 +9,66 @@ from starlette.status import (
     HTTP_422_UNPROCESSABLE_CONTENT,
     HTTP_500_INTERNAL_SERVER_ERROR,
     HTTP_409_CONFLICT,
+    HTTP_412_PRECONDITION_FAILED,
+    HTTP_429_TOO_MANY_REQUESTS,
+    HTTP_503_SERVICE_UNAVAILABLE,
 )
+from sqlalchemy.exc import IntegrityError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
+# SQLSTATE de Postgres
+_UNIQUE_VIOLATION = "23505"
+
 
 class AppError(Exception):
     """Excepción base del dominio/aplicación."""
     status_code: int = HTTP_400_BAD_REQUEST
 
-    def __init__(self, message: str, *, status_code: int | None = None) -> None:
+    def __init__(
+        self,
+        message: str,
+        *,
+        status_code: int | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> None:
         super().__init__(message)
         if status_code is not None:
             self.status_code = status_code
+        self.headers = headers
 
 
 class ConflictError(AppError):
     status_code = HTTP_409_CONFLICT
 
 
+class PreconditionFailedError(AppError):
+    """If-Match no coincide con la versión actual del recurso."""
+    status_code = HTTP_412_PRECONDITION_FAILED
+
+
+class TooManyRequestsError(AppError):
+    """Límite de intentos superado: el cliente debe esperar `retry_after` segundos."""
+    status_code = HTTP_429_TOO_MANY_REQUESTS
+
+    def __init__(self, message: str, *, retry_after: int) -> None:
+        super().__init__(message, headers={"Retry-After": str(retry_after)})
+        self.retry_after = retry_after
+
+
+class ServiceUnavailableError(AppError):
+    """Sobrecarga temporal: el cliente debe reintentar tras `retry_after` segundos."""
+    status_code = HTTP_503_SERVICE_UNAVAILABLE
+
+    def __init__(self, message: str, *, retry_after: int) -> None:
+        super().__init__(message, headers={"Retry-After": str(retry_after)})
+        self.retry_after = retry_after
+
+
 async def app_error_handler(_: Request, exc: AppError) -> JSONResponse:
     return JSONResponse(
         status_code=exc.status_code,
         content={"error": {"type": exc.__class__.__name__, "message": str(exc)}},
+        headers=exc.headers,
     )
 
 
@@ -44,10 +83,19 @@ async def validation_error_handler(_: Request, exc) -> JSONResponse:
     # FastAPI / Pydantic validation errors
     return JSONResponse(
         status_code=HTTP_422_UNPROCESSABLE_CONTENT,
-        content={"error": {"type": "ValidationError", "message": "Datos inválidos", "details": exc.errors()}},
+        # jsonable_encoder: los validadores propios dejan el ValueError original en `ctx`
+        content={"error": {"type": "ValidationError", "message": "Datos inválidos", "details": jsonable_encoder(exc.errors())}},
     )
 
 
+async def integrity_error_handler(request: Request, exc: IntegrityError) -> JSONResponse:
+    # Respaldo para escrituras sin ON CONFLICT: un índice único violado por
+    # requests concurrentes es un conflicto (409), no un error interno
+    if getattr(exc.orig, "sqlstate", None) == _UNIQUE_VIOLATION:
+        return await app_error_handler(request, ConflictError("El recurso ya existe"))
+    return await internal_error_handler(request, exc)
+
+
 async def internal_error_handler(_: Request, __) -> JSONResponse:
     return JSONResponse(
         status_code=HTTP_500_INTERNAL_SERVER_ERROR,
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from app.config.settings import settings
+from app.core.process_pool import BoundedProcessPool, available_cpus
+from app.core.security import hash_password, verify_and_update_password, verify_password
+
+__all__ = ["PasswordHashingPool", "available_cpus", "password_hashing_pool"]
+
+
+class PasswordHashingPool(BoundedProcessPool):
+    """
+    argon2 fuera del threadpool de la API (ver BoundedProcessPool).
+
+    Las rutas siguen siendo sync: el hilo que espera el resultado queda
+    bloqueado, pero como mucho `max_blocking` hilos a la vez, así que argon2
+    no puede acaparar los slots del threadpool (ni la RSS del proceso).
+    """
+
+    def __init__(self, *, workers: int, max_queue: int, retry_after: int = 1, **kwargs) -> None:
+        super().__init__(name="argon2", workers=workers, max_queue=max_queue, retry_after=retry_after, **kwargs)
+
+    def hash(self, password: str) -> str:
+        return self.run(hash_password, password)
+
+    def verify(self, password: str, password_hash: str) -> bool:
+        return self.run(verify_password, password, password_hash)
+
+    def verify_and_update(self, password: str, password_hash: str) -> tuple[bool, str | None]:
+        return self.run(verify_and_update_password, password, password_hash)
+
+
+password_hashing_pool = PasswordHashingPool(
+    workers=(
+        settings.PASSWORD_HASH_WORKERS
+        if settings.PASSWORD_HASH_WORKERS is not None
+        else available_cpus()
+    ),
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+    retry_after=settings.PASSWORD_HASH_RETRY_AFTER_SECONDS,
+)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any
+
+from fastapi import Request, Response
+
+
+def make_etag(*parts: Any) -> str:
+    """ETag fuerte a partir de los datos que determinan la representación (ids, updated_at...)."""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def version_etag(version: int) -> str:
+    """ETag de un recurso con columna version: If-Match se resuelve sin hash ni query extra."""
+    return f'"v{version}"'
+
+
+def if_match_versions(request: Request) -> set[int] | None:
+    """
+    Versiones aceptadas por If-Match (ETags de version_etag).
+    None => sin precondición (header ausente o "*"); set vacío => nada puede coincidir.
+    """
+    if_match = request.headers.get("if-match")
+    if if_match is None or if_match.strip() == "*":
+        return None
+    versions: set[int] = set()
+    for tag in if_match.split(","):
+        tag = tag.strip()
+        # If-Match usa comparación fuerte: un ETag débil (W/) nunca coincide
+        if tag.startswith('"v') and tag.endswith('"') and tag[2:-1].isdigit():
+            versions.add(int(tag[2:-1]))
+    return versions
+
+
+def cache_headers(
+    *,
+    etag: str,
+    last_modified: datetime | None = None,
+    cache_control: str = "no-cache",
+) -> dict[str, str]:
+    # no-cache: el cliente puede guardar la respuesta pero revalida siempre (=> 304)
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified.astimezone(timezone.utc), usegmt=True)
+    return headers
+
+
+def is_not_modified(request: Request, *, etag: str, last_modified: datetime | None = None) -> bool:
+    """
+    Precondiciones de un GET condicional (RFC 9110 §13.2.2):
+    If-None-Match manda; If-Modified-Since solo se evalúa si no viene If-None-Match.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        # Comparación débil: W/"x" equivale a "x"
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return etag.removeprefix("W/") in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    # HTTP-date tiene resolución de segundos
+    return last_modified.replace(microsecond=0) <= since
+
+
+def not_modified(headers: dict[str, str]) -> Response:
+    return Response(status_code=304, headers=headers)
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Select
+from sqlalchemy.orm import Session
+
+from app.core.errors import AppError
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Cursor opaco para keyset pagination: la clave de orden de la última fila
+    entregada (p.ej. created_at, id) en JSON compacto + base64 url-safe.
+    """
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(token: str, *types: type) -> tuple:
+    """
+    Inverso de encode_cursor; `types` indica el tipo de cada valor (datetime, int, float, str).
+    Cualquier cursor manipulado o de otra forma => 400.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw)
+        if not isinstance(payload, list) or len(payload) != len(types):
+            raise ValueError("aridad")
+        return tuple(_parse(value, type_) for value, type_ in zip(payload, types))
+    except (binascii.Error, ValueError, TypeError):
+        raise AppError("Cursor inválido") from None
+
+
+def _parse(value: Any, type_: type) -> Any:
+    if type_ is datetime:
+        if not isinstance(value, str):
+            raise TypeError("datetime")
+        parsed = datetime.fromisoformat(value)
+        # Los cursores propios siempre llevan zona (timestamptz); naive => manipulado
+        if parsed.tzinfo is None:
+            raise ValueError("datetime sin zona horaria")
+        return parsed
+    if type_ is float and isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if type(value) is not type_:
+        raise TypeError(type_.__name__)
+    return value
+
+
+def estimate_count(db: Session, stmt: Select) -> int:
+    """
+    Total aproximado según el planner (EXPLAIN, sin ejecutar la query).
+    Para listados donde un COUNT(*) exacto recorrería demasiadas filas.
+    Los parámetros se compilan como literales (literal_binds): strings y
+    valores de usuario ya validados (p.ej. códigos de idioma) se escapan
+    como literales de texto; tipos sin renderer de literal (JSONB, arrays)
+    deben llegar como cast(literal(texto), tipo).
+    """
+    compiled = stmt.compile(dialect=db.get_bind().dialect, compile_kwargs={"literal_binds": True})
+    plan = db.connection().exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}").scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
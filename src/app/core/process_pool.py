@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Iterable
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.errors import ServiceUnavailableError
+
+logger = logging.getLogger("app.process_pool")
+
+# Hilos que un pool puede dejar bloqueados en rutas sync. Por debajo del
+# threadpool de anyio (40 por defecto; main.py lo ajusta al límite real)
+DEFAULT_MAX_BLOCKING = 16
+
+
+def available_cpus() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover (Windows / macOS)
+        return os.cpu_count() or 1
+
+
+class BoundedProcessPool:
+    """
+    Trabajo CPU-bound (argon2, Pillow) fuera del proceso de la API:
+    - pool de procesos `spawn` de `workers` procesos (0 => inline en el hilo actual)
+    - como mucho `workers + max_queue` trabajos a la vez; el resto => 503 + Retry-After
+    - `run` (rutas sync) bloquea un hilo del threadpool mientras espera: esos
+      trabajos se acotan además a `max_blocking`, así un pico nunca ocupa todos
+      los hilos de las rutas sync (/health, /public/teachers siguen respondiendo)
+    - `run_async` espera con await, sin ocupar hilos
+    - un worker caído (BrokenProcessPool) => se recrea el pool y se reintenta una vez
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        workers: int,
+        max_queue: int,
+        retry_after: int = 1,
+        max_blocking: int = DEFAULT_MAX_BLOCKING,
+    ) -> None:
+        self.name = name
+        self.workers = workers
+        self.max_queue = max_queue
+        self.retry_after = retry_after
+        self.capacity = max(workers, 1) + max_queue
+        self.max_blocking = max_blocking
+
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+        self._in_flight = 0
+        self._blocking = 0
+
+        # Métricas (acumuladas desde el arranque)
+        self._completed = 0
+        self._rejected = 0
+        self._restarts = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+        self._last_ms = 0.0
+
+    def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        self._admit(blocking=True)
+        start = time.perf_counter()
+        try:
+            if self.workers == 0:
+                return fn(*args)
+            return self._retry_broken(lambda executor: executor.submit(fn, *args).result())
+        finally:
+            self._release((time.perf_counter() - start) * 1000, blocking=True)
+
+    async def run_async(self, fn: Callable[..., Any], *args: Any) -> Any:
+        self._admit()
+        start = time.perf_counter()
+        try:
+            if self.workers == 0:
+                return await run_in_threadpool(fn, *args)
+            for attempt in (1, 2):
+                executor = self._get_executor()
+                try:
+                    return await asyncio.wrap_future(executor.submit(fn, *args))
+                except BrokenProcessPool:
+                    self._discard(executor)
+                    if attempt == 2:
+                        raise
+        finally:
+            self._release((time.perf_counter() - start) * 1000)
+
+    def map(self, fn: Callable[[Any], Any], items: Iterable[Any], *, chunksize: int = 1) -> list[Any]:
+        """Un lote (p.ej. un chunk del import) como un único trabajo admitido."""
+        items = list(items)
+        self._admit(blocking=True)
+        start = time.perf_counter()
+        try:
+            if self.workers == 0:
+                return list(map(fn, items))
+            return self._retry_broken(lambda executor: list(executor.map(fn, items, chunksize=chunksize)))
+        finally:
+            self._release((time.perf_counter() - start) * 1000, blocking=True)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "capacity": self.capacity,
+                "max_blocking": self.max_blocking,
+                "in_flight": self._in_flight,
+                "queue_depth": max(0, self._in_flight - max(self.workers, 1)),
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "restarts": self._restarts,
+                "avg_ms": round(self._total_ms / self._completed, 2) if self._completed else 0.0,
+                "max_ms": round(self._max_ms, 2),
+                "last_ms": round(self._last_ms, 2),
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _admit(self, *, blocking: bool = False) -> None:
+        with self._lock:
+            rejected = self._in_flight >= self.capacity or (blocking and self._blocking >= self.max_blocking)
+            if rejected:
+                self._rejected += 1
+            else:
+                self._in_flight += 1
+                self._blocking += blocking
+
+        if rejected:
+            logger.warning("Pool %s saturado (capacity=%s), request rechazada", self.name, self.capacity)
+            raise ServiceUnavailableError(
+                "Servicio ocupado, reintenta en unos segundos",
+                retry_after=self.retry_after,
+            )
+
+    def _release(self, elapsed_ms: float, *, blocking: bool = False) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._blocking -= blocking
+            self._completed += 1
+            self._total_ms += elapsed_ms
+            self._last_ms = elapsed_ms
+            self._max_ms = max(self._max_ms, elapsed_ms)
+
+    def _retry_broken(self, call: Callable[[ProcessPoolExecutor], Any]) -> Any:
+        for attempt in (1, 2):
+            executor = self._get_executor()
+            try:
+                return call(executor)
+            except BrokenProcessPool:
+                self._discard(executor)
+                if attempt == 2:
+                    raise
+
+    def _discard(self, executor: ProcessPoolExecutor) -> None:
+        # Solo el primero que lo ve lo reemplaza; el siguiente _get_executor crea otro
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+            self._restarts += 1
+        logger.error("Pool %s roto (un worker murió), se recrea", self.name)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: no hereda hilos/conexiones del proceso de la API
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from typing import Any, Mapping
+
+import orjson
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def dumps(content: Any) -> bytes:
+    # Mismo formato que pydantic: datetimes UTC con "Z", enums por valor
+    return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON vía orjson para payloads armados desde filas confiables (dicts, listas)."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def model_response(
+    model: BaseModel,
+    *,
+    status_code: int = 200,
+    headers: Mapping[str, str] | None = None,
+) -> Response:
+    """
+    Modelo ya construido => JSON directo. Devolver un Response evita que FastAPI
+    lo revalide contra response_model (que queda solo para OpenAPI).
+    """
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
@@ -1,8 +1,31 @@
 from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
 
-# Configuración explícita y moderna
-password_hasher = PasswordHash.recommended()
+from app.config.settings import settings
+
+# Configuración explícita: parámetros argon2 calibrados por host (ver settings)
+password_hasher = PasswordHash(
+    (
+        Argon2Hasher(
+            time_cost=settings.ARGON2_TIME_COST,
+            memory_cost=settings.ARGON2_MEMORY_COST,
+            parallelism=settings.ARGON2_PARALLELISM,
+        ),
+    )
+)
 
 
 def hash_password(password: str) -> str:
     return password_hasher.hash(password)
+
+
+def verify_password(password: str, password_hash: str) -> bool:
+    return password_hasher.verify(password, password_hash)
+
+
+def verify_and_update_password(password: str, password_hash: str) -> tuple[bool, str | None]:
+    """
+    Verifica y, si el hash usa parámetros distintos a los actuales,
+    devuelve un hash nuevo para reemplazarlo (si no, None).
+    """
+    return password_hasher.verify_and_update(password, password_hash)
@@ -1,30 +1,62 @@
+import logging
+from contextlib import asynccontextmanager
+
+import anyio
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
+from sqlalchemy.exc import IntegrityError
+from starlette.concurrency import run_in_threadpool
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.api.routes.health import router as health_router
+from app.api.routes.media import router as media_router
 from app.config.settings import settings
+from app.core.hashing import password_hashing_pool
 from app.core.logging import configure_logging
 from app.core.middlewares import request_logging_middleware
 from app.core.errors import (
     AppError,
     app_error_handler,
     validation_error_handler,
+    integrity_error_handler,
     internal_error_handler,
     http_exception_handler
 )
 from app.modules.auth.router import router as auth_router
+from app.modules.auth.jwks_router import router as jwks_router
 from app.modules.dashboard.router import router as dashboard_router
 from app.modules.teacher.router import router as teacher_router
 from app.modules.teacher.admin_router import router as teacher_admin_router
 from app.modules.teacher.me_router import router as teacher_me_router
 from app.modules.teacher.public_router import router as public_teachers_router
+from app.modules.teacher.catalog import catalog_index
+from app.modules.teacher.snapshot import catalog_snapshot
+from app.modules.users.admin_router import router as users_admin_router
+
+
+logger = logging.getLogger("app")
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    # argon2 bloquea un hilo por hash: como mucho la mitad del threadpool real
+    threads = int(anyio.to_thread.current_default_thread_limiter().total_tokens)
+    password_hashing_pool.max_blocking = max(1, min(password_hashing_pool.max_blocking, threads // 2))
+    # Catálogo público en memoria listo antes de la primera request
+    if catalog_index.enabled:
+        try:
+            await run_in_threadpool(catalog_index.rebuild)
+        except Exception:  # sin DB al arrancar => se carga en la primera consulta
+            logger.exception("No se pudo cargar el catálogo de docentes al arrancar")
+    # Snapshot compartido: en segundo plano (si otro worker ya lo generó, no hace nada)
+    catalog_snapshot.schedule_build()
+    yield
 
 
 def create_app() -> FastAPI:
     configure_logging(settings.app_env)
 
-    app = FastAPI(title=settings.app_name)
+    app = FastAPI(title=settings.app_name, lifespan=lifespan)
 
     # Middleware de logging por request
     app.middleware("http")(request_logging_middleware)
@@ -33,15 +65,19 @@ def create_app() -> FastAPI:
     app.add_exception_handler(AppError, app_error_handler)    
     app.add_exception_handler(StarletteHTTPException, http_exception_handler)
     app.add_exception_handler(RequestValidationError, validation_error_handler)
+    app.add_exception_handler(IntegrityError, integrity_error_handler)
     app.add_exception_handler(Exception, internal_error_handler)
 
     app.include_router(health_router)
+    app.include_router(media_router)
     app.include_router(auth_router)
+    app.include_router(jwks_router)
     app.include_router(dashboard_router)
     app.include_router(teacher_router)
     app.include_router(teacher_admin_router)
     app.include_router(teacher_me_router)
     app.include_router(public_teachers_router)
+    app.include_router(users_admin_router)
 
     return app
 
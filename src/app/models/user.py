@@ -3,7 +3,10 @@ from datetime import datetime
 from sqlalchemy import (
     String,
     DateTime,
+    Integer,
+    FetchedValue,
     Enum as SAEnum,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -14,6 +17,8 @@ from sqlalchemy.orm import relationship
 
 class User(Base):
     __tablename__ = "users"
+    # INSERT/UPDATE ... RETURNING de lo que genera la DB (id, token_version)
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True)
 
@@ -46,6 +51,14 @@ class User(Base):
         nullable=False,
     )
 
+    # Se incrementa (trigger en DB) al cambiar role/status => revoca JWT emitidos
+    token_version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default=text("0"),
+        server_onupdate=FetchedValue(),
+    )
+
     teacher_profile = relationship(
         "TeacherProfile",
         back_populates="user",
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import jwt
 from jwt import InvalidTokenError
 from typing import Callable
 
@@ -11,8 +10,11 @@ from sqlalchemy.orm import Session
 
 from app.config.settings import settings
 from app.core.database import get_db
-from app.core.enums import UserStatus
+from app.core.enums import UserRole, UserStatus
 from app.models.user import User
+from app.modules.auth.principal import Principal, cache_generation, principal_cache, store_principal
+from app.modules.auth.security import decode_access_token
+from app.modules.auth.token_versions import token_version_registry
 
 bearer_scheme = HTTPBearer(auto_error=False)
 
@@ -25,18 +27,42 @@ def _forbidden() -> HTTPException:
     return HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Usuario no habilitado")
 
 
+def load_principal(db: Session, user_id: int) -> Principal:
+    generation = cache_generation()
+    user = db.execute(select(User).where(User.id == user_id)).scalar_one_or_none()
+    if not user:
+        raise _unauthorized()
+
+    principal = Principal.from_user(user)
+    store_principal(principal, generation=generation)
+    return principal
+
+
+def _principal_from_claims(user_id: int, payload: dict) -> Principal:
+    """Modo claims-only: cero round-trips, revocación vía token_version."""
+    try:
+        role = UserRole(payload["role"])
+        user_status = UserStatus(payload["status"])
+    except (KeyError, ValueError):
+        raise _unauthorized()
+
+    version = payload.get("ver", 0)
+    current = token_version_registry.current(user_id)
+    if current is None or not isinstance(version, int) or version < current:
+        raise _unauthorized()
+
+    return Principal(id=user_id, role=role, status=user_status)
+
+
 def get_current_user(
     credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
     db: Session = Depends(get_db),
-) -> User:
+) -> Principal:
     if credentials is None or credentials.scheme.lower() != "bearer":
         raise _unauthorized()
 
-    token = credentials.credentials
-    algorithm = settings.JWT_ALGORITHM 
-
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[algorithm])
+        payload = decode_access_token(credentials.credentials)
     except InvalidTokenError:
         raise _unauthorized()
 
@@ -49,14 +75,16 @@ def get_current_user(
     except (TypeError, ValueError):
         raise _unauthorized()
 
-    user = db.execute(select(User).where(User.id == user_id)).scalar_one_or_none()
-    if not user:
-        raise _unauthorized()
+    if settings.AUTH_CLAIMS_ONLY:
+        principal = _principal_from_claims(user_id, payload)
+    else:
+        # Hot path: principal cacheado => sin SELECT a users
+        principal = principal_cache.get(user_id) or load_principal(db, user_id)
     
-    if user.status in {UserStatus.SUSPENDED, UserStatus.DELETED, UserStatus.INACTIVE}:
+    if principal.status in {UserStatus.SUSPENDED, UserStatus.DELETED, UserStatus.INACTIVE}:
         raise _forbidden()
 
-    return user
+    return principal
 
 
 
@@ -66,7 +94,7 @@ def require_roles(*roles: str) -> Callable:
         Depends(require_roles("ADMIN"))
         Depends(require_roles("TEACHER", "ADMIN"))
     """
-    def dependency(user: User = Depends(get_current_user)) -> User:
+    def dependency(user: Principal = Depends(get_current_user)) -> Principal:
         user_role = (
             user.role.value
             if hasattr(user.role, "value")
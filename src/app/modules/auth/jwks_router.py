@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Request, Response
+
+from app.config.settings import settings
+from app.core.http_cache import is_not_modified, not_modified
+from app.modules.auth.keys import jwt_key_ring
+
+router = APIRouter(prefix="/.well-known", tags=["auth"])
+
+
+@router.get("/jwks.json", operation_id="auth_jwks")
+def jwks(request: Request) -> Response:
+    """
+    Claves públicas para verificar access tokens sin llamar a esta API.
+    Cacheable por proxies/servicios; vacío si se firma con HS256.
+    """
+    headers = {
+        "Cache-Control": f"public, max-age={settings.JWKS_MAX_AGE_SECONDS}",
+        "ETag": jwt_key_ring.jwks_etag,
+    }
+
+    if is_not_modified(request, etag=jwt_key_ring.jwks_etag):
+        return not_modified(headers)
+
+    return Response(content=jwt_key_ring.jwks_bytes, media_type="application/json", headers=headers)
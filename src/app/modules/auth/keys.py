@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+from cryptography.hazmat.primitives.serialization import load_pem_private_key, load_pem_public_key
+from jwt import InvalidTokenError
+
+from app.config.settings import settings
+
+# Miembros requeridos por tipo de clave para el thumbprint (RFC 7638)
+_THUMBPRINT_MEMBERS = {
+    "RSA": ("e", "kty", "n"),
+    "EC": ("crv", "kty", "x", "y"),
+    "OKP": ("crv", "kty", "x"),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class JWTKey:
+    kid: str
+    algorithm: str
+    public_key: Any
+    private_key: Any | None
+    jwk: dict
+
+
+class JWTKeyRing:
+    """
+    Claves para firmar/verificar access tokens.
+
+    - Sin claves asimétricas: HS* con SECRET_KEY (comportamiento histórico, JWKS vacío).
+    - Con claves (RS256 / ES256 / EdDSA): firma la primera clave privada con
+      header `kid`; el resto de privadas y las públicas sueltas solo verifican.
+      Rotar = anteponer la clave nueva y mantener la anterior hasta que expiren
+      sus tokens. Todas se publican en /.well-known/jwks.json.
+    """
+
+    def __init__(self, keys: list[JWTKey], *, secret: str, hs_algorithm: str) -> None:
+        self._keys = {key.kid: key for key in keys}
+        self._signer = next((key for key in keys if key.private_key is not None), None)
+        self._secret = secret
+        self._hs_algorithm = hs_algorithm
+        self.jwks_bytes = json.dumps({"keys": [key.jwk for key in keys]}, separators=(",", ":")).encode()
+        self.jwks_etag = '"' + hashlib.sha256(self.jwks_bytes).hexdigest()[:32] + '"'
+
+    @classmethod
+    def from_files(
+        cls,
+        *,
+        private_key_files: list[str],
+        public_key_files: list[str],
+        secret: str,
+        hs_algorithm: str,
+    ) -> "JWTKeyRing":
+        keys = [_load_key(Path(path), private=True) for path in private_key_files]
+        keys += [_load_key(Path(path), private=False) for path in public_key_files]
+        return cls(keys, secret=secret, hs_algorithm=hs_algorithm)
+
+    @property
+    def asymmetric(self) -> bool:
+        return self._signer is not None
+
+    def encode(self, payload: dict) -> str:
+        if self._signer is None:
+            return jwt.encode(payload, self._secret, algorithm=self._hs_algorithm)
+
+        return jwt.encode(
+            payload,
+            self._signer.private_key,
+            algorithm=self._signer.algorithm,
+            headers={"kid": self._signer.kid},
+        )
+
+    def decode(self, token: str) -> dict:
+        if self._signer is None:
+            return jwt.decode(token, self._secret, algorithms=[self._hs_algorithm])
+
+        kid = jwt.get_unverified_header(token).get("kid")
+        key = self._keys.get(kid) if isinstance(kid, str) else None
+        if key is None:
+            raise InvalidTokenError("kid desconocido")
+
+        # Algoritmo fijado por la clave (nunca por el header) => sin confusión de algoritmos
+        return jwt.decode(token, key.public_key, algorithms=[key.algorithm])
+
+
+def _load_key(path: Path, *, private: bool) -> JWTKey:
+    data = path.read_bytes()
+    private_key = load_pem_private_key(data, password=None) if private else None
+    public_key = private_key.public_key() if private_key is not None else load_pem_public_key(data)
+
+    if isinstance(public_key, rsa.RSAPublicKey):
+        algorithm, jwk = "RS256", jwt.algorithms.RSAAlgorithm.to_jwk(public_key, as_dict=True)
+    elif isinstance(public_key, ec.EllipticCurvePublicKey) and public_key.curve.name == "secp256r1":
+        algorithm, jwk = "ES256", jwt.algorithms.ECAlgorithm.to_jwk(public_key, as_dict=True)
+    elif isinstance(public_key, ed25519.Ed25519PublicKey):
+        algorithm, jwk = "EdDSA", jwt.algorithms.OKPAlgorithm.to_jwk(public_key, as_dict=True)
+    else:
+        raise RuntimeError(f"Tipo de clave JWT no soportado: {path}")
+
+    kid = _thumbprint(jwk)
+    jwk = {**jwk, "kid": kid, "alg": algorithm, "use": "sig"}
+    return JWTKey(kid=kid, algorithm=algorithm, public_key=public_key, private_key=private_key, jwk=jwk)
+
+
+def _thumbprint(jwk: dict) -> str:
+    members = {name: jwk[name] for name in _THUMBPRINT_MEMBERS[jwk["kty"]]}
+    canonical = json.dumps(members, separators=(",", ":"), sort_keys=True).encode()
+    return base64.urlsafe_b64encode(hashlib.sha256(canonical).digest()).rstrip(b"=").decode()
+
+
+jwt_key_ring = JWTKeyRing.from_files(
+    private_key_files=settings.JWT_PRIVATE_KEY_FILES,
+    public_key_files=settings.JWT_PUBLIC_KEY_FILES,
+    secret=settings.SECRET_KEY,
+    hs_algorithm=settings.JWT_ALGORITHM,
+)
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, ForeignKey, Integer, String, LargeBinary, DateTime, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.base import Base
+
+
+class RefreshToken(Base):
+    """
+    Refresh token opaco y rotativo (solo se guarda su sha256).
+    Cada uso lo marca `used_at` y emite uno nuevo en la misma familia;
+    reusar uno ya usado revoca toda la familia (robo detectado).
+    """
+    __tablename__ = "refresh_tokens"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    # Una familia = una sesión (login); se hereda en cada rotación
+    family_id: Mapped[str] = mapped_column(String(32), nullable=False, index=True)
+    token_hash: Mapped[bytes] = mapped_column(LargeBinary(32), nullable=False, unique=True)
+
+    # Expiración deslizante, acotada por el fin absoluto de la sesión.
+    # Pasado session_expires_at la familia entera está muerta => se purga (índice)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    session_expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
+
+    used_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    revoked_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+
+class TokenRevocation(Base):
+    """
+    Log de revocaciones de JWT (modo claims-only), escrito por triggers en users:
+    token_version nuevo tras un cambio de role/status, o NULL si el usuario se borró.
+    Solo importan las filas más nuevas que la vida de un access token.
+    """
+    __tablename__ = "token_revocations"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    # Sin FK: la fila de un usuario borrado sobrevive a su DELETE
+    user_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    token_version: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        index=True,
+    )
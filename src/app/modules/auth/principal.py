@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from app.core.cache import TTLCache
+from app.core.enums import UserRole, UserStatus
+from app.models.user import User
+from app.modules.auth.token_versions import token_version_registry
+
+# Campos que, si cambian, dejan obsoleto el principal cacheado
+PRINCIPAL_FIELDS = ("email", "role", "status")
+
+_PENDING_IDS = "principal_cache_pending_ids"
+_PENDING_ALL = "principal_cache_pending_all"
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """
+    Identidad autenticada (inmutable) que entregan get_current_user / require_roles.
+    En modo claims-only se construye desde el JWT: email/created_at no viajan
+    en el token y quedan en None.
+    """
+    id: int
+    role: UserRole
+    status: UserStatus
+    email: str | None = None
+    created_at: datetime | None = None
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(
+            id=user.id,
+            role=user.role,
+            status=user.status,
+            email=user.email,
+            created_at=user.created_at,
+        )
+
+
+principal_cache: TTLCache[int, Principal] = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+# Se incrementa en cada invalidación: una carga que empezó antes no guarda su
+# resultado (mismo criterio que teacher/cache.py)
+_generation = 0
+_generation_lock = threading.Lock()
+
+
+def cache_generation() -> int:
+    return _generation
+
+
+def store_principal(principal: Principal, *, generation: int) -> None:
+    """Guarda un principal leído de la DB, salvo que haya habido una invalidación desde la lectura."""
+    if generation == _generation:
+        principal_cache.set(principal.id, principal)
+
+
+# --- Invalidación explícita ------------------------------------------------
+# Cualquier cambio de role/status/email (o borrado) hecho vía ORM en este
+# proceso invalida la entrada al hacer commit. Otros workers dependen del TTL.
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_users(session: Session, _flush_context) -> None:
+    pending: set[int] = session.info.setdefault(_PENDING_IDS, set())
+
+    for obj in session.dirty:
+        if isinstance(obj, User):
+            state = inspect(obj)
+            if any(state.attrs[name].history.has_changes() for name in PRINCIPAL_FIELDS):
+                pending.add(obj.id)
+
+    for obj in session.deleted:
+        if isinstance(obj, User):
+            pending.add(obj.id)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_user_writes(orm_execute_state) -> None:
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    if table is not None and table.name == User.__tablename__:
+        orm_execute_state.session.info[_PENDING_ALL] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session: Session) -> None:
+    changed_all = session.info.pop(_PENDING_ALL, False)
+    changed_ids = session.info.pop(_PENDING_IDS, ())
+
+    if changed_all or changed_ids:
+        global _generation
+        with _generation_lock:
+            _generation += 1
+    if changed_all:
+        principal_cache.clear()
+    for user_id in changed_ids:
+        principal_cache.pop(user_id)
+
+    # El trigger ya incrementó token_version: recargar el mapa en el próximo acceso
+    if changed_all or changed_ids:
+        token_version_registry.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_ALL, None)
+    session.info.pop(_PENDING_IDS, None)
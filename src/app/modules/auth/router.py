@@ -1,17 +1,21 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.http_cache import cache_headers, is_not_modified, make_etag, not_modified
+from app.core.responses import model_response
 from app.modules.auth.schemas import (
     RegisterRequest, 
     RegisterResponse, 
     UserPublic, 
     LoginRequest, 
+    RefreshRequest,
     TokenResponse
 )
 from app.modules.auth.service import AuthService
-from app.models.user import User
-from app.modules.auth.dependencies import get_current_user, require_roles
+from app.modules.auth.principal import Principal
+from app.modules.auth.dependencies import get_current_user, load_principal, require_roles
+from app.modules.auth.throttling import client_ip
 
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -39,19 +43,42 @@ def register(payload: RegisterRequest, db: Session = Depends(get_db)) -> Registe
 
 
 @router.post("/login", response_model=TokenResponse, operation_id="auth_login")
-def login(payload: LoginRequest, db: Session = Depends(get_db)) -> TokenResponse:
-    token = AuthService().login(db, email=payload.email, password=payload.password)
-    return TokenResponse(access_token=token)
+def login(payload: LoginRequest, request: Request, db: Session = Depends(get_db)) -> TokenResponse:
+    access_token, refresh_token = AuthService().login(
+        db, email=payload.email, password=payload.password, client_ip=client_ip(request)
+    )
+    return TokenResponse(access_token=access_token, refresh_token=refresh_token)
+
+
+@router.post("/refresh", response_model=TokenResponse, operation_id="auth_refresh")
+def refresh(payload: RefreshRequest, db: Session = Depends(get_db)) -> TokenResponse:
+    access_token, refresh_token = AuthService().refresh(db, refresh_token=payload.refresh_token)
+    return TokenResponse(access_token=access_token, refresh_token=refresh_token)
 
 
 @router.get("/me", response_model=UserPublic, operation_id="auth_me")
-def me(user: User = Depends(get_current_user)) -> UserPublic:
-    return UserPublic(
+def me(
+    request: Request,
+    user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> UserPublic:
+    # En modo claims-only el token no trae email/created_at
+    if user.email is None:
+        user = load_principal(db, user.id)
+
+    # users no tiene updated_at: el ETag sale de los campos de la respuesta
+    etag = make_etag("auth_me", user.id, user.email, user.role, user.status, user.created_at)
+    headers = cache_headers(etag=etag, cache_control="private, no-cache")
+    if is_not_modified(request, etag=etag):
+        return not_modified(headers)
+
+    user_public = UserPublic(
         id=user.id,
         email=user.email,
         role=user.role,
         status=user.status,
         created_at=user.created_at,
     )
+    return model_response(user_public, headers=headers)
 
 
@@ -1,20 +1,25 @@
 from __future__ import annotations
 
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
-import jwt
 
 from app.config.settings import settings
-from app.core.security import password_hasher  # el objeto de pwdlib
-# Si no exportaste password_hasher, ver sección 3.1 abajo.
+from app.core.cache import TTLCache
+from app.core.security import verify_password  # noqa: F401  (re-export)
+from app.modules.auth.keys import jwt_key_ring
 
 
-def verify_password(password: str, password_hash: str) -> bool:
-    return password_hasher.verify(password, password_hash)
+# Tokens ya verificados (firma + claims), por digest del token y hasta su `exp`.
+# Un cliente reusa el mismo bearer durante toda su vigencia.
+verified_token_cache: TTLCache[bytes, dict] = TTLCache(
+    maxsize=settings.JWT_CACHE_MAX_ENTRIES,
+    ttl=settings.ACCESS_TOKEN_EXPIRES_MINUTES * 60,
+)
 
 
-def create_access_token(*, sub: str, role: str, status: str) -> str:
+def create_access_token(*, sub: str, role: str, status: str, token_version: int = 0) -> str:
     expires_minutes = settings.ACCESS_TOKEN_EXPIRES_MINUTES
-    algorithm = settings.JWT_ALGORITHM
 
     now = datetime.now(timezone.utc)
     exp = now + timedelta(minutes=expires_minutes)
@@ -23,8 +28,33 @@ def create_access_token(*, sub: str, role: str, status: str) -> str:
         "sub": sub,
         "role": role,
         "status": status,
+        "ver": token_version,
         "iat": int(now.timestamp()),
         "exp": int(exp.timestamp()),
     }
 
-    return jwt.encode(payload, settings.SECRET_KEY, algorithm=algorithm)
+    return jwt_key_ring.encode(payload)
+
+
+def decode_access_token(token: str) -> dict:
+    """
+    Verifica el JWT (firma, exp) y devuelve el payload.
+    El payload cacheado es compartido: tratarlo como solo lectura.
+    Lanza jwt.InvalidTokenError si el token no es válido.
+    """
+    digest = hashlib.blake2b(token.encode(), digest_size=32).digest()
+
+    payload = verified_token_cache.get(digest)
+    if payload is not None:
+        # El TTL se mide con reloj monótono; revalida contra exp por si acaso
+        if payload["exp"] > time.time():
+            return payload
+        verified_token_cache.pop(digest)
+
+    payload = jwt_key_ring.decode(token)
+
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        verified_token_cache.set(digest, payload, ttl=exp - time.time())
+
+    return payload
@@ -1,15 +1,24 @@
 from __future__ import annotations
 
-from sqlalchemy import select
+import hashlib
+import secrets
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from starlette.status import HTTP_400_BAD_REQUEST
 from fastapi import HTTPException, status
 
+from app.config.settings import settings
 from app.core.enums import UserRole, UserStatus
 from app.core.errors import AppError, ConflictError
-from app.core.security import hash_password
+from app.core.hashing import password_hashing_pool
 from app.models.user import User
-from app.modules.auth.security import verify_password, create_access_token
+from app.modules.auth.models import RefreshToken
+from app.modules.auth.security import create_access_token
+from app.modules.auth.throttling import login_throttle
 
 
 class AuthService:
@@ -18,40 +27,195 @@ class AuthService:
         if role not in {UserRole.STUDENT, UserRole.TEACHER}:
             raise AppError("Rol no permitido para registro", status_code=HTTP_400_BAD_REQUEST)
 
-        # Email único
-        exists = db.execute(select(User).where(User.email == email)).scalar_one_or_none()
+        # Pre-check barato: un duplicado no gasta un argon2 ni un slot del pool
+        exists = db.execute(select(User.id).where(User.email == email)).first() is not None
+        # Cierra la transacción de lectura: la conexión vuelve al pool durante argon2
+        db.rollback()
         if exists:
             raise ConflictError("Email ya registrado")
+        password_hash = password_hashing_pool.hash(password)
 
-        user = User(
-            email=email,
-            password_hash=hash_password(password),
-            role=role,
-            status=UserStatus.ACTIVE,
-        )
+        # Email único: INSERT ... ON CONFLICT DO NOTHING RETURNING.
+        # Sin fila => lo creó una request concurrente entre el pre-check y el
+        # INSERT => 409, sin pasar por la IntegrityError del índice único.
+        user = db.execute(
+            insert(User)
+            .values(
+                email=email,
+                password_hash=password_hash,
+                role=role,
+                status=UserStatus.ACTIVE,
+            )
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(User)
+        ).scalar_one_or_none()
+        if user is None:
+            db.rollback()
+            raise ConflictError("Email ya registrado")
 
-        db.add(user)
         db.commit()
-        db.refresh(user)
         return user
 
 
-    def login(self, db: Session, *, email: str, password: str) -> str:
+    def login(
+        self,
+        db: Session,
+        *,
+        email: str,
+        password: str,
+        client_ip: str | None = None,
+    ) -> tuple[str, str]:
+        """Devuelve (access_token, refresh_token)."""
+        # Throttling antes de cualquier SELECT o argon2
+        login_throttle.check(email=email, client_ip=client_ip)
+
         user = db.execute(select(User).where(User.email == email)).scalar_one_or_none()
 
-        if (
-            not user
-            or not getattr(user, "password_hash", None)
-            or not verify_password(password, user.password_hash)
-        ):
+        if not user or not getattr(user, "password_hash", None):
+            login_throttle.register_failure(email=email, client_ip=client_ip)
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Credenciales inválidas")
+
+        valid, new_hash = password_hashing_pool.verify_and_update(password, user.password_hash)
+        if not valid:
+            login_throttle.register_failure(email=email, client_ip=client_ip)
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Credenciales inválidas")
 
         # Bloqueo por status (sin filtrar: mantenemos 401)
         if user.status in {UserStatus.SUSPENDED, UserStatus.DELETED, UserStatus.INACTIVE}:
+            login_throttle.register_failure(email=email, client_ip=client_ip)
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Credenciales inválidas")
 
+        login_throttle.register_success(email=email)
+
+        # Hash con parámetros argon2 antiguos => rehash transparente (sin reset de password)
+        if new_hash:
+            user.password_hash = new_hash
+
+        # Nueva sesión: access token + primer refresh token de la familia (un solo commit).
+        # De paso se borran las sesiones ya vencidas de este usuario (índice user_id)
+        access_token = self._access_token_for(user)
+        refresh_token = self._issue_refresh_token(db, user_id=user.id)
+        db.execute(
+            delete(RefreshToken).where(
+                RefreshToken.user_id == user.id,
+                RefreshToken.session_expires_at <= datetime.now(timezone.utc),
+            )
+        )
+        db.commit()
+
+        return access_token, refresh_token
+
+    def refresh(self, db: Session, *, refresh_token: str) -> tuple[str, str]:
+        """
+        Renueva la sesión sin argon2: rota el refresh token (one-time use)
+        y emite un access token con el role/status/token_version actuales.
+        """
+        now = datetime.now(timezone.utc)
+
+        current = db.execute(
+            select(RefreshToken)
+            .where(RefreshToken.token_hash == _hash_refresh_token(refresh_token))
+            .with_for_update()
+        ).scalar_one_or_none()
+
+        if not current:
+            raise _invalid_refresh_token()
+
+        if current.used_at is not None or current.revoked_at is not None:
+            # Reuso de un token ya rotado => posible robo: se revoca toda la sesión
+            self._revoke_family(db, family_id=current.family_id, now=now)
+            db.commit()
+            raise _invalid_refresh_token()
+
+        if current.expires_at <= now:
+            raise _invalid_refresh_token()
+
+        user = db.execute(select(User).where(User.id == current.user_id)).scalar_one_or_none()
+        if not user or user.status in {UserStatus.SUSPENDED, UserStatus.DELETED, UserStatus.INACTIVE}:
+            self._revoke_family(db, family_id=current.family_id, now=now)
+            db.commit()
+            raise _invalid_refresh_token()
+
+        current.used_at = now
+        access_token = self._access_token_for(user)
+        new_refresh_token = self._issue_refresh_token(
+            db,
+            user_id=user.id,
+            family_id=current.family_id,
+            session_expires_at=current.session_expires_at,
+            now=now,
+        )
+        db.commit()
+
+        return access_token, new_refresh_token
+
+    def purge_expired_refresh_tokens(self, db: Session, *, batch_size: int = 10_000) -> int:
+        """
+        Borra las filas de sesiones terminadas (session_expires_at vencido), en
+        lotes de `batch_size` con un commit por lote. Las usadas/revocadas de una
+        sesión viva se conservan: detectan el reuso. Devuelve cuántas borró.
+        """
+        now = datetime.now(timezone.utc)
+        purged = 0
+        while True:
+            expired = (
+                select(RefreshToken.id)
+                .where(RefreshToken.session_expires_at <= now)
+                .limit(batch_size)
+                .scalar_subquery()
+            )
+            deleted = db.execute(delete(RefreshToken).where(RefreshToken.id.in_(expired))).rowcount
+            db.commit()
+            purged += deleted
+            if deleted < batch_size:
+                return purged
+
+    def _access_token_for(self, user: User) -> str:
         return create_access_token(
             sub=str(user.id),
             role=str(user.role.value if hasattr(user.role, "value") else user.role),
             status=str(user.status.value if hasattr(user.status, "value") else user.status),
-        )
\ No newline at end of file
+            token_version=user.token_version,
+        )
+
+    def _issue_refresh_token(
+        self,
+        db: Session,
+        *,
+        user_id: int,
+        family_id: str | None = None,
+        session_expires_at: datetime | None = None,
+        now: datetime | None = None,
+    ) -> str:
+        now = now or datetime.now(timezone.utc)
+        if session_expires_at is None:
+            session_expires_at = now + timedelta(days=settings.REFRESH_TOKEN_MAX_SESSION_DAYS)
+
+        token = secrets.token_urlsafe(32)
+        db.add(
+            RefreshToken(
+                user_id=user_id,
+                family_id=family_id or uuid.uuid4().hex,
+                token_hash=_hash_refresh_token(token),
+                # Deslizante: cada rotación extiende, sin pasar el fin absoluto de la sesión
+                expires_at=min(now + timedelta(days=settings.REFRESH_TOKEN_EXPIRES_DAYS), session_expires_at),
+                session_expires_at=session_expires_at,
+            )
+        )
+        return token
+
+    def _revoke_family(self, db: Session, *, family_id: str, now: datetime) -> None:
+        db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=now)
+        )
+
+
+def _hash_refresh_token(token: str) -> bytes:
+    # Token aleatorio de 256 bits: sha256 basta (no necesita argon2)
+    return hashlib.sha256(token.encode()).digest()
+
+
+def _invalid_refresh_token() -> HTTPException:
+    return HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token inválido")
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import ipaddress
+import math
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from functools import lru_cache
+
+from starlette.requests import Request
+
+from app.config.settings import settings
+from app.core.errors import TooManyRequestsError
+
+
+class ThrottleBackend(ABC):
+    """
+    Almacén de contadores de ventana deslizante (log de timestamps por clave).
+    Implementaciones: en memoria (por worker) o compartida (Redis).
+    """
+
+    @abstractmethod
+    def hit(self, key: str, *, window: int, now: float) -> None:
+        ...
+
+    @abstractmethod
+    def count(self, key: str, *, window: int, now: float) -> tuple[int, float | None]:
+        """Devuelve (eventos dentro de la ventana, timestamp del más antiguo)."""
+
+    @abstractmethod
+    def reset(self, key: str) -> None:
+        ...
+
+
+class InMemoryThrottleBackend(ThrottleBackend):
+    def __init__(self, *, max_keys: int = 100_000) -> None:
+        self.max_keys = max_keys
+        self._events: OrderedDict[str, deque[float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hit(self, key: str, *, window: int, now: float) -> None:
+        with self._lock:
+            events = self._events.get(key)
+            if events is None:
+                events = self._events[key] = deque()
+                # Acota memoria ante ataques con millones de emails distintos
+                while len(self._events) > self.max_keys:
+                    self._events.popitem(last=False)
+            else:
+                self._events.move_to_end(key)
+            self._prune(events, window=window, now=now)
+            events.append(now)
+
+    def count(self, key: str, *, window: int, now: float) -> tuple[int, float | None]:
+        with self._lock:
+            events = self._events.get(key)
+            if not events:
+                return 0, None
+            self._prune(events, window=window, now=now)
+            if not events:
+                del self._events[key]
+                return 0, None
+            return len(events), events[0]
+
+    def reset(self, key: str) -> None:
+        with self._lock:
+            self._events.pop(key, None)
+
+    @staticmethod
+    def _prune(events: deque[float], *, window: int, now: float) -> None:
+        limit = now - window
+        while events and events[0] <= limit:
+            events.popleft()
+
+
+class RedisThrottleBackend(ThrottleBackend):
+    """Backend compartido entre workers (sorted set por clave). Requiere `redis`."""
+
+    def __init__(self, url: str, *, prefix: str = "parladach:throttle:") -> None:
+        try:
+            import redis
+        except ImportError as exc:  # pragma: no cover
+            raise RuntimeError("LOGIN_THROTTLE_BACKEND_URL requiere el paquete 'redis'") from exc
+
+        self._client = redis.Redis.from_url(url)
+        self._prefix = prefix
+
+    def hit(self, key: str, *, window: int, now: float) -> None:
+        name = self._prefix + key
+        pipe = self._client.pipeline()
+        pipe.zadd(name, {f"{now}:{uuid.uuid4().hex}": now})
+        pipe.zremrangebyscore(name, 0, now - window)
+        pipe.expire(name, window)
+        pipe.execute()
+
+    def count(self, key: str, *, window: int, now: float) -> tuple[int, float | None]:
+        name = self._prefix + key
+        pipe = self._client.pipeline()
+        pipe.zremrangebyscore(name, 0, now - window)
+        pipe.zcard(name)
+        pipe.zrange(name, 0, 0, withscores=True)
+        _, total, oldest = pipe.execute()
+        return int(total), (oldest[0][1] if oldest else None)
+
+    def reset(self, key: str) -> None:
+        self._client.delete(self._prefix + key)
+
+
+class LoginThrottle:
+    """
+    Corta intentos de login antes de tocar DB o argon2:
+    - por email: fallos en la ventana (credential stuffing dirigido)
+    - por IP: fallos en la ventana (spraying desde un mismo origen)
+    Un login correcto limpia el contador del email.
+    """
+
+    def __init__(
+        self,
+        backend: ThrottleBackend,
+        *,
+        email_max_failures: int,
+        email_window: int,
+        ip_max_failures: int,
+        ip_window: int,
+        enabled: bool = True,
+    ) -> None:
+        self.backend = backend
+        self.email_max_failures = email_max_failures
+        self.email_window = email_window
+        self.ip_max_failures = ip_max_failures
+        self.ip_window = ip_window
+        self.enabled = enabled
+
+    def check(self, *, email: str, client_ip: str | None) -> None:
+        if not self.enabled:
+            return
+
+        now = time.time()
+        for key, limit, window in self._rules(email=email, client_ip=client_ip):
+            total, oldest = self.backend.count(key, window=window, now=now)
+            if total >= limit:
+                retry_after = max(1, math.ceil((oldest or now) + window - now))
+                raise TooManyRequestsError(
+                    "Demasiados intentos de login, reintenta más tarde",
+                    retry_after=retry_after,
+                )
+
+    def register_failure(self, *, email: str, client_ip: str | None) -> None:
+        if not self.enabled:
+            return
+
+        now = time.time()
+        for key, _, window in self._rules(email=email, client_ip=client_ip):
+            self.backend.hit(key, window=window, now=now)
+
+    def register_success(self, *, email: str) -> None:
+        if self.enabled:
+            self.backend.reset(self._email_key(email))
+
+    def _rules(self, *, email: str, client_ip: str | None) -> list[tuple[str, int, int]]:
+        rules = [(self._email_key(email), self.email_max_failures, self.email_window)]
+        if client_ip:
+            rules.append((f"login:ip:{client_ip}", self.ip_max_failures, self.ip_window))
+        return rules
+
+    @staticmethod
+    def _email_key(email: str) -> str:
+        return f"login:email:{email.strip().lower()}"
+
+
+def client_ip(request: Request) -> str | None:
+    """
+    IP del cliente para el throttling por IP.
+
+    Peer TCP en TRUSTED_PROXIES => X-Forwarded-For leído de derecha a izquierda,
+    saltando los proxies confiables: el primero que no lo es fue el cliente
+    (lo de más a la izquierda lo controla el cliente y no se usa).
+    """
+    peer = request.client.host if request.client else None
+    trusted = _trusted_networks(tuple(settings.TRUSTED_PROXIES))
+    if peer is None or not _is_trusted(peer, trusted):
+        return peer
+
+    hops = [hop.strip() for hop in ",".join(request.headers.getlist("x-forwarded-for")).split(",") if hop.strip()]
+    for hop in reversed(hops):
+        if not _is_trusted(hop, trusted):
+            return hop
+    return hops[0] if hops else peer
+
+
+@lru_cache(maxsize=4)
+def _trusted_networks(proxies: tuple[str, ...]) -> tuple[ipaddress.IPv4Network | ipaddress.IPv6Network, ...]:
+    return tuple(ipaddress.ip_network(proxy, strict=False) for proxy in proxies)
+
+
+def _is_trusted(host: str, trusted: tuple) -> bool:
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in trusted)
+
+
+def _build_backend(url: str | None) -> ThrottleBackend:
+    if not url:
+        return InMemoryThrottleBackend()
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisThrottleBackend(url)
+    raise RuntimeError(f"LOGIN_THROTTLE_BACKEND_URL no soportada: {url}")
+
+
+login_throttle = LoginThrottle(
+    _build_backend(settings.LOGIN_THROTTLE_BACKEND_URL),
+    email_max_failures=settings.LOGIN_THROTTLE_EMAIL_MAX_FAILURES,
+    email_window=settings.LOGIN_THROTTLE_EMAIL_WINDOW_SECONDS,
+    ip_max_failures=settings.LOGIN_THROTTLE_IP_MAX_FAILURES,
+    ip_window=settings.LOGIN_THROTTLE_IP_WINDOW_SECONDS,
+    enabled=settings.LOGIN_THROTTLE_ENABLED,
+)
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from datetime import timedelta
+from typing import Callable
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from app.core.database import SessionLocal
+from app.modules.auth.models import TokenRevocation
+
+logger = logging.getLogger("app.auth.token_versions")
+
+# Margen sobre la vida del access token (cambios de config, relojes)
+_WINDOW_MARGIN = timedelta(minutes=5)
+
+
+def revocation_window() -> timedelta:
+    """Revocaciones más viejas que esto solo afectan a tokens ya expirados."""
+    return timedelta(minutes=settings.ACCESS_TOKEN_EXPIRES_MINUTES) + _WINDOW_MARGIN
+
+
+def purge_token_revocations(db: Session) -> int:
+    """Borra del log las revocaciones fuera de la ventana. Devuelve cuántas borró."""
+    deleted = db.execute(
+        delete(TokenRevocation).where(TokenRevocation.created_at <= func.now() - revocation_window())
+    ).rowcount
+    db.commit()
+    return deleted
+
+
+class TokenVersionRegistry:
+    """
+    Revocaciones recientes para el modo claims-only: user_id -> token_version
+    mínimo exigido, o None si el usuario se borró.
+
+    Se arma desde token_revocations (triggers en users), solo con las filas
+    dentro de la vida de un access token: un token emitido antes de una
+    revocación más vieja ya expiró. Cada recarga lee unas pocas filas, sin
+    importar el tamaño de users. Se recarga cada `refresh_seconds`; un commit
+    local que cambia usuarios fuerza la recarga en el siguiente acceso.
+
+    - recarga fallida (DB caída) => se loguea y se sigue con el mapa anterior
+    """
+
+    def __init__(self, *, refresh_seconds: float, session_factory: Callable[[], Session]) -> None:
+        self.refresh_seconds = refresh_seconds
+        self._session_factory = session_factory
+        self._map: dict[int, int | None] = {}
+        self._loaded_at: float | None = None
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def current(self, user_id: int) -> int | None:
+        """token_version mínimo; None => usuario borrado (token revocado)."""
+        self._maybe_refresh()
+        return self._map.get(user_id, 0)
+
+    def invalidate(self) -> None:
+        self._generation += 1
+        if self._loaded_at is not None:
+            self._loaded_at = float("-inf")
+
+    def refresh(self) -> None:
+        started = time.monotonic()
+        generation = self._generation
+
+        with self._session_factory() as db:
+            rows = db.execute(
+                select(TokenRevocation.user_id, TokenRevocation.token_version)
+                .where(TokenRevocation.created_at > func.now() - revocation_window())
+                .order_by(TokenRevocation.id)
+            ).all()
+
+        revoked: dict[int, int | None] = {}
+        for user_id, version in rows:
+            # Borrado => definitivo; si no, gana el token_version más alto
+            if version is None or revoked.get(user_id, 0) is None:
+                revoked[user_id] = None
+            else:
+                revoked[user_id] = max(version, revoked.get(user_id, 0))
+
+        # swap atómico (los lectores ven el mapa viejo o el nuevo, nunca mezcla)
+        self._map = revoked
+        # Invalidado durante la carga => el mapa ya nació viejo
+        self._loaded_at = started if generation == self._generation else float("-inf")
+
+    def _maybe_refresh(self) -> None:
+        loaded_at = self._loaded_at
+        if loaded_at is not None and time.monotonic() - loaded_at < self.refresh_seconds:
+            return
+
+        if loaded_at is None:
+            # Primera carga: hay que esperar
+            with self._lock:
+                if self._loaded_at is None:
+                    self.refresh()
+            return
+
+        # Recarga en curso en otro hilo => se sirve el mapa anterior
+        if self._lock.acquire(blocking=False):
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("No se pudo recargar token_version; se mantiene el mapa anterior")
+            finally:
+                self._lock.release()
+
+
+token_version_registry = TokenVersionRegistry(
+    refresh_seconds=settings.TOKEN_VERSION_REFRESH_SECONDS,
+    session_factory=SessionLocal,
+)
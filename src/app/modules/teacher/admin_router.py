@@ -1,14 +1,25 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+from datetime import datetime
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
-from app.models.user import User
+from app.core.errors import AppError
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.responses import ORJSONResponse, model_response
+from app.modules.auth.principal import Principal
 from app.modules.auth.dependencies import require_roles
+from app.modules.teacher.languages import parse_language_filter
 from app.modules.teacher.schemas import TeacherProfileListResponse
 from app.modules.teacher.service import TeacherService
-from app.modules.teacher.schemas import TeacherProfileResponse
+from app.modules.teacher.schemas import (
+    TeacherBulkModerationRequest,
+    TeacherBulkModerationResponse,
+    TeacherProfileResponse,
+)
 
 
 router = APIRouter(
@@ -18,14 +29,67 @@ router = APIRouter(
 
 @router.get("", response_model=TeacherProfileListResponse, operation_id="admin_list_teacher_profiles")
 def list_teacher_profiles(
-    status: str | None = None,
-    limit: int = 50,
-    offset: int = 0,
+    status: list[str] | None = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=200),
+    offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None, max_length=256),
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+    total_mode: Literal["exact", "estimate", "none"] = "exact",
+    language: list[str] | None = Query(default=None),
+    language_match: Literal["any", "all"] = "any",
     db: Session = Depends(get_db),
-    _: User = Depends(require_roles("ADMIN")),
+    _: Principal = Depends(require_roles("ADMIN")),
 ) -> TeacherProfileListResponse:
-    items, total = TeacherService().admin_list_profiles(db, status=status, limit=limit, offset=offset)
-    return TeacherProfileListResponse(items=items, total=total, limit=limit, offset=offset)
+    # status repetible (?status=IN_REVIEW&status=PAUSED) o separado por comas
+    if cursor is not None and offset:
+        raise AppError("No se puede combinar cursor y offset")
+    after_id = decode_cursor(cursor, int)[0] if cursor is not None else None
+
+    items, total = TeacherService().admin_list_profiles(
+        db,
+        status=status,
+        limit=limit + 1,
+        offset=offset,
+        created_from=created_from,
+        created_to=created_to,
+        after_id=after_id,
+        total_mode=total_mode,
+        languages=parse_language_filter(language),
+        language_match=language_match,
+    )
+    next_cursor = encode_cursor(items[limit - 1]["id"]) if len(items) > limit else None
+    # items = dicts con las columnas de TeacherProfilePublic: JSON directo, sin modelos por item
+    return ORJSONResponse(
+        {
+            "items": items[:limit],
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+            "next_cursor": next_cursor,
+        }
+    )
+
+
+@router.post(
+    "/bulk",
+    response_model=TeacherBulkModerationResponse,
+    operation_id="admin_bulk_moderate_teacher_profiles",
+)
+def bulk_moderate_teacher_profiles(
+    payload: TeacherBulkModerationRequest,
+    db: Session = Depends(get_db),
+    _: Principal = Depends(require_roles("ADMIN")),
+) -> TeacherBulkModerationResponse:
+    """Aprueba / pausa muchos perfiles en una transacción; resultado por id (transiciones inválidas no abortan el resto)."""
+    items = TeacherService().admin_bulk_set_status(db, profile_ids=payload.ids, action=payload.action)
+    return ORJSONResponse(
+        {
+            "action": payload.action,
+            "updated": sum(item["result"] == "updated" for item in items),
+            "items": items,
+        }
+    )
 
 
 @router.post(
@@ -36,10 +100,10 @@ def list_teacher_profiles(
 def approve_teacher_profile(
     teacher_profile_id: int,
     db: Session = Depends(get_db),
-    _: User = Depends(require_roles("ADMIN")),
+    _: Principal = Depends(require_roles("ADMIN")),
 ) -> TeacherProfileResponse:
     profile = TeacherService().admin_set_status(db, profile_id=teacher_profile_id, action="approve")
-    return TeacherProfileResponse.from_orm_profile(profile)
+    return model_response(TeacherProfileResponse.from_orm_profile(profile))
 
 
 @router.post(
@@ -50,7 +114,7 @@ def approve_teacher_profile(
 def pause_teacher_profile(
     teacher_profile_id: int,
     db: Session = Depends(get_db),
-    _: User = Depends(require_roles("ADMIN")),
+    _: Principal = Depends(require_roles("ADMIN")),
 ) -> TeacherProfileResponse:
     profile = TeacherService().admin_set_status(db, profile_id=teacher_profile_id, action="pause")
-    return TeacherProfileResponse.from_orm_profile(profile)
\ No newline at end of file
+    return model_response(TeacherProfileResponse.from_orm_profile(profile))
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import threading
+from typing import Callable, Hashable, TypeVar
+
+from app.config.settings import settings
+from app.core.cache import TTLCache
+from app.core.enums import TeacherProfileStatus
+from app.modules.teacher import events
+
+V = TypeVar("V")
+
+# Snapshots (schemas pydantic, nunca objetos ORM) de las lecturas de TeacherService.
+# El perfil propio (GET /teacher/me/profile) no se cachea: su ETag es el token de
+# If-Match y un snapshot viejo en otro worker terminaría en 304/412 equivocados.
+public_list_cache: TTLCache[tuple, tuple] = TTLCache(
+    maxsize=settings.TEACHER_CACHE_MAX_ENTRIES,
+    ttl=settings.TEACHER_CACHE_TTL_SECONDS,
+)
+# Clave: (statuses, ...resto de parámetros); statuses vacío => todos
+admin_list_cache: TTLCache[tuple, tuple] = TTLCache(
+    maxsize=settings.TEACHER_CACHE_MAX_ENTRIES,
+    ttl=settings.TEACHER_CACHE_TTL_SECONDS,
+)
+
+# Se incrementa en cada invalidación: una lectura que empezó antes no guarda su resultado
+_generation = 0
+_generation_lock = threading.Lock()
+
+
+def cached(cache: TTLCache, key: Hashable, loader: Callable[[], V]) -> V:
+    value = cache.get(key)
+    if value is not None:
+        return value
+
+    generation = _generation
+    value = loader()
+    if value is not None and generation == _generation:
+        cache.set(key, value)
+    return value
+
+
+def stats() -> dict:
+    return {
+        "public_list": public_list_cache.stats(),
+        "admin_list": admin_list_cache.stats(),
+    }
+
+
+@events.subscribe
+def _invalidate(changes: list[events.ProfileChange] | None) -> None:
+    global _generation
+    with _generation_lock:
+        _generation += 1
+
+    if changes is None:
+        public_list_cache.clear()
+        admin_list_cache.clear()
+        return
+
+    touched: set[TeacherProfileStatus] = set()
+    for change in changes:
+        touched |= change.statuses
+
+    # El listado público solo ve APPROVED (entrar o salir de APPROVED lo cambia)
+    if TeacherProfileStatus.APPROVED in touched:
+        public_list_cache.clear()
+    admin_list_cache.pop_where(lambda key: not key[0] or not touched.isdisjoint(key[0]))
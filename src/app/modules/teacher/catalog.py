@@ -0,0 +1,374 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Iterable
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from app.core.database import SessionLocal
+from app.core.enums import TeacherProfileStatus
+from app.modules.teacher import events
+from app.modules.teacher.models import TeacherProfile
+from app.modules.teacher.service import PUBLIC_LIST_COLUMNS
+
+logger = logging.getLogger("app.teacher.catalog")
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogEntry:
+    """Lo necesario para responder /public/teachers sin ir a la DB."""
+    id: int
+    bio: str
+    languages: tuple[str, ...]
+    photo_url: str | None
+    created_at: datetime
+    updated_at: datetime | None = None
+    photo_hash: str | None = None
+
+
+def _sort_key(entry: CatalogEntry) -> tuple[int, int]:
+    # Orden público: created_at DESC, id DESC (en microsegundos, sin floats)
+    delta = entry.created_at - _EPOCH
+    micros = (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+    return -micros, -entry.id
+
+
+class _CatalogState:
+    """
+    Índice de un snapshot del catálogo.
+
+    - Cada perfil ocupa un slot (posición en `entries`); un cambio crea un slot
+      nuevo y deja tombstone en el anterior (compactación por umbral).
+    - Postings por idioma = bitmaps sobre slots en un int de Python: AND/OR y
+      conteos (`bit_count`) corren en C. Son pocos idiomas y densos; el texto
+      libre (q) no se indexa aquí: va a la DB (tsvector, mismo stemming que /search).
+    - `order` = slots vivos ordenados por la clave pública, para paginar.
+    """
+
+    def __init__(self, entries: Iterable[CatalogEntry]) -> None:
+        self.entries: list[CatalogEntry | None] = []
+        self.slot_by_id: dict[int, int] = {}
+        self.order: list[int] = []
+        self.order_keys: list[tuple[int, int]] = []
+        self.tombstones = 0
+
+        by_language: dict[str, array] = {}
+        for entry in sorted(entries, key=_sort_key):
+            slot = len(self.entries)
+            self.entries.append(entry)
+            self.slot_by_id[entry.id] = slot
+            self.order.append(slot)
+            self.order_keys.append(_sort_key(entry))
+            for code in entry.languages:
+                by_language.setdefault(code, array("I")).append(slot)
+
+        size = len(self.entries)
+        self.alive = _bitmap(range(size), size)
+        self.by_language = {code: _bitmap(slots, size) for code, slots in by_language.items()}
+
+    def __len__(self) -> int:
+        return len(self.slot_by_id)
+
+    def live_entries(self) -> Iterable[CatalogEntry]:
+        return (self.entries[slot] for slot in self.order)
+
+    def upsert(self, entry: CatalogEntry) -> None:
+        self.remove(entry.id)
+
+        slot = len(self.entries)
+        bit = 1 << slot
+        self.entries.append(entry)
+        self.slot_by_id[entry.id] = slot
+        self.alive |= bit
+        for code in entry.languages:
+            self.by_language[code] = self.by_language.get(code, 0) | bit
+
+        key = _sort_key(entry)
+        i = bisect_right(self.order_keys, key)
+        self.order_keys.insert(i, key)
+        self.order.insert(i, slot)
+
+    def remove(self, profile_id: int) -> None:
+        slot = self.slot_by_id.pop(profile_id, None)
+        if slot is None:
+            return
+
+        entry = self.entries[slot]
+        self.entries[slot] = None
+        self.alive &= ~(1 << slot)
+        self.tombstones += 1
+
+        # Las postings conservan el bit muerto: `alive` lo filtra en cada query
+        i = bisect_right(self.order_keys, _sort_key(entry)) - 1
+        del self.order_keys[i]
+        del self.order[i]
+
+    def candidates(self, *, languages: list[str], match: str) -> tuple[int, int]:
+        """(bitmap sin filtro de idioma, bitmap con todos los filtros)."""
+        base = self.alive
+        if not languages:
+            return base, base
+        if match == "all":
+            matched = base
+            for code in languages:
+                matched &= self.by_language.get(code, 0)
+            return base, matched
+
+        any_language = 0
+        for code in languages:
+            any_language |= self.by_language.get(code, 0)
+        return base, base & any_language
+
+    def page(self, bitmap: int, *, limit: int, offset: int, after: tuple[datetime, int] | None) -> list[CatalogEntry]:
+        start = 0
+        if after is not None:
+            after_created, after_id = after
+            start = bisect_right(
+                self.order_keys,
+                _sort_key(CatalogEntry(after_id, "", (), None, after_created)),
+            )
+
+        # Sin filtros => `order` ya es la respuesta
+        if bitmap == self.alive:
+            slots = self.order[start + offset:start + offset + limit]
+            return [self.entries[slot] for slot in slots]
+
+        # Test de bit O(1) sobre bytes (un shift por slot sobre un int grande sería O(n))
+        bits = bitmap.to_bytes((len(self.entries) + 7) // 8 or 1, "little")
+        result: list[CatalogEntry] = []
+        skip = offset
+        for slot in self.order[start:] if start else self.order:
+            if not bits[slot >> 3] >> (slot & 7) & 1:
+                continue
+            if skip:
+                skip -= 1
+                continue
+            result.append(self.entries[slot])
+            if len(result) == limit:
+                break
+        return result
+
+    def facets(self, base: int, matched: int) -> dict:
+        counts = {code: (base & bitmap).bit_count() for code, bitmap in self.by_language.items()}
+        return {
+            "total": matched.bit_count(),
+            "languages": dict(sorted(((c, n) for c, n in counts.items() if n), key=lambda kv: (-kv[1], kv[0]))),
+        }
+
+
+def _bitmap(slots: Iterable[int], size: int) -> int:
+    buffer = bytearray((size + 7) // 8)
+    for slot in slots:
+        buffer[slot >> 3] |= 1 << (slot & 7)
+    return int.from_bytes(buffer, "little")
+
+
+class CatalogIndex:
+    """
+    Catálogo público (perfiles APPROVED) en memoria para filtros, facets y orden.
+
+    - Carga completa al arrancar y cada `refresh_seconds` (cambios de otros workers)
+    - Deltas: los commits de este proceso (events.py) marcan ids pendientes; se
+      aplican antes de la siguiente consulta, releyendo solo esos perfiles
+    - Cambios sin ids conocidos (bulk, cascade) => recarga completa
+    - Mientras un hilo sincroniza, el resto sigue respondiendo con el estado
+      actual; una recarga fallida se loguea y se reintenta en la siguiente consulta
+    """
+
+    def __init__(
+        self,
+        *,
+        enabled: bool,
+        refresh_seconds: float,
+        session_factory: Callable[[], Session],
+    ) -> None:
+        self.enabled = enabled
+        self.refresh_seconds = refresh_seconds
+        self._session_factory = session_factory
+
+        self._state = _CatalogState(())
+        self._loaded_at: float | None = None
+        self._pending_ids: set[int] = set()
+        self._generation = 0
+
+        self._lock = threading.Lock()       # protege _state / _pending_ids
+        self._sync_lock = threading.Lock()  # serializa lecturas a la DB
+
+        self.rebuilds = 0
+        self.deltas_applied = 0
+
+    # --- Consultas ---------------------------------------------------------
+
+    def page(
+        self,
+        *,
+        limit: int,
+        offset: int = 0,
+        after: tuple[datetime, int] | None = None,
+        languages: list[str] | None = None,
+        language_match: str = "any",
+    ) -> list[CatalogEntry]:
+        self._sync()
+        with self._lock:
+            _, matched = self._state.candidates(languages=languages or [], match=language_match)
+            return self._state.page(matched, limit=limit, offset=offset, after=after)
+
+    def facets(
+        self,
+        *,
+        languages: list[str] | None = None,
+        language_match: str = "any",
+    ) -> dict:
+        """Total con todos los filtros + conteo por idioma (sin aplicar el filtro de idioma)."""
+        self._sync()
+        with self._lock:
+            base, matched = self._state.candidates(languages=languages or [], match=language_match)
+            return self._state.facets(base, matched)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "size": len(self._state),
+                "slots": len(self._state.entries),
+                "tombstones": self._state.tombstones,
+                "languages": len(self._state.by_language),
+                "pending": len(self._pending_ids),
+                "rebuilds": self.rebuilds,
+                "deltas_applied": self.deltas_applied,
+            }
+
+    # --- Mantenimiento -----------------------------------------------------
+
+    def invalidate(self, changes: list[events.ProfileChange] | None) -> None:
+        if changes is None:
+            self._generation += 1
+            if self._loaded_at is not None:
+                self._loaded_at = float("-inf")
+            return
+        with self._lock:
+            self._pending_ids.update(change.profile_id for change in changes)
+
+    def rebuild(self) -> None:
+        with self._sync_lock:
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        # Los ids pendientes hasta aquí quedan cubiertos por la carga completa
+        with self._lock:
+            ids, self._pending_ids = self._pending_ids, set()
+        started = time.monotonic()
+        generation = self._generation
+
+        try:
+            with self._session_factory() as db:
+                rows = db.execute(
+                    select(*PUBLIC_LIST_COLUMNS).where(TeacherProfile.status == TeacherProfileStatus.APPROVED)
+                ).all()
+        except Exception:
+            self._restore_pending(ids)
+            raise
+        state = _CatalogState(_entry(*row) for row in rows)
+
+        with self._lock:
+            self._state = state
+        # Invalidado durante la carga => el snapshot ya nació viejo
+        self._loaded_at = started if generation == self._generation else float("-inf")
+        self.rebuilds += 1
+        logger.info("Catálogo reconstruido: %s perfiles en %.1fms", len(state), (time.monotonic() - started) * 1000)
+
+    def _apply_pending(self) -> None:
+        with self._lock:
+            ids, self._pending_ids = self._pending_ids, set()
+        if not ids:
+            return
+
+        try:
+            with self._session_factory() as db:
+                rows = db.execute(
+                    select(*PUBLIC_LIST_COLUMNS).where(TeacherProfile.id.in_(ids), TeacherProfile.status == TeacherProfileStatus.APPROVED)
+                ).all()
+        except Exception:
+            self._restore_pending(ids)
+            raise
+
+        with self._lock:
+            state = self._state
+            for profile_id in ids:
+                state.remove(profile_id)
+            for row in rows:
+                state.upsert(_entry(*row))
+            self.deltas_applied += len(ids)
+
+            # Demasiados tombstones => compactar en memoria (sin ir a la DB)
+            if state.tombstones > max(1024, len(state) // 4):
+                self._state = _CatalogState(state.live_entries())
+
+    def _restore_pending(self, ids: set[int]) -> None:
+        # Lectura fallida => los ids vuelven a quedar pendientes para el reintento
+        with self._lock:
+            self._pending_ids |= ids
+
+    def _sync(self) -> None:
+        loaded_at = self._loaded_at
+        stale = loaded_at is None or time.monotonic() - loaded_at >= self.refresh_seconds
+        if not stale and not self._pending_ids:
+            return
+
+        if loaded_at is None:
+            # Primera carga: no hay estado que servir, hay que esperar
+            with self._sync_lock:
+                if self._loaded_at is None:
+                    self._rebuild()
+            return
+
+        # Sincronización en curso en otro hilo => se sirve el estado actual
+        if not self._sync_lock.acquire(blocking=False):
+            return
+        try:
+            if time.monotonic() - self._loaded_at >= self.refresh_seconds:
+                self._rebuild()
+            else:
+                self._apply_pending()
+        except Exception:
+            logger.exception("No se pudo sincronizar el catálogo; se sigue con el estado actual")
+        finally:
+            self._sync_lock.release()
+
+
+def _entry(
+    profile_id: int,
+    bio: str,
+    languages: list[str],
+    photo_url: str | None,
+    created_at: datetime,
+    updated_at: datetime,
+    photo_hash: str | None,
+) -> CatalogEntry:
+    return CatalogEntry(
+        id=profile_id,
+        bio=bio,
+        languages=tuple(languages),
+        photo_url=photo_url,
+        created_at=created_at,
+        updated_at=updated_at,
+        photo_hash=photo_hash,
+    )
+
+
+catalog_index = CatalogIndex(
+    enabled=settings.CATALOG_INDEX_ENABLED,
+    refresh_seconds=settings.CATALOG_REFRESH_SECONDS,
+    session_factory=SessionLocal,
+)
+events.subscribe(catalog_index.invalidate)
@@ -2,9 +2,9 @@ from __future__ import annotations
 
 from fastapi import Depends
 
-from app.models.user import User
+from app.modules.auth.principal import Principal
 from app.modules.auth.dependencies import require_roles
 
 
-def require_teacher(user: User = Depends(require_roles("TEACHER"))) -> User:
+def require_teacher(user: Principal = Depends(require_roles("TEACHER"))) -> Principal:
     return user
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Callable
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.core.enums import TeacherProfileStatus
+from app.models.user import User
+from app.modules.teacher.models import TeacherProfile
+
+logger = logging.getLogger("app.teacher.events")
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileChange:
+    profile_id: int
+    user_id: int
+    # status antes y después del cambio (uno solo si no cambió)
+    statuses: frozenset[TeacherProfileStatus]
+
+
+# Cambios de la transacción; None => no se sabe cuáles (bulk / cascade)
+ProfilesChangedHandler = Callable[[list[ProfileChange] | None], None]
+
+_subscribers: list[ProfilesChangedHandler] = []
+
+_PENDING = "teacher_profiles_pending_changes"
+_PENDING_ALL = "teacher_profiles_pending_all"
+
+# Execution option para UPDATE masivos que informan sus cambios con
+# record_changes (vía RETURNING): no fuerzan la invalidación de "todos"
+TRACKED = "teacher_profiles_changes_tracked"
+
+
+def subscribe(handler: ProfilesChangedHandler) -> ProfilesChangedHandler:
+    """Registra un handler que se llama tras cada commit que toca teacher_profiles."""
+    _subscribers.append(handler)
+    return handler
+
+
+def publish(changes: list[ProfileChange] | None) -> None:
+    for handler in list(_subscribers):
+        try:
+            handler(changes)
+        except Exception:  # un subscriber roto no debe romper el commit
+            logger.exception("Error en subscriber de teacher_profiles")
+
+
+def record_changes(session: Session, changes: list[ProfileChange]) -> None:
+    """Suma cambios conocidos (p.ej. filas de un UPDATE ... RETURNING) a los de la transacción."""
+    pending: dict[int, ProfileChange] = session.info.setdefault(_PENDING, {})
+    for change in changes:
+        _merge(pending, change)
+
+
+def _merge(pending: dict[int, ProfileChange], change: ProfileChange) -> None:
+    previous = pending.get(change.profile_id)
+    if previous is not None:
+        change = ProfileChange(change.profile_id, change.user_id, previous.statuses | change.statuses)
+    pending[change.profile_id] = change
+
+
+# --- Captura de cambios vía ORM --------------------------------------------
+# Perfiles insertados/modificados/borrados con la sesión => cambios exactos.
+# UPDATE/DELETE masivos sobre teacher_profiles, o DELETE de users (cascade en
+# DB, invisible para el ORM) => "todos".
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_profiles(session: Session, _flush_context) -> None:
+    pending: dict[int, ProfileChange] = session.info.setdefault(_PENDING, {})
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if not isinstance(obj, TeacherProfile) or obj.id is None:
+            continue
+        # En after_flush la history aún tiene el valor anterior
+        statuses = {obj.status, *inspect(obj).attrs.status.history.deleted}
+        _merge(pending, ProfileChange(obj.id, obj.user_id, frozenset(s for s in statuses if s is not None)))
+    for obj in session.deleted:
+        if isinstance(obj, User):
+            session.info[_PENDING_ALL] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_profile_writes(orm_execute_state) -> None:
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    if orm_execute_state.execution_options.get(TRACKED):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    if table is None:
+        return
+    if table.name == TeacherProfile.__tablename__ or (
+        orm_execute_state.is_delete and table.name == User.__tablename__
+    ):
+        orm_execute_state.session.info[_PENDING_ALL] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_on_commit(session: Session) -> None:
+    changed_all = session.info.pop(_PENDING_ALL, False)
+    changes = session.info.pop(_PENDING, None)
+
+    if changed_all:
+        publish(None)
+    elif changes:
+        publish(list(changes.values()))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_ALL, None)
+    session.info.pop(_PENDING, None)
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import re
+from typing import Iterable
+
+from app.core.errors import AppError
+
+# ISO 639-1/639-3 (subtag primario BCP 47): "es", "en", "pt", "fil"...
+_LANGUAGE_CODE = re.compile(r"^[a-z]{2,3}$")
+
+
+def normalize_language_code(value: str) -> str:
+    """
+    " ES ", "es-CL", "es_ES" -> "es".
+    Se guarda solo el subtag primario en minúsculas para que el filtro por
+    idioma sea una búsqueda exacta en el índice GIN.
+    """
+    code = value.strip().lower().replace("_", "-").split("-", 1)[0]
+    if not _LANGUAGE_CODE.match(code):
+        raise ValueError(f"Código de idioma inválido: {value!r}")
+    return code
+
+
+def normalize_languages(values: Iterable[str]) -> list[str]:
+    """Normaliza y elimina repetidos (conserva el orden)."""
+    codes: list[str] = []
+    for value in values:
+        code = normalize_language_code(value)
+        if code not in codes:
+            codes.append(code)
+    return codes
+
+
+def parse_language_filter(values: list[str] | None) -> list[str]:
+    """Query `?language=es&language=en` (o `es,en`) -> códigos normalizados; inválido => 400."""
+    if not values:
+        return []
+    try:
+        return normalize_languages(part for value in values for part in value.split(",") if part.strip())
+    except ValueError as exc:
+        raise AppError(str(exc)) from None
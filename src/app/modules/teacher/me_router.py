@@ -1,14 +1,22 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import hashlib
+import tempfile
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
+from app.config.settings import settings
 from app.core.database import get_db
-from app.models.user import User
+from app.core.errors import AppError
+from app.core.http_cache import cache_headers, if_match_versions, is_not_modified, not_modified, version_etag
+from app.core.responses import model_response
+from app.modules.auth.principal import Principal
+from app.modules.teacher import photos
 from app.modules.teacher.dependencies import require_teacher
 from app.modules.teacher.schemas import (
     TeacherProfileCreate,
-    TeacherProfilePublic,
     TeacherProfileResponse,
     TeacherProfileUpdate,
 )
@@ -20,7 +28,8 @@ router = APIRouter(prefix="/teacher", tags=["teacher-me"])
 
 @router.get("/me/profile", response_model=TeacherProfileResponse, operation_id="teacher_get_my_profile")
 def get_my_profile(
-    user: User = Depends(require_teacher),
+    request: Request,
+    user: Principal = Depends(require_teacher),
     db: Session = Depends(get_db),
 ) -> TeacherProfileResponse:
     service = TeacherService()
@@ -28,24 +37,20 @@ def get_my_profile(
     if not profile:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Perfil docente no existe")
 
-    return TeacherProfileResponse(
-        profile=TeacherProfilePublic(
-            id=profile.id,
-            user_id=profile.user_id,
-            bio=profile.bio,
-            languages=profile.languages,
-            photo_url=profile.photo_url,
-            status=profile.status,
-            created_at=profile.created_at,
-            updated_at=profile.updated_at,
-        )
-    )
+    # version sube en cada escritura; el mismo ETag sirve para If-Match en PATCH
+    etag = version_etag(profile.version)
+    headers = cache_headers(etag=etag, last_modified=profile.updated_at, cache_control="private, no-cache")
+    if is_not_modified(request, etag=etag, last_modified=profile.updated_at):
+        return not_modified(headers)
+
+    # Snapshot ya validado (TeacherProfilePublic): se serializa tal cual
+    return model_response(TeacherProfileResponse(profile=profile), headers=headers)
 
 
 @router.post("/me/profile", response_model=TeacherProfileResponse, operation_id="teacher_create_my_profile")
 def create_my_profile(
     payload: TeacherProfileCreate,
-    user: User = Depends(require_teacher),
+    user: Principal = Depends(require_teacher),
     db: Session = Depends(get_db),
 ) -> TeacherProfileResponse:
     service = TeacherService()
@@ -57,28 +62,98 @@ def create_my_profile(
         photo_url=payload.photo_url,
     )
 
-    return TeacherProfileResponse(
-        profile=TeacherProfilePublic(
-            id=profile.id,
-            user_id=profile.user_id,
-            bio=profile.bio,
-            languages=profile.languages,
-            photo_url=profile.photo_url,
-            status=profile.status,
-            created_at=profile.created_at,
-            updated_at=profile.updated_at,
-        )
-    )
+    # Una sola validación (desde la fila ORM); el Response evita revalidar el modelo
+    response = TeacherProfileResponse.from_orm_profile(profile)
+    return model_response(response, headers={"ETag": version_etag(response.profile.version)})
 
 
 @router.patch("/me/profile", response_model=TeacherProfileResponse, operation_id="teacher_me_profile_patch")
 def patch_my_profile(
     payload: TeacherProfileUpdate,
-    user: User = Depends(require_teacher),
+    request: Request,
+    user: Principal = Depends(require_teacher),
+    db: Session = Depends(get_db),
+):
+    """If-Match (ETag de GET) opcional: si otra sesión editó antes => 412 en vez de pisar sus cambios."""
+    profile = TeacherService().update_my_profile(
+        db,
+        user_id=user.id,
+        payload=payload,
+        expected_versions=if_match_versions(request),
+    )
+    return model_response(TeacherProfileResponse(profile=profile), headers={"ETag": version_etag(profile.version)})
+
+
+@router.post("/me/profile/photo", response_model=TeacherProfileResponse, operation_id="teacher_upload_my_photo")
+async def upload_my_photo(
+    request: Request,
+    user: Principal = Depends(require_teacher),
     db: Session = Depends(get_db),
 ):
-    profile = TeacherService().update_my_profile(db, user_id=user.id, payload=payload)
-    return TeacherProfileResponse.from_orm_profile(profile)
+    """
+    Body crudo (image/jpeg, image/png o image/webp) de hasta PHOTO_MAX_BYTES.
+    El original y sus miniaturas (pool de procesos) se guardan por sha256: volver
+    a subir la misma foto no re-procesa nada. If-Match opcional, como en PATCH.
+    """
+    if not photos.PILLOW_AVAILABLE:
+        raise AppError("Subida de fotos no disponible en este servidor", status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type not in photos.ACCEPTED_CONTENT_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Formato no soportado (usa image/jpeg, image/png o image/webp)",
+        )
+    declared = request.headers.get("content-length", "")
+    if declared.isdigit() and int(declared) > settings.PHOTO_MAX_BYTES:
+        raise HTTPException(status_code=status.HTTP_413_CONTENT_TOO_LARGE, detail="Foto demasiado grande")
+
+    # 404 / 409 / 412 antes de leer y procesar la foto (el UPDATE final vuelve a verificar)
+    service = TeacherService()
+    expected_versions = if_match_versions(request)
+    await run_in_threadpool(service.assert_profile_editable, db, user_id=user.id, expected_versions=expected_versions)
+
+    sizes = tuple(sorted(settings.PHOTO_THUMBNAIL_SIZES))
+    # Pasa a disco después de 1 MiB => lecturas/escrituras en el threadpool, no en el event loop
+    spool = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+    try:
+        digest = hashlib.sha256()
+        size = 0
+        async for chunk in request.stream():
+            size += len(chunk)
+            if size > settings.PHOTO_MAX_BYTES:
+                raise HTTPException(status_code=status.HTTP_413_CONTENT_TOO_LARGE, detail="Foto demasiado grande")
+            digest.update(chunk)
+            await run_in_threadpool(spool.write, chunk)
+        if size == 0:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Body vacío")
+        photo_hash = digest.hexdigest()
+
+        if not await run_in_threadpool(photos.is_stored, photo_hash, sizes):
+            data = await run_in_threadpool(_read_spool, spool)
+            try:
+                thumbnails = await photos.make_thumbnails(data, sizes)
+            except ValueError:
+                raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail="Imagen inválida") from None
+            await run_in_threadpool(
+                photos.store_photo, photo_hash, spool, content_type=content_type, thumbnails=thumbnails
+            )
+    finally:
+        await run_in_threadpool(spool.close)
+
+    profile = await run_in_threadpool(
+        service.set_my_photo,
+        db,
+        user_id=user.id,
+        photo_hash=photo_hash,
+        expected_versions=expected_versions,
+    )
+    return model_response(TeacherProfileResponse(profile=profile), headers={"ETag": version_etag(profile.version)})
+
+
+def _read_spool(spool) -> bytes:
+    spool.seek(0)
+    return spool.read()
 
 
 @router.post(
@@ -87,9 +162,10 @@ def patch_my_profile(
     operation_id="teacher_submit_my_profile",
 )
 def submit_my_profile(
-    user: User = Depends(require_teacher),
+    user: Principal = Depends(require_teacher),
     db: Session = Depends(get_db),
 ) -> TeacherProfileResponse:
     profile = TeacherService().submit_my_profile(db, user_id=user.id)
 
-    return TeacherProfileResponse.from_orm_profile(profile)
\ No newline at end of file
+    response = TeacherProfileResponse.from_orm_profile(profile)
+    return model_response(response, headers={"ETag": version_etag(response.profile.version)})
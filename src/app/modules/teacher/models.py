@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import ForeignKey,Text, DateTime, func, JSON
+from sqlalchemy import ForeignKey,Text, String, DateTime, func, Index, text, BigInteger, Computed, Integer, FetchedValue
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from app.core.base import Base
 from sqlalchemy import Enum as SAEnum
 from app.core.enums import TeacherProfileStatus
@@ -16,6 +17,24 @@ class Teacher(Base):
 
 class TeacherProfile(Base):
     __tablename__ = "teacher_profiles"
+    __table_args__ = (
+        # Listado público: solo APPROVED, orden (created_at DESC, id DESC) => keyset sin sort
+        Index(
+            "ix_teacher_profiles_public_order",
+            text("created_at DESC"),
+            text("id DESC"),
+            postgresql_where=text("status = 'APPROVED'"),
+        ),
+        # Listado admin por status (filtro + keyset por id)
+        Index("ix_teacher_profiles_status_id", "status", "id"),
+        # Filtro por idioma: languages ?| / @> (códigos normalizados, ver languages.py)
+        Index("ix_teacher_profiles_languages", "languages", postgresql_using="gin"),
+        # Búsqueda full-text sobre bio
+        Index("ix_teacher_profiles_search_vector", "search_vector", postgresql_using="gin"),
+    )
+    # INSERT/UPDATE ... RETURNING de lo que genera la DB (id, created_at, updated_at, version)
+    # => tras el commit no hace falta refresh
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True)
 
@@ -28,8 +47,21 @@ class TeacherProfile(Base):
     )
 
     bio: Mapped[str] = mapped_column(Text, nullable=False, default="")
-    languages: Mapped[list[str]] = mapped_column(JSON, nullable=False, default=list)
+    languages: Mapped[list[str]] = mapped_column(JSONB, nullable=False, default=list)
     photo_url: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # sha256 de la foto subida => URLs de sus miniaturas (ver photos.py)
+    photo_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+
+    # Generada por Postgres (stems es + en); deferred => no viaja en los SELECT normales
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('spanish'::regconfig, coalesce(bio, '')) || "
+            "to_tsvector('english'::regconfig, coalesce(bio, ''))",
+            persisted=True,
+        ),
+        deferred=True,
+    )
 
     status: Mapped[TeacherProfileStatus] = mapped_column(
         SAEnum(TeacherProfileStatus, name="teacher_profile_status"),
@@ -49,5 +81,24 @@ class TeacherProfile(Base):
         nullable=False,
     )
 
+    # Se incrementa (trigger en DB) en cada UPDATE => ETag / If-Match del perfil
+    version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default=text("1"),
+        server_onupdate=FetchedValue(),
+    )
+
     # relación ORM 1:1
-    user = relationship("User", back_populates="teacher_profile", uselist=False)
\ No newline at end of file
+    user = relationship("User", back_populates="teacher_profile", uselist=False)
+
+
+class TeacherProfileStatusCount(Base):
+    """Total de perfiles por status, mantenido por triggers en teacher_profiles (solo lectura)."""
+    __tablename__ = "teacher_profile_status_counts"
+
+    status: Mapped[TeacherProfileStatus] = mapped_column(
+        SAEnum(TeacherProfileStatus, name="teacher_profile_status"),
+        primary_key=True,
+    )
+    total: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default=text("0"))
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import importlib.util
+import io
+import logging
+import os
+import re
+import shutil
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import BinaryIO
+
+from app.config.settings import settings
+from app.core.process_pool import BoundedProcessPool
+
+logger = logging.getLogger("app.teacher.photos")
+
+# El contenido no cambia nunca bajo una misma key (hash) => cache "para siempre"
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Pillow es opcional (extra "photos"): sin él, la subida responde 503
+PILLOW_AVAILABLE = importlib.util.find_spec("PIL") is not None
+
+ACCEPTED_CONTENT_TYPES = frozenset({"image/jpeg", "image/png", "image/webp"})
+
+# "<sha256>/original" | "<sha256>/<lado>.jpg"
+_KEY = re.compile(r"^[0-9a-f]{64}/(original|[0-9]+\.jpg)$")
+
+# Tope de decodificación (bombas de descompresión: PNG chico => bitmap enorme).
+# Se verifica explícitamente: DecompressionBombError de Pillow salta recién al doble
+_MAX_PIXELS = 40_000_000
+
+
+def original_key(photo_hash: str) -> str:
+    return f"{photo_hash}/original"
+
+
+def variant_key(photo_hash: str, size: int) -> str:
+    return f"{photo_hash}/{size}.jpg"
+
+
+def is_valid_key(key: str) -> bool:
+    return _KEY.match(key) is not None
+
+
+def photo_url(photo_hash: str, size: int) -> str:
+    return f"{settings.PHOTO_PUBLIC_BASE_URL.rstrip('/')}/{variant_key(photo_hash, size)}"
+
+
+def list_photo_url(photo_hash: str) -> str:
+    """Variante más chica: la que referencian los listados."""
+    return photo_url(photo_hash, min(settings.PHOTO_THUMBNAIL_SIZES))
+
+
+def profile_photo_url(photo_hash: str) -> str:
+    """Variante más grande: la que se guarda en photo_url (nunca el original)."""
+    return photo_url(photo_hash, max(settings.PHOTO_THUMBNAIL_SIZES))
+
+
+# --- Almacenamiento ----------------------------------------------------------
+
+
+class PhotoStorage(ABC):
+    """
+    Blobs por key (content-addressed: misma key => mismos bytes).
+    Implementaciones: directorio local o object store (S3 y compatibles).
+    """
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        ...
+
+    @abstractmethod
+    def put(self, key: str, data: BinaryIO, *, content_type: str) -> None:
+        """Escribe desde un file object (en streaming, sin cargarlo entero)."""
+
+
+class LocalPhotoStorage(PhotoStorage):
+    def __init__(self, root: str) -> None:
+        self.root = Path(root)
+
+    def path(self, key: str) -> Path:
+        if not is_valid_key(key):
+            raise ValueError(f"key inválida: {key!r}")
+        return self.root / key
+
+    def exists(self, key: str) -> bool:
+        return self.path(key).is_file()
+
+    def put(self, key: str, data: BinaryIO, *, content_type: str) -> None:
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Temporal + os.replace: un lector nunca ve un archivo a medias
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            shutil.copyfileobj(data, f)
+        os.replace(tmp_path, path)
+
+
+class S3PhotoStorage(PhotoStorage):
+    """Object store (s3://bucket/prefijo). Requiere `boto3`; credenciales del entorno."""
+
+    def __init__(self, url: str) -> None:
+        try:
+            import boto3
+            from botocore.exceptions import ClientError
+        except ImportError as exc:  # pragma: no cover
+            raise RuntimeError("PHOTO_STORAGE_BACKEND_URL requiere el paquete 'boto3'") from exc
+
+        bucket, _, prefix = url.removeprefix("s3://").partition("/")
+        self._client = boto3.client("s3")
+        self._client_error = ClientError
+        self.bucket = bucket
+        self.prefix = f"{prefix.strip('/')}/" if prefix.strip("/") else ""
+
+    def exists(self, key: str) -> bool:
+        try:
+            self._client.head_object(Bucket=self.bucket, Key=self.prefix + key)
+        except self._client_error as exc:
+            if exc.response.get("Error", {}).get("Code") in {"404", "NoSuchKey", "NotFound"}:
+                return False
+            raise
+        return True
+
+    def put(self, key: str, data: BinaryIO, *, content_type: str) -> None:
+        self._client.upload_fileobj(
+            data,
+            self.bucket,
+            self.prefix + key,
+            ExtraArgs={"ContentType": content_type, "CacheControl": IMMUTABLE_CACHE_CONTROL},
+        )
+
+
+def _build_storage(url: str | None) -> PhotoStorage:
+    if not url:
+        return LocalPhotoStorage(settings.PHOTO_STORAGE_DIR)
+    if url.startswith("s3://"):
+        return S3PhotoStorage(url)
+    raise RuntimeError(f"PHOTO_STORAGE_BACKEND_URL no soportada: {url}")
+
+
+def is_stored(photo_hash: str, sizes: tuple[int, ...]) -> bool:
+    """Original y todas las variantes configuradas (si cambian los lados, se regeneran)."""
+    keys = [variant_key(photo_hash, size) for size in sizes] + [original_key(photo_hash)]
+    return all(photo_storage.exists(key) for key in keys)
+
+
+def store_photo(photo_hash: str, original: BinaryIO, *, content_type: str, thumbnails: dict[int, bytes]) -> None:
+    for size, data in thumbnails.items():
+        photo_storage.put(variant_key(photo_hash, size), io.BytesIO(data), content_type="image/jpeg")
+    original.seek(0)
+    photo_storage.put(original_key(photo_hash), original, content_type=content_type)
+    logger.info("Foto %s guardada con %s miniaturas", photo_hash, len(thumbnails))
+
+
+# --- Miniaturas ---------------------------------------------------------------
+
+
+def render_thumbnails(data: bytes, sizes: tuple[int, ...]) -> dict[int, bytes]:
+    """
+    JPEG cuadrados (recorte centrado) por lado. Corre en el pool de procesos.
+    Imagen ilegible => ValueError (pickleable, sin depender de las clases de Pillow).
+    """
+    try:
+        from PIL import Image, ImageOps
+    except ImportError as exc:  # pragma: no cover
+        raise RuntimeError("Las fotos de perfil requieren el paquete 'Pillow'") from exc
+
+    Image.MAX_IMAGE_PIXELS = _MAX_PIXELS
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            # Solo lee el header: se rechaza antes de decodificar el bitmap
+            if image.width * image.height > _MAX_PIXELS:
+                raise ValueError(f"imagen inválida: más de {_MAX_PIXELS} píxeles")
+            # JPEG: decodifica ya reducido (DCT scaling), mucho menos CPU y RAM
+            image.draft("RGB", (max(sizes), max(sizes)))
+            image = ImageOps.exif_transpose(image).convert("RGB")
+            thumbnails = {}
+            for size in sizes:
+                thumbnail = ImageOps.fit(image, (size, size), Image.Resampling.LANCZOS)
+                buffer = io.BytesIO()
+                thumbnail.save(buffer, "JPEG", quality=85, optimize=True, progressive=True)
+                thumbnails[size] = buffer.getvalue()
+            return thumbnails
+    except (OSError, SyntaxError, Image.DecompressionBombError) as exc:
+        raise ValueError(f"imagen inválida: {exc}") from None
+
+
+async def make_thumbnails(data: bytes, sizes: tuple[int, ...]) -> dict[int, bytes]:
+    """render_thumbnails en el pool (await, sin ocupar un hilo por foto)."""
+    return await thumbnail_pool.run_async(render_thumbnails, data, sizes)
+
+
+photo_storage = _build_storage(settings.PHOTO_STORAGE_BACKEND_URL)
+
+# Pool chico y propio: las subidas son raras y no deben competir con argon2 por los cores
+thumbnail_pool = BoundedProcessPool(
+    name="thumbnails",
+    workers=settings.PHOTO_WORKERS,
+    max_queue=settings.PHOTO_MAX_QUEUE,
+)
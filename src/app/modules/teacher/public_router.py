@@ -1,32 +1,134 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, Query
+from datetime import datetime
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.errors import AppError
+from app.core.http_cache import cache_headers, is_not_modified, not_modified
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.responses import ORJSONResponse
+from app.modules.teacher.catalog import catalog_index
+from app.modules.teacher.languages import parse_language_filter
 from app.modules.teacher.service import TeacherService
-from app.modules.teacher.schemas import PublicTeachersResponse, PublicTeacherItem
+from app.modules.teacher.schemas import PublicTeacherFacetsResponse, PublicTeachersResponse, PublicTeacherItem
+from app.modules.teacher.snapshot import SnapshotPage, catalog_snapshot, public_page_etag
 
 router = APIRouter(prefix="/public", tags=["public-teachers"])
 
 
 @router.get("/teachers", response_model=PublicTeachersResponse, operation_id="public_teachers_list")
 def public_teachers_list(
+    request: Request,
     db: Session = Depends(get_db),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None, max_length=256),
+    language: list[str] | None = Query(default=None),
+    language_match: Literal["any", "all"] = "any",
 ) -> PublicTeachersResponse:
-    profiles = TeacherService().list_public_approved_profiles(db, limit=limit, offset=offset)
-
-    items = [
-        PublicTeacherItem(
-            teacher_profile_id=p.id,
-            bio=p.bio,
-            languages=p.languages,
-            photo_url=p.photo_url,
-            display_name=None,  # si luego hay display_name en User, se completa aquí
+    # cursor (recomendado) u offset (compatibilidad); no ambos
+    if cursor is not None and offset:
+        raise AppError("No se puede combinar cursor y offset")
+    after = decode_cursor(cursor, datetime, int) if cursor is not None else None
+
+    languages = parse_language_filter(language)
+
+    # Páginas calientes (sin filtros): bytes ya serializados/comprimidos compartidos por los workers
+    if not languages:
+        page = catalog_snapshot.lookup(limit=limit, offset=offset, cursor=cursor)
+        if page is not None:
+            return _snapshot_response(request, page)
+
+    # Una fila extra para saber si hay página siguiente
+    if catalog_index.enabled:
+        profiles = catalog_index.page(
+            limit=limit + 1,
+            offset=offset,
+            after=after,
+            languages=languages,
+            language_match=language_match,
+        )
+    else:
+        profiles = TeacherService().list_public_approved_profiles(
+            db,
+            limit=limit + 1,
+            offset=offset,
+            after=after,
+            languages=languages,
+            language_match=language_match,
         )
-        for p in profiles
-    ]
+    has_more = len(profiles) > limit
+    profiles = profiles[:limit]
+
+    etag = public_page_etag(profiles, has_more)
+    headers = cache_headers(etag=etag)
+    if is_not_modified(request, etag=etag):
+        return not_modified(headers)
+
+    # Filas del catálogo/DB: JSON directo, sin construir ni revalidar modelos por item
+    next_cursor = encode_cursor(profiles[-1].created_at, profiles[-1].id) if has_more else None
+    return ORJSONResponse(
+        {"items": [PublicTeacherItem.payload(p) for p in profiles], "next_cursor": next_cursor},
+        headers=headers,
+    )
+
+
+@router.get("/teachers/facets", response_model=PublicTeacherFacetsResponse, operation_id="public_teachers_facets")
+def public_teachers_facets(
+    db: Session = Depends(get_db),
+    q: str | None = Query(default=None, max_length=200),
+    language: list[str] | None = Query(default=None),
+    language_match: Literal["any", "all"] = "any",
+) -> PublicTeacherFacetsResponse:
+    """Total y conteo por idioma de perfiles APPROVED (q = full-text en la bio, como /search)."""
+    languages = parse_language_filter(language)
+    # q => siempre SQL: mismo tsquery (stemming es/en, sintaxis websearch) que /search
+    if catalog_index.enabled and not q:
+        facets = catalog_index.facets(languages=languages, language_match=language_match)
+    else:
+        facets = TeacherService().public_language_facets(db, languages=languages, language_match=language_match, q=q)
+    return PublicTeacherFacetsResponse(**facets)
+
+
+@router.get("/teachers/search", response_model=PublicTeachersResponse, operation_id="public_teachers_search")
+def public_teachers_search(
+    q: str = Query(min_length=1, max_length=200),
+    db: Session = Depends(get_db),
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = Query(default=None, max_length=256),
+    language: list[str] | None = Query(default=None),
+    language_match: Literal["any", "all"] = "any",
+) -> PublicTeachersResponse:
+    """Búsqueda full-text en bios (APPROVED), ordenada por relevancia."""
+    after = decode_cursor(cursor, float, int) if cursor is not None else None
+
+    results = TeacherService().search_public_profiles(
+        db,
+        q=q,
+        limit=limit + 1,
+        after=after,
+        languages=parse_language_filter(language),
+        language_match=language_match,
+    )
+    has_more = len(results) > limit
+    results = results[:limit]
+
+    next_cursor = encode_cursor(results[-1].rank, results[-1].id) if has_more else None
+    return ORJSONResponse({"items": [PublicTeacherItem.payload(row) for row in results], "next_cursor": next_cursor})
+
+
 
-    return PublicTeachersResponse(items=items)
+def _snapshot_response(request: Request, page: SnapshotPage) -> Response:
+    encoding, body = page.body_for(request.headers.get("accept-encoding"))
+    # Variante comprimida => ETag débil (mismo contenido, distintos bytes)
+    etag = page.etag if encoding == "identity" else f"W/{page.etag}"
+    headers = {**cache_headers(etag=etag), "Vary": "Accept-Encoding"}
+    if is_not_modified(request, etag=etag):
+        return not_modified(headers)
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
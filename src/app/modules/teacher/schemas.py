@@ -1,7 +1,9 @@
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, field_validator
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Literal, Optional
 from app.core.enums import TeacherProfileStatus
+from app.modules.teacher.languages import normalize_languages
+from app.modules.teacher.photos import list_photo_url
 
 
 class TeacherBase(BaseModel):
@@ -22,6 +24,11 @@ class TeacherProfileCreate(BaseModel):
     languages: Optional[List[str]] = None
     photo_url: Optional[str] = Field(default=None, max_length=2048)
 
+    @field_validator("languages")
+    @classmethod
+    def _normalize_languages(cls, value: Optional[List[str]]) -> Optional[List[str]]:
+        return normalize_languages(value) if value is not None else None
+
 
 class TeacherProfilePublic(BaseModel):
     model_config = ConfigDict(from_attributes=True)
@@ -34,6 +41,8 @@ class TeacherProfilePublic(BaseModel):
     status: TeacherProfileStatus
     created_at: datetime
     updated_at: datetime
+    # Sube en cada escritura; ETag del perfil (If-Match en PATCH)
+    version: int
 
 
 class TeacherProfileResponse(BaseModel):   
@@ -49,12 +58,38 @@ class TeacherProfileUpdate(BaseModel):
     languages: Optional[List[str]] = None
     photo_url: Optional[str] = Field(default=None, max_length=2048)
 
+    @field_validator("languages")
+    @classmethod
+    def _normalize_languages(cls, value: Optional[List[str]]) -> Optional[List[str]]:
+        return normalize_languages(value) if value is not None else None
+
 
 class TeacherProfileListResponse(BaseModel):
     items: List[TeacherProfilePublic]
-    total: int
+    # None con total_mode=none; aproximado con total_mode=estimate
+    total: Optional[int]
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
+
+
+class TeacherBulkModerationRequest(BaseModel):
+    action: Literal["approve", "pause"]
+    ids: List[int] = Field(min_length=1, max_length=1000)
+
+
+class TeacherBulkModerationItem(BaseModel):
+    id: int
+    # updated | unchanged (ya estaba en el destino) | invalid_transition | not_found
+    result: Literal["updated", "unchanged", "invalid_transition", "not_found"]
+    # status tras la operación (None si no existe)
+    status: Optional[TeacherProfileStatus] = None
+
+
+class TeacherBulkModerationResponse(BaseModel):
+    action: str
+    updated: int
+    items: List[TeacherBulkModerationItem]
 
 
 class PublicTeacherItem(BaseModel):
@@ -64,6 +99,30 @@ class PublicTeacherItem(BaseModel):
     photo_url: Optional[str] = None
     display_name: Optional[str] = None  
 
+    @classmethod
+    def from_profile(cls, profile) -> "PublicTeacherItem":
+        return cls(**cls.payload(profile))
+
+    @staticmethod
+    def payload(profile) -> dict:
+        """Mismos campos sin validar, para serializar filas confiables directo a JSON."""
+        return {
+            "teacher_profile_id": profile.id,
+            "bio": profile.bio,
+            "languages": list(profile.languages),
+            # Foto subida => miniatura chica (nunca el original); si no, la URL externa
+            "photo_url": list_photo_url(profile.photo_hash) if profile.photo_hash else profile.photo_url,
+            "display_name": None,  # si luego hay display_name en User, se completa aquí
+        }
+
 
 class PublicTeachersResponse(BaseModel):
-    items: list[PublicTeacherItem]
\ No newline at end of file
+    items: list[PublicTeacherItem]
+    # Cursor para la página siguiente (None => no hay más)
+    next_cursor: Optional[str] = None
+
+
+class PublicTeacherFacetsResponse(BaseModel):
+    total: int
+    # código de idioma -> perfiles (mayor a menor)
+    languages: dict[str, int]
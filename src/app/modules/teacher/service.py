@@ -1,18 +1,50 @@
 from __future__ import annotations
 
-from sqlalchemy import select, func, desc
+import json
+from datetime import datetime
+
+from sqlalchemy import select, update, func, desc, tuple_, literal, literal_column, cast, true, case, or_
+from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION, JSONB, array, insert
+from sqlalchemy.engine import Result, Row
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
 from app.models.user import User
 from app.core.enums import UserRole, TeacherProfileStatus
-from app.modules.teacher.models import TeacherProfile
+from app.core.errors import PreconditionFailedError
+from app.core.pagination import estimate_count
+from app.modules.teacher import events
+from app.modules.teacher.cache import admin_list_cache, cached, public_list_cache
+from app.modules.teacher.models import TeacherProfile, TeacherProfileStatusCount
+from app.modules.teacher.photos import profile_photo_url
 from app.modules.teacher.schemas import TeacherProfileUpdate
 from app.modules.teacher.schemas import TeacherProfilePublic
 
 
 KEY_FIELDS = {"bio", "languages", "photo_url"}
 
+# Moderación admin: acción => (status de origen permitidos, status destino)
+ADMIN_TRANSITIONS = {
+    # IN_REVIEW -> APPROVED, PAUSED -> APPROVED
+    "approve": (frozenset({TeacherProfileStatus.IN_REVIEW, TeacherProfileStatus.PAUSED}), TeacherProfileStatus.APPROVED),
+    # APPROVED -> PAUSED
+    "pause": (frozenset({TeacherProfileStatus.APPROVED}), TeacherProfileStatus.PAUSED),
+}
+
+# Proyecciones: solo las columnas que muestra cada respuesta, como filas (sin
+# entidades ORM, identity map ni instrumentación por atributo).
+# PROFILE_COLUMNS = campos de TeacherProfilePublic (listado admin, RETURNING)
+PROFILE_COLUMNS = tuple(getattr(TeacherProfile, name) for name in TeacherProfilePublic.model_fields)
+PUBLIC_LIST_COLUMNS = (
+    TeacherProfile.id,
+    TeacherProfile.bio,
+    TeacherProfile.languages,
+    TeacherProfile.photo_url,
+    TeacherProfile.created_at,
+    TeacherProfile.updated_at,
+    TeacherProfile.photo_hash,
+)
+
 
 class TeacherService:
     def assert_user_is_teacher(self, db: Session, *, user_id: int) -> None:
@@ -23,7 +55,14 @@ class TeacherService:
                 detail="Solo usuarios con rol TEACHER pueden tener perfil docente",
             )
         
-    def get_profile_by_user_id(self, db: Session, *, user_id: int) -> TeacherProfile | None:
+    def get_profile_by_user_id(self, db: Session, *, user_id: int) -> TeacherProfilePublic | None:
+        """Snapshot de solo lectura, siempre de la DB (ver cache.py); para modificar usar _get_profile_for_write."""
+        row = db.execute(
+            select(*PROFILE_COLUMNS).where(TeacherProfile.user_id == user_id)
+        ).one_or_none()
+        return TeacherProfilePublic(**row._mapping) if row else None
+
+    def _get_profile_for_write(self, db: Session, *, user_id: int) -> TeacherProfile | None:
         return db.execute(
             select(TeacherProfile).where(TeacherProfile.user_id == user_id)
         ).scalar_one_or_none()
@@ -37,59 +76,144 @@ class TeacherService:
         languages: list[str] | None,
         photo_url: str | None,
     ) -> TeacherProfile:
-        existing = self.get_profile_by_user_id(db, user_id=user_id)
-        if existing:
-            return existing
+        """
+        Idempotente: INSERT ... ON CONFLICT (user_id) DO NOTHING RETURNING.
+        Si ya existía (o lo creó una request concurrente) se devuelve el existente.
+        """
+        profile = db.execute(
+            insert(TeacherProfile)
+            .values(
+                user_id=user_id,
+                bio=bio or "",
+                languages=languages or [],
+                photo_url=photo_url,
+                status=TeacherProfileStatus.DRAFT,
+            )
+            .on_conflict_do_nothing(index_elements=[TeacherProfile.user_id])
+            .returning(TeacherProfile)
+        ).scalar_one_or_none()
 
-        profile = TeacherProfile(
-            user_id=user_id,
-            bio=bio or "",
-            languages=languages or [],
-            photo_url=photo_url,
-            status=TeacherProfileStatus.DRAFT,
-        )
+        if profile is None:
+            # Lectura en una sentencia nueva: ve el perfil commiteado por la otra request
+            return self._get_profile_for_write(db, user_id=user_id)
 
-        db.add(profile)
+        # Un INSERT Core no pasa por after_flush => se informa a mano
+        events.record_changes(db, [events.ProfileChange(profile.id, user_id, frozenset({profile.status}))])
         db.commit()
-        db.refresh(profile)
         return profile
 
 
-    def update_my_profile(self, db: Session, *, user_id: int, payload: TeacherProfileUpdate) -> TeacherProfile:
-        profile = db.execute(
-            select(TeacherProfile).where(TeacherProfile.user_id == user_id)
-        ).scalar_one_or_none()
+    def update_my_profile(
+        self,
+        db: Session,
+        *,
+        user_id: int,
+        payload: TeacherProfileUpdate,
+        expected_versions: set[int] | None = None,
+    ) -> TeacherProfilePublic:
+        data = payload.model_dump(exclude_unset=True)
+        if "photo_url" in data:
+            # URL puesta a mano => deja de apuntar a las miniaturas subidas
+            data["photo_hash"] = None
+        return self._update_profile_fields(db, user_id=user_id, data=data, expected_versions=expected_versions)
 
-        if not profile:
+    def set_my_photo(
+        self,
+        db: Session,
+        *,
+        user_id: int,
+        photo_hash: str,
+        expected_versions: set[int] | None = None,
+    ) -> TeacherProfilePublic:
+        """Apunta el perfil a una foto ya guardada (photo_url = variante más grande)."""
+        return self._update_profile_fields(
+            db,
+            user_id=user_id,
+            data={"photo_url": profile_photo_url(photo_hash), "photo_hash": photo_hash},
+            expected_versions=expected_versions,
+        )
+
+    def _update_profile_fields(
+        self,
+        db: Session,
+        *,
+        user_id: int,
+        data: dict,
+        expected_versions: set[int] | None,
+    ) -> TeacherProfilePublic:
+        """
+        Un solo UPDATE condicional ... RETURNING, que solo escribe si:
+        - el perfil no está IN_REVIEW
+        - `expected_versions` (If-Match) incluye la versión actual
+        - algún campo realmente cambia (patch sin cambios => sin escritura)
+        APPROVED + cambio de campos clave => IN_REVIEW en la misma sentencia.
+        Si no se actualizó nada, un SELECT explica por qué (404 / 409 / 412 / sin cambios).
+        """
+        if data:
+            conditions = [
+                TeacherProfile.user_id == user_id,
+                TeacherProfile.status != TeacherProfileStatus.IN_REVIEW,
+                or_(*(getattr(TeacherProfile, name).is_distinct_from(value) for name, value in data.items())),
+            ]
+            if expected_versions is not None:
+                conditions.append(TeacherProfile.version.in_(expected_versions))
+
+            values = dict(data)
+            # Si estaba APPROVED y cambia algo clave => IN_REVIEW
+            if any(name in KEY_FIELDS for name in data):
+                values["status"] = case(
+                    (TeacherProfile.status == TeacherProfileStatus.APPROVED, TeacherProfileStatus.IN_REVIEW),
+                    else_=TeacherProfile.status,
+                )
+
+            row = db.execute(
+                update(TeacherProfile)
+                .where(*conditions)
+                .values(**values)
+                .returning(*PROFILE_COLUMNS)
+                .execution_options(synchronize_session=False, **{events.TRACKED: True})
+            ).one_or_none()
+
+            if row is not None:
+                profile = TeacherProfilePublic(**row._mapping)
+                # IN_REVIEW no era editable => si quedó IN_REVIEW, venía de APPROVED
+                previous = TeacherProfileStatus.APPROVED if profile.status == TeacherProfileStatus.IN_REVIEW else profile.status
+                events.record_changes(db, [events.ProfileChange(profile.id, user_id, frozenset({previous, profile.status}))])
+                db.commit()
+                return profile
+
+        # Nada que cambiar
+        return self.assert_profile_editable(db, user_id=user_id, expected_versions=expected_versions)
+
+    def assert_profile_editable(
+        self,
+        db: Session,
+        *,
+        user_id: int,
+        expected_versions: set[int] | None = None,
+    ) -> TeacherProfilePublic:
+        """Perfil actual si se puede editar; si no, 404 / 409 (IN_REVIEW) / 412 (If-Match)."""
+        current = db.execute(
+            select(*PROFILE_COLUMNS).where(TeacherProfile.user_id == user_id)
+        ).one_or_none()
+
+        if current is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Perfil docente no existe")
 
         # Reglas por estado
-        if profile.status == TeacherProfileStatus.IN_REVIEW:
+        if current.status == TeacherProfileStatus.IN_REVIEW:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="El perfil está en revisión y no se puede editar",
             )
 
-        data = payload.model_dump(exclude_unset=True)
-
-        # Determinar si cambian campos clave
-        key_changed = any(k in data for k in KEY_FIELDS)
+        if expected_versions is not None and current.version not in expected_versions:
+            raise PreconditionFailedError("El perfil fue modificado en otra sesión; recarga y vuelve a intentar")
 
-        # Aplicar cambios
-        for k, v in data.items():
-            setattr(profile, k, v)
+        return TeacherProfilePublic(**current._mapping)
 
-        # Si estaba APPROVED y cambia algo clave => IN_REVIEW
-        if profile.status == TeacherProfileStatus.APPROVED and key_changed:
-            profile.status = TeacherProfileStatus.IN_REVIEW
-
-        db.add(profile)
-        db.commit()
-        db.refresh(profile)
-        return profile
-    
     def submit_my_profile(self, db: Session, *, user_id: int) -> TeacherProfile:
-        profile = self.get_profile_by_user_id(db, user_id=user_id)
+        profile = self._get_profile_for_write(db, user_id=user_id)
         if not profile:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -115,7 +239,6 @@ class TeacherService:
 
         db.add(profile)
         db.commit()
-        db.refresh(profile)
         return profile
     
 
@@ -123,32 +246,108 @@ class TeacherService:
         self,
         db: Session,
         *,
-        status: str | None,
+        status: str | list[str] | None,
         limit: int,
         offset: int,
-    ) -> tuple[list[TeacherProfilePublic], int]:
-        q = select(TeacherProfile)
-        cq = select(func.count()).select_from(TeacherProfile)
-
-        if status:
-            # Validar/normalizar status contra enum
-            try:
-                enum_status = TeacherProfileStatus(status)
-            except ValueError:
-                # si prefieres 400, cámbialo a HTTPException(400,...)
-                enum_status = None
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+        after_id: int | None = None,
+        total_mode: str = "exact",
+        languages: list[str] | None = None,
+        language_match: str = "any",
+    ) -> tuple[list[dict], int | None]:
+        """
+        Listado admin por id ascendente.
+        - `after_id`: keyset (cursor) en vez de OFFSET
+        - `total_mode`: "exact" | "estimate" | "none" (ver _admin_total)
+        Resultado cacheado por parámetros (ver teacher/cache.py).
+        """
+        statuses = _parse_statuses(status)
+        key = (
+            tuple(statuses), limit, offset, created_from, created_to,
+            after_id, total_mode, tuple(languages or ()), language_match,
+        )
 
-            if enum_status:
-                q = q.where(TeacherProfile.status == enum_status)
-                cq = cq.where(TeacherProfile.status == enum_status)
+        def load() -> tuple[tuple[dict, ...], int | None]:
+            items, total = self._load_admin_list(
+                db,
+                statuses=statuses,
+                limit=limit,
+                offset=offset,
+                created_from=created_from,
+                created_to=created_to,
+                after_id=after_id,
+                total_mode=total_mode,
+                languages=languages,
+                language_match=language_match,
+            )
+            return tuple(items), total
 
-        total = db.execute(cq).scalar_one()
-        rows = db.execute(q.order_by(TeacherProfile.id).limit(limit).offset(offset)).scalars().all()
+        items, total = cached(admin_list_cache, key, load)
+        # dicts compartidos con el cache: solo lectura
+        return list(items), total
 
-        # Convertir a esquema público
-        items = [TeacherProfilePublic.model_validate(p) for p in rows]
+    def _load_admin_list(
+        self,
+        db: Session,
+        *,
+        statuses: list[TeacherProfileStatus],
+        limit: int,
+        offset: int,
+        created_from: datetime | None,
+        created_to: datetime | None,
+        after_id: int | None,
+        total_mode: str,
+        languages: list[str] | None,
+        language_match: str,
+    ) -> tuple[list[dict], int | None]:
+        filters = []
+        if languages:
+            filters.append(_language_filter(languages, language_match))
+        if statuses:
+            filters.append(TeacherProfile.status.in_(statuses))
+        if created_from is not None:
+            filters.append(TeacherProfile.created_at >= created_from)
+        if created_to is not None:
+            filters.append(TeacherProfile.created_at < created_to)
+
+        q = select(*PROFILE_COLUMNS).where(*filters)
+        if after_id is not None:
+            q = q.where(TeacherProfile.id > after_id)
+
+        items = _as_dicts(db.execute(q.order_by(TeacherProfile.id).limit(limit).offset(offset)))
+        total = self._admin_total(
+            db,
+            statuses=statuses,
+            filters=filters,
+            by_status_only=created_from is None and created_to is None and not languages,
+            mode=total_mode,
+        )
         return items, total
-    
+
+    def _admin_total(
+        self,
+        db: Session,
+        *,
+        statuses: list[TeacherProfileStatus],
+        filters: list,
+        by_status_only: bool,
+        mode: str,
+    ) -> int | None:
+        if mode == "none":
+            return None
+
+        # Solo filtro por status => contadores mantenidos por trigger (exacto, O(#status))
+        if by_status_only:
+            cq = select(func.coalesce(func.sum(TeacherProfileStatusCount.total), 0))
+            if statuses:
+                cq = cq.where(TeacherProfileStatusCount.status.in_(statuses))
+            return int(db.execute(cq).scalar_one())
+
+        cq = select(func.count()).select_from(TeacherProfile).where(*filters)
+        if mode == "estimate":
+            return estimate_count(db, cq)
+        return db.execute(cq).scalar_one()
 
     def admin_set_status(self, db: Session, *, profile_id: int, action: str) -> TeacherProfile:
         profile = db.execute(
@@ -160,32 +359,68 @@ class TeacherService:
 
         current = profile.status
 
-        if action == "approve":
-            # IN_REVIEW -> APPROVED, PAUSED -> APPROVED
-            if current not in {TeacherProfileStatus.IN_REVIEW, TeacherProfileStatus.PAUSED}:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Transición inválida: {current} -> APPROVED",
-                )
-            profile.status = TeacherProfileStatus.APPROVED
-
-        elif action == "pause":
-            # APPROVED -> PAUSED
-            if current != TeacherProfileStatus.APPROVED:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Transición inválida: {current} -> PAUSED",
-                )
-            profile.status = TeacherProfileStatus.PAUSED
-
-        else:
+        if action not in ADMIN_TRANSITIONS:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Acción inválida")
+        sources, target = ADMIN_TRANSITIONS[action]
+        if current not in sources:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Transición inválida: {current} -> {target.value}",
+            )
+        profile.status = target
 
         db.add(profile)
         db.commit()
-        db.refresh(profile)
         return profile
-    
+
+    def admin_bulk_set_status(self, db: Session, *, profile_ids: list[int], action: str) -> list[dict]:
+        """
+        Moderación masiva en una transacción: un UPDATE set-based solo sobre
+        las filas con transición válida (RETURNING dice cuáles) + un SELECT
+        para clasificar el resto. Resultado por id, en el orden pedido.
+        """
+        if action not in ADMIN_TRANSITIONS:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Acción inválida")
+        sources, target = ADMIN_TRANSITIONS[action]
+        ids = list(dict.fromkeys(profile_ids))
+
+        # status previo (bloqueando las filas) para informar el cambio exacto a los caches
+        previous = (
+            select(TeacherProfile.id, TeacherProfile.status)
+            .where(TeacherProfile.id.in_(ids), TeacherProfile.status.in_(sources))
+            .with_for_update()
+            .subquery("previous")
+        )
+        updated = db.execute(
+            update(TeacherProfile)
+            .where(TeacherProfile.id == previous.c.id, TeacherProfile.status.in_(sources))
+            .values(status=target)
+            .returning(TeacherProfile.id, TeacherProfile.user_id, previous.c.status)
+            .execution_options(synchronize_session=False, **{events.TRACKED: True})
+        ).all()
+        events.record_changes(
+            db,
+            [events.ProfileChange(profile_id, user_id, frozenset({old, target})) for profile_id, user_id, old in updated],
+        )
+
+        updated_ids = {row.id for row in updated}
+        rest = [profile_id for profile_id in ids if profile_id not in updated_ids]
+        current = dict(
+            db.execute(select(TeacherProfile.id, TeacherProfile.status).where(TeacherProfile.id.in_(rest))).all()
+        ) if rest else {}
+        db.commit()
+
+        items = []
+        for profile_id in ids:
+            if profile_id in updated_ids:
+                items.append({"id": profile_id, "result": "updated", "status": target})
+            elif profile_id not in current:
+                items.append({"id": profile_id, "result": "not_found", "status": None})
+            else:
+                result = "unchanged" if current[profile_id] == target else "invalid_transition"
+                items.append({"id": profile_id, "result": result, "status": current[profile_id]})
+        return items
+
 
     def list_public_approved_profiles(
         self,
@@ -193,12 +428,166 @@ class TeacherService:
         *,
         limit: int = 50,
         offset: int = 0,
-    ) -> list[TeacherProfile]:
+        after: tuple[datetime, int] | None = None,
+        languages: list[str] | None = None,
+        language_match: str = "any",
+    ) -> list[Row]:
+        """
+        Perfiles APPROVED por (created_at DESC, id DESC), como filas de PUBLIC_LIST_COLUMNS.
+        `after` = clave de la última fila de la página anterior (keyset): cada
+        página es un range scan sobre ix_teacher_profiles_public_order, sin OFFSET.
+        `languages` (normalizados) filtra vía ix_teacher_profiles_languages.
+        Resultado cacheado por parámetros (ver teacher/cache.py).
+        """
+        key = (limit, offset, after, tuple(languages or ()), language_match)
+
+        def load() -> tuple[Row, ...]:
+            return tuple(
+                self._load_public_approved(
+                    db,
+                    limit=limit,
+                    offset=offset,
+                    after=after,
+                    languages=languages,
+                    language_match=language_match,
+                )
+            )
+
+        return list(cached(public_list_cache, key, load))
+
+    def _load_public_approved(
+        self,
+        db: Session,
+        *,
+        limit: int,
+        offset: int,
+        after: tuple[datetime, int] | None,
+        languages: list[str] | None,
+        language_match: str,
+    ) -> list[Row]:
         stmt = (
-            select(TeacherProfile)
+            select(*PUBLIC_LIST_COLUMNS)
             .where(TeacherProfile.status == TeacherProfileStatus.APPROVED)
             .order_by(desc(TeacherProfile.created_at), desc(TeacherProfile.id))
             .limit(limit)
-            .offset(offset)
         )
-        return list(db.execute(stmt).scalars().all())
\ No newline at end of file
+        if languages:
+            stmt = stmt.where(_language_filter(languages, language_match))
+        if after is not None:
+            stmt = stmt.where(tuple_(TeacherProfile.created_at, TeacherProfile.id) < tuple_(*after))
+        if offset:
+            stmt = stmt.offset(offset)
+        return list(db.execute(stmt).all())
+
+    def search_public_profiles(
+        self,
+        db: Session,
+        *,
+        q: str,
+        limit: int = 20,
+        after: tuple[float, int] | None = None,
+        languages: list[str] | None = None,
+        language_match: str = "any",
+    ) -> list[Row]:
+        """
+        Full-text sobre bio (solo APPROVED), por (rank DESC, id DESC).
+        Filas de PUBLIC_LIST_COLUMNS + `rank`.
+        El match usa el índice GIN de search_vector; el ranking solo se calcula
+        sobre las filas que matchean. `after` = (rank, id) de la última fila.
+        """
+        query = _search_query(q)
+        # real -> double: el valor del cursor vuelve idéntico y el keyset no pierde empates
+        rank_expr = cast(func.ts_rank_cd(TeacherProfile.search_vector, query), DOUBLE_PRECISION)
+        rank = rank_expr.label("rank")
+
+        stmt = (
+            select(*PUBLIC_LIST_COLUMNS, rank)
+            .where(
+                TeacherProfile.status == TeacherProfileStatus.APPROVED,
+                TeacherProfile.search_vector.op("@@")(query),
+            )
+            .order_by(desc(rank), desc(TeacherProfile.id))
+            .limit(limit)
+        )
+        if languages:
+            stmt = stmt.where(_language_filter(languages, language_match))
+        if after is not None:
+            after_rank, after_id = after
+            stmt = stmt.where(
+                tuple_(rank_expr, TeacherProfile.id) < tuple_(literal(after_rank, DOUBLE_PRECISION), after_id)
+            )
+        return list(db.execute(stmt).all())
+
+    def public_language_facets(
+        self,
+        db: Session,
+        *,
+        languages: list[str] | None = None,
+        language_match: str = "any",
+        q: str | None = None,
+    ) -> dict:
+        """
+        Fallback SQL de catalog_index.facets: total con filtros + conteo de
+        perfiles APPROVED por idioma (sin aplicar el filtro de idioma).
+        """
+        base = [TeacherProfile.status == TeacherProfileStatus.APPROVED]
+        if q:
+            base.append(TeacherProfile.search_vector.op("@@")(_search_query(q)))
+
+        language = func.jsonb_array_elements_text(TeacherProfile.languages).table_valued("value").alias("language")
+        counts = db.execute(
+            select(language.c.value, func.count())
+            .select_from(TeacherProfile)
+            .join(language, true())
+            .where(*base)
+            .group_by(language.c.value)
+            .order_by(func.count().desc(), language.c.value)
+        ).all()
+
+        total_q = select(func.count()).select_from(TeacherProfile).where(*base)
+        if languages:
+            total_q = total_q.where(_language_filter(languages, language_match))
+
+        return {
+            "total": db.execute(total_q).scalar_one(),
+            "languages": {code: count for code, count in counts},
+        }
+
+
+def _as_dicts(result: Result) -> list[dict]:
+    # Filas => dicts planos, listos para ORJSONResponse (sin pasar por RowMapping)
+    keys = list(result.keys())
+    return [dict(zip(keys, row)) for row in result]
+
+
+def _parse_statuses(status: str | list[str] | None) -> list[TeacherProfileStatus]:
+    """'IN_REVIEW', ['IN_REVIEW', 'PAUSED'] o 'IN_REVIEW,PAUSED'; valores desconocidos se ignoran."""
+    if not status:
+        return []
+    values = [status] if isinstance(status, str) else status
+
+    statuses: list[TeacherProfileStatus] = []
+    for value in values:
+        for part in value.split(","):
+            try:
+                enum_status = TeacherProfileStatus(part.strip())
+            except ValueError:
+                continue
+            if enum_status not in statuses:
+                statuses.append(enum_status)
+    return statuses
+
+
+def _language_filter(languages: list[str], match: str):
+    """any => languages ?| codes; all => languages @> codes (ambos usan el índice GIN)."""
+    if match == "all":
+        # JSONB desde un literal de texto: compila también con literal_binds (estimate_count)
+        return TeacherProfile.languages.contains(cast(literal(json.dumps(languages)), JSONB))
+    return TeacherProfile.languages.has_any(array(languages))
+
+
+def _search_query(q: str):
+    """Texto libre (sintaxis websearch: "frase", -excluir, or) en español o inglés."""
+    return func.websearch_to_tsquery(literal_column("'spanish'::regconfig"), q).op("||")(
+        func.websearch_to_tsquery(literal_column("'english'::regconfig"), q)
+    )
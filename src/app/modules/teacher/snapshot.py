@@ -0,0 +1,337 @@
+from __future__ import annotations
+
+import fcntl
+import gzip
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from app.core.database import SessionLocal
+from app.core.enums import TeacherProfileStatus
+from app.core.http_cache import make_etag
+from app.core.pagination import encode_cursor
+from app.core.responses import dumps
+from app.modules.teacher import events
+from app.modules.teacher.models import TeacherProfile
+from app.modules.teacher.service import PUBLIC_LIST_COLUMNS
+from app.modules.teacher.schemas import PublicTeacherItem
+
+try:  # opcional (extra "brotli"): sin el paquete no hay variante br, se sirve gzip / identity
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+logger = logging.getLogger("app.teacher.snapshot")
+
+# Archivo: MAGIC | u32 largo del índice | índice JSON | cuerpos (offsets relativos)
+_MAGIC = b"PLDCAT1\n"
+_INDEX_LENGTH = struct.Struct("<I")
+_DATA_START = len(_MAGIC) + _INDEX_LENGTH.size
+
+# Preferencia del servidor cuando el cliente acepta varias
+_ENCODINGS = ("br", "gzip", "identity")
+_RETRY_SECONDS = 5
+
+
+def public_page_etag(profiles, has_more: bool) -> str:
+    # Validador del result set: cualquier edición sube max(updated_at); altas/bajas cambian los ids
+    return make_etag(
+        "public_teachers",
+        tuple(p.id for p in profiles),
+        max((p.updated_at for p in profiles if p.updated_at is not None), default=None),
+        has_more,
+    )
+
+
+def render_public_page(profiles: list, *, limit: int) -> tuple[bytes, str, str | None]:
+    """(JSON, ETag, next_cursor) de una página; `profiles` trae hasta limit + 1 filas."""
+    has_more = len(profiles) > limit
+    profiles = profiles[:limit]
+    next_cursor = encode_cursor(profiles[-1].created_at, profiles[-1].id) if has_more else None
+    body = dumps({"items": [PublicTeacherItem.payload(p) for p in profiles], "next_cursor": next_cursor})
+    return body, public_page_etag(profiles, has_more), next_cursor
+
+
+@dataclass(frozen=True, slots=True)
+class SnapshotPage:
+    etag: str
+    # encoding -> bytes dentro del mmap (sin copia)
+    bodies: dict[str, memoryview]
+
+    def body_for(self, accept_encoding: str | None) -> tuple[str, memoryview]:
+        accepted = _accepted_encodings(accept_encoding)
+        for encoding in _ENCODINGS:
+            if encoding in self.bodies and (encoding == "identity" or encoding in accepted or "*" in accepted):
+                return encoding, self.bodies[encoding]
+        return "identity", self.bodies["identity"]
+
+
+@dataclass(frozen=True, slots=True)
+class _Mapped:
+    identity: tuple[int, int, int]
+    built_at: float
+    pages: dict[str, SnapshotPage]
+
+
+class CatalogSnapshot:
+    """
+    Primeras páginas de /public/teachers (sin filtros) ya serializadas y
+    comprimidas, en un archivo compartido por todos los workers del host.
+
+    - Lectura: mmap del archivo; los cuerpos se sirven como memoryview (sin
+      copiar ni serializar). Un cambio de inode/mtime => se re-mapea.
+    - Escritura: archivo temporal + os.replace (los lectores ven el snapshot
+      viejo o el nuevo, nunca uno a medias); flock serializa a los workers
+      y cada build lee la DB, no el catálogo en memoria de su worker.
+    - Un commit de este worker que toca APPROVED deja de servir el snapshot
+      hasta regenerarlo (en segundo plano); otros workers lo ven al re-mapear.
+    """
+
+    def __init__(
+        self,
+        *,
+        path: str | None,
+        pages: int,
+        page_size: int,
+        max_age_seconds: float,
+        session_factory: Callable[[], Session],
+    ) -> None:
+        self.path = path
+        self.pages = pages
+        self.page_size = page_size
+        self.max_age_seconds = max_age_seconds
+        self._session_factory = session_factory
+
+        self._mapped: _Mapped | None = None
+        self._invalidated = 0  # generación de invalidaciones locales
+        self._built = 0        # última generación cubierta por un build de este worker
+        self._building = False
+        self._retry_at = 0.0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.builds = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    # --- Lectura -----------------------------------------------------------
+
+    def lookup(self, *, limit: int, offset: int, cursor: str | None) -> SnapshotPage | None:
+        if not self.enabled or limit != self.page_size:
+            return None
+
+        # Commit local aún no reflejado => se lee de la fuente (read-your-writes)
+        if self._built != self._invalidated:
+            self.misses += 1
+            self.schedule_build()
+            return None
+
+        mapped = self._load()
+        if mapped is None or time.time() - mapped.built_at > self.max_age_seconds:
+            self.misses += 1
+            self.schedule_build()
+            return None
+
+        page = mapped.pages.get(f"c:{cursor}" if cursor is not None else f"o:{offset}")
+        if page is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return page
+
+    def stats(self) -> dict:
+        mapped = self._mapped
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "builds": self.builds,
+            "built_at": mapped.built_at if mapped else None,
+            "pages": len({id(page) for page in mapped.pages.values()}) if mapped else 0,
+        }
+
+    def _load(self) -> _Mapped | None:
+        path = self.path
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        mapped = self._mapped
+        if mapped is not None and mapped.identity == (stat.st_ino, stat.st_mtime_ns, stat.st_size):
+            return mapped
+
+        with self._lock:
+            try:
+                with open(path, "rb") as f:
+                    stat = os.fstat(f.fileno())
+                    buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                mapped = _parse(buffer, identity=(stat.st_ino, stat.st_mtime_ns, stat.st_size))
+            except (OSError, ValueError):
+                logger.exception("Snapshot del catálogo ilegible: %s", path)
+                return None
+            # El mmap anterior se libera cuando terminan las respuestas que lo usan
+            self._mapped = mapped
+            return mapped
+
+    # --- Escritura ---------------------------------------------------------
+
+    def invalidate(self, changes: list[events.ProfileChange] | None) -> None:
+        if not self.enabled:
+            return
+        # El listado público solo ve APPROVED (entrar o salir de APPROVED lo cambia)
+        if changes is not None and not any(TeacherProfileStatus.APPROVED in c.statuses for c in changes):
+            return
+        with self._lock:
+            self._invalidated += 1
+        self.schedule_build()
+
+    def schedule_build(self) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            if self._building or time.monotonic() < self._retry_at:
+                return
+            self._building = True
+        threading.Thread(target=self._build_loop, name="catalog-snapshot", daemon=True).start()
+
+    def _build_loop(self) -> None:
+        while True:
+            try:
+                self.build()
+            except Exception:
+                logger.exception("No se pudo regenerar el snapshot del catálogo")
+                with self._lock:
+                    self._building = False
+                    self._retry_at = time.monotonic() + _RETRY_SECONDS
+                return
+            # Invalidado durante el build => otra vuelta
+            with self._lock:
+                if self._built == self._invalidated or not self.enabled:
+                    self._building = False
+                    return
+
+    def build(self) -> None:
+        """Regenera el archivo (síncrono)."""
+        path = self.path
+        if path is None:
+            return
+        generation = self._invalidated
+        force = generation != self._built
+
+        with open(f"{path}.lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)  # se libera al cerrar
+
+            # Solo vencido (sin cambios locales) y otro worker ya lo regeneró => nada que hacer
+            mapped = None if force else self._load()
+            if mapped is None or time.time() - mapped.built_at > self.max_age_seconds:
+                started = time.monotonic()
+                payload = self._render()
+                tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp_path, path)
+                self.builds += 1
+                logger.info("Snapshot del catálogo: %s bytes en %.1fms", len(payload), (time.monotonic() - started) * 1000)
+
+        with self._lock:
+            self._built = max(self._built, generation)
+
+    def _render(self) -> bytes:
+        with self._session_factory() as db:
+            rows = db.execute(
+                select(*PUBLIC_LIST_COLUMNS)
+                .where(TeacherProfile.status == TeacherProfileStatus.APPROVED)
+                .order_by(TeacherProfile.created_at.desc(), TeacherProfile.id.desc())
+                .limit(self.pages * self.page_size + 1)
+            ).all()
+
+        bodies = bytearray()
+        index_pages: list[dict] = []
+        keys = ["o:0"]
+        for number in range(self.pages):
+            start = number * self.page_size
+            body, etag, next_cursor = render_public_page(rows[start:start + self.page_size + 1], limit=self.page_size)
+
+            spans: dict[str, list[int]] = {}
+            for encoding, data in _compress(body).items():
+                spans[encoding] = [len(bodies), len(data)]
+                bodies += data
+            index_pages.append({"keys": keys, "etag": etag, "bodies": spans})
+
+            if next_cursor is None:
+                break
+            # La página siguiente se pide por offset o por el cursor de esta
+            keys = [f"o:{start + self.page_size}", f"c:{next_cursor}"]
+
+        index = json.dumps({"built_at": time.time(), "pages": index_pages}, separators=(",", ":")).encode()
+        return _MAGIC + _INDEX_LENGTH.pack(len(index)) + index + bytes(bodies)
+
+
+def _compress(body: bytes) -> dict[str, bytes]:
+    encoded = {"identity": body, "gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        encoded["br"] = brotli.compress(body, quality=11)
+    # Páginas chicas: la versión comprimida puede salir más grande
+    return {encoding: data for encoding, data in encoded.items() if encoding == "identity" or len(data) < len(body)}
+
+
+def _parse(buffer: mmap.mmap, *, identity: tuple[int, int, int]) -> _Mapped:
+    if buffer[:len(_MAGIC)] != _MAGIC:
+        raise ValueError("formato de snapshot desconocido")
+    (index_length,) = _INDEX_LENGTH.unpack_from(buffer, len(_MAGIC))
+    index = json.loads(buffer[_DATA_START:_DATA_START + index_length])
+
+    view = memoryview(buffer)
+    data_start = _DATA_START + index_length
+    pages: dict[str, SnapshotPage] = {}
+    for entry in index["pages"]:
+        page = SnapshotPage(
+            etag=entry["etag"],
+            bodies={
+                encoding: view[data_start + offset:data_start + offset + length]
+                for encoding, (offset, length) in entry["bodies"].items()
+            },
+        )
+        for key in entry["keys"]:
+            pages[key] = page
+    return _Mapped(identity=identity, built_at=index["built_at"], pages=pages)
+
+
+def _accepted_encodings(header: str | None) -> set[str]:
+    accepted: set[str] = set()
+    for item in (header or "").split(","):
+        coding, _, params = item.partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        coding = coding.strip().lower()
+        if coding and quality > 0:
+            accepted.add(coding)
+    return accepted
+
+
+catalog_snapshot = CatalogSnapshot(
+    path=settings.CATALOG_SNAPSHOT_PATH,
+    pages=settings.CATALOG_SNAPSHOT_PAGES,
+    page_size=settings.CATALOG_SNAPSHOT_PAGE_SIZE,
+    max_age_seconds=settings.CATALOG_SNAPSHOT_MAX_AGE_SECONDS,
+    session_factory=SessionLocal,
+)
+events.subscribe(catalog_snapshot.invalidate)
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import io
+import tempfile
+import threading
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.config.settings import settings
+from app.core.database import get_db
+from app.modules.auth.dependencies import require_roles
+from app.modules.auth.principal import Principal
+from app.core.errors import ServiceUnavailableError
+from app.modules.users.importer import READERS, UserImporter, user_import_pool
+from app.modules.users.schemas import ImportReport
+
+router = APIRouter(
+    prefix="/admin/users",
+    tags=["admin-users"],
+)
+
+# Content-Type del body => formato
+_FORMATS = {
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+# Un import a la vez por proceso: el siguiente recibe 503 + Retry-After
+_import_running = threading.Lock()
+_IMPORT_RETRY_AFTER_SECONDS = 30
+
+
+@router.post("/import", response_model=ImportReport, operation_id="admin_import_users")
+async def import_users(
+    request: Request,
+    db: Session = Depends(get_db),
+    _: Principal = Depends(require_roles("ADMIN")),
+) -> ImportReport:
+    """
+    Body crudo CSV (text/csv) o NDJSON (application/x-ndjson).
+    El body se vuelca a un archivo temporal en streaming y el import corre
+    en el threadpool; la respuesta es el reporte con los errores por fila.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    fmt = _FORMATS.get(content_type)
+    if fmt is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Formato no soportado (usa text/csv o application/x-ndjson)",
+        )
+
+    if not _import_running.acquire(blocking=False):
+        raise ServiceUnavailableError("Ya hay un import en curso", retry_after=_IMPORT_RETRY_AFTER_SECONDS)
+
+    spool = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+    try:
+        size = 0
+        async for chunk in request.stream():
+            size += len(chunk)
+            if size > settings.USER_IMPORT_MAX_BYTES:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail="Archivo demasiado grande",
+                )
+            # Pasado 1 MB el spool es un archivo en disco: escritura bloqueante, fuera del loop
+            await run_in_threadpool(spool.write, chunk)
+
+        return await run_in_threadpool(_run_import, db, spool, fmt)
+    finally:
+        await run_in_threadpool(spool.close)
+        _import_running.release()
+
+
+def _run_import(db: Session, spool, fmt: str) -> ImportReport:
+    spool.seek(0)
+    importer = UserImporter(
+        chunk_size=settings.USER_IMPORT_CHUNK_SIZE,
+        pool=user_import_pool,
+        max_errors=settings.USER_IMPORT_MAX_ERRORS,
+    )
+    stream = io.TextIOWrapper(spool, encoding="utf-8-sig", errors="replace", newline="")
+    try:
+        return importer.run(db, READERS[fmt](stream))
+    finally:
+        stream.detach()
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import csv
+import json
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, TextIO
+
+from pydantic import ValidationError
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from app.core.bulk import copy_rows
+from app.core.enums import UserRole
+from app.core.process_pool import BoundedProcessPool, available_cpus
+from app.core.security import hash_password
+from app.models.user import User
+from app.modules.users.schemas import ImportReport, ImportRowError, ImportUserRow
+
+# Roles que se pueden importar (mismo criterio que /auth/register)
+IMPORTABLE_ROLES = {UserRole.STUDENT, UserRole.TEACHER}
+
+# Tabla temporal por conexión; se vacía sola en cada commit (un commit por chunk)
+_STAGE_TABLE = "users_import_stage"
+_STAGE_COLUMNS = ("email", "password_hash", "role", "status", "created_at")
+
+# (línea, registro) — registro None => la línea no se pudo parsear
+SourceRow = tuple[int, dict[str, Any] | None]
+
+
+def iter_csv(stream: TextIO) -> Iterator[SourceRow]:
+    """CSV con cabecera (email,password,role[,status]). Las líneas cuentan desde la cabecera (1)."""
+    reader = csv.DictReader(stream)
+    for record in reader:
+        yield reader.line_num, record
+
+
+def iter_ndjson(stream: TextIO) -> Iterator[SourceRow]:
+    """Un objeto JSON por línea; las líneas en blanco se ignoran."""
+    for line_no, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield line_no, None
+            continue
+        yield line_no, record if isinstance(record, dict) else None
+
+
+READERS: dict[str, Callable[[TextIO], Iterator[SourceRow]]] = {
+    "csv": iter_csv,
+    "ndjson": iter_ndjson,
+}
+
+
+class UserImporter:
+    """
+    Import masivo de usuarios en streaming, por chunks de `chunk_size` filas:
+
+    1. valida cada fila (ImportUserRow) y descarta emails repetidos en el archivo
+    2. un único SELECT por chunk para descartar emails ya registrados
+    3. argon2 en un pool de procesos separado del de logins: `pool` compartido
+       (API, ver user_import_pool) o uno propio de `hash_workers` procesos
+       (scripts, por defecto uno por core) que se cierra al terminar
+    4. COPY a una tabla temporal + INSERT ... ON CONFLICT DO NOTHING a users
+       (un email creado en paralelo por /auth/register se cuenta como existente)
+    5. commit por chunk y `progress(report)` con los totales acumulados
+
+    La memoria queda acotada al chunk (más el set de emails vistos).
+    """
+
+    def __init__(
+        self,
+        *,
+        chunk_size: int = 1000,
+        hash_workers: int | None = None,
+        pool: BoundedProcessPool | None = None,
+        max_errors: int = 1000,
+        progress: Callable[[ImportReport], None] | None = None,
+        on_error: Callable[[ImportRowError], None] | None = None,
+    ) -> None:
+        self.chunk_size = max(1, chunk_size)
+        self.hash_workers = available_cpus() if hash_workers is None else hash_workers
+        self.pool = pool
+        self.max_errors = max_errors
+        self.progress = progress
+        self.on_error = on_error
+
+    def run(self, db: Session, rows: Iterable[SourceRow]) -> ImportReport:
+        report = ImportReport()
+        seen: set[str] = set()
+        pool = self.pool or BoundedProcessPool(name="user-import", workers=self.hash_workers, max_queue=0)
+        try:
+            self._create_stage_table(db)
+            rows = iter(rows)
+            while chunk := list(islice(rows, self.chunk_size)):
+                self._import_chunk(db, chunk, report=report, seen=seen, pool=pool)
+                if self.progress is not None:
+                    self.progress(report)
+        finally:
+            if pool is not self.pool:
+                pool.shutdown()
+        return report
+
+    def _import_chunk(
+        self,
+        db: Session,
+        chunk: list[SourceRow],
+        *,
+        report: ImportReport,
+        seen: set[str],
+        pool: BoundedProcessPool,
+    ) -> None:
+        valid: list[tuple[int, ImportUserRow]] = []
+        for line, record in chunk:
+            report.processed += 1
+            row = self._validate(line, record, report)
+            if row is None:
+                continue
+            if row.email in seen:
+                report.skipped_duplicate += 1
+                continue
+            seen.add(row.email)
+            valid.append((line, row))
+
+        if not valid:
+            return
+
+        # Emails ya registrados: una sola query por chunk
+        existing = set(
+            db.execute(select(User.email).where(User.email.in_([row.email for _, row in valid]))).scalars()
+        )
+        pending = [row for _, row in valid if row.email not in existing]
+        report.skipped_existing += len(valid) - len(pending)
+        if not pending:
+            return
+
+        passwords = [row.password for row in pending]
+        chunksize = max(1, len(passwords) // (max(pool.workers, 1) * 4))
+        hashes = pool.map(hash_password, passwords, chunksize=chunksize)
+
+        created_at = datetime.now(timezone.utc)
+        copy_rows(
+            db,
+            _STAGE_TABLE,
+            _STAGE_COLUMNS,
+            (
+                (row.email, password_hash, row.role.value, row.status.value, created_at)
+                for row, password_hash in zip(pending, hashes)
+            ),
+        )
+        inserted = db.execute(
+            text(
+                f"INSERT INTO users ({', '.join(_STAGE_COLUMNS)}) "
+                f"SELECT {', '.join(_STAGE_COLUMNS)} FROM {_STAGE_TABLE} "
+                "ON CONFLICT (email) DO NOTHING"
+            )
+        ).rowcount
+        db.commit()
+
+        report.created += inserted
+        report.skipped_existing += len(pending) - inserted
+
+    def _validate(self, line: int, record: dict[str, Any] | None, report: ImportReport) -> ImportUserRow | None:
+        if record is None:
+            self._fail(report, line, None, "Línea inválida")
+            return None
+
+        email = record.get("email")
+        try:
+            # Celdas vacías del CSV => campo ausente (aplica el default de status)
+            row = ImportUserRow.model_validate({k: v for k, v in record.items() if k and v not in ("", None)})
+        except ValidationError as exc:
+            details = "; ".join(
+                f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}" for err in exc.errors()
+            )
+            self._fail(report, line, email, details)
+            return None
+
+        if row.role not in IMPORTABLE_ROLES:
+            self._fail(report, line, email, "Rol no permitido para importación")
+            return None
+        return row
+
+    def _fail(self, report: ImportReport, line: int, email: Any, message: str) -> None:
+        report.failed += 1
+        error = ImportRowError(line=line, email=email if isinstance(email, str) else None, error=message)
+        if len(report.errors) < self.max_errors:
+            report.errors.append(error)
+        if self.on_error is not None:
+            self.on_error(error)
+
+    def _create_stage_table(self, db: Session) -> None:
+        db.execute(
+            text(
+                f"CREATE TEMP TABLE IF NOT EXISTS {_STAGE_TABLE} ("
+                "email varchar(255) NOT NULL, "
+                "password_hash varchar(255) NOT NULL, "
+                "role user_role NOT NULL, "
+                "status user_status NOT NULL, "
+                "created_at timestamptz NOT NULL"
+                ") ON COMMIT DELETE ROWS"
+            )
+        )
+
+
+# Pool de la API (POST /admin/users/import): uno por proceso, compartido por
+# todos los imports, con la mitad de los cores para no ahogar los logins.
+# Un import a la vez (admin_router); max_queue=0 => nada más en cola.
+user_import_pool = BoundedProcessPool(
+    name="user-import",
+    workers=(
+        settings.USER_IMPORT_HASH_WORKERS
+        if settings.USER_IMPORT_HASH_WORKERS is not None
+        else max(1, available_cpus() // 2)
+    ),
+    max_queue=0,
+)
@@ -0,0 +1,26 @@
+from pydantic import BaseModel, EmailStr, Field
+
+from app.core.enums import UserRole, UserStatus
+
+
+class ImportUserRow(BaseModel):
+    """Fila de entrada del import (CSV con cabecera o NDJSON)."""
+    email: EmailStr
+    password: str = Field(min_length=8, max_length=128)
+    role: UserRole
+    status: UserStatus = UserStatus.ACTIVE
+
+
+class ImportRowError(BaseModel):
+    line: int
+    email: str | None = None
+    error: str
+
+
+class ImportReport(BaseModel):
+    processed: int = 0
+    created: int = 0
+    skipped_existing: int = 0
+    skipped_duplicate: int = 0
+    failed: int = 0
+    errors: list[ImportRowError] = Field(default_factory=list)
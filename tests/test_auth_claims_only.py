@@ -0,0 +1,161 @@
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import event, select, update, delete
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.config.settings import settings
+from app.core.database import SessionLocal, engine, get_db
+from app.core.enums import UserStatus, UserRole
+from app.models.user import User
+from app.modules.auth.models import TokenRevocation
+from app.modules.auth.token_versions import TokenVersionRegistry, purge_token_revocations, revocation_window
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def claims_only(monkeypatch):
+    monkeypatch.setattr(settings, "AUTH_CLAIMS_ONLY", True)
+
+
+def _cleanup_user(email: str) -> None:
+    db: Session = next(get_db())
+    db.execute(delete(User).where(User.email == email))
+    db.commit()
+
+
+def _register_and_login(email: str, password: str, role: str) -> str:
+    client.post("/auth/register", json={"email": email, "password": password, "role": role})
+    r = client.post("/auth/login", json={"email": email, "password": password})
+    assert r.status_code == 200
+    return r.json()["access_token"]
+
+
+@contextmanager
+def _capture_sql():
+    statements: list[str] = []
+
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _before)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _before)
+
+
+def test_role_change_bumps_token_version():
+    email = "token_version_bump@test.com"
+    _cleanup_user(email)
+    client.post("/auth/register", json={"email": email, "password": "Student123*", "role": "STUDENT"})
+
+    db: Session = next(get_db())
+    user = db.execute(select(User).where(User.email == email)).scalar_one()
+    assert user.token_version == 0
+
+    user.role = UserRole.TEACHER
+    db.commit()
+    db.refresh(user)
+    assert user.token_version == 1
+
+
+def test_claims_only_dashboard_without_db_round_trips(claims_only):
+    email = "claims_only_ok@test.com"
+    _cleanup_user(email)
+    token = _register_and_login(email, "Student123*", "STUDENT")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    assert client.get("/student/dashboard", headers=headers).status_code == 200
+
+    with _capture_sql() as statements:
+        r = client.get("/student/dashboard", headers=headers)
+    assert r.status_code == 200
+    assert r.json()["role"] == "STUDENT"
+    assert statements == []
+
+    # RBAC sigue aplicando con los claims
+    assert client.get("/admin/dashboard", headers=headers).status_code == 403
+
+
+def test_claims_only_me_still_returns_full_user(claims_only):
+    email = "claims_only_me@test.com"
+    _cleanup_user(email)
+    token = _register_and_login(email, "Student123*", "STUDENT")
+
+    r = client.get("/auth/me", headers={"Authorization": f"Bearer {token}"})
+    assert r.status_code == 200
+    assert r.json()["email"] == email
+    assert r.json()["created_at"] is not None
+
+
+def test_claims_only_rejects_token_after_suspension(claims_only):
+    email = "claims_only_susp@test.com"
+    _cleanup_user(email)
+    token = _register_and_login(email, "Student123*", "STUDENT")
+    headers = {"Authorization": f"Bearer {token}"}
+    assert client.get("/student/dashboard", headers=headers).status_code == 200
+
+    db: Session = next(get_db())
+    db.execute(update(User).where(User.email == email).values(status=UserStatus.SUSPENDED))
+    db.commit()
+
+    assert client.get("/student/dashboard", headers=headers).status_code == 401
+
+
+def test_token_version_registry_loads_recent_revocations_only():
+    loads: list[int] = []
+    failing = False
+
+    def session_factory() -> Session:
+        loads.append(1)
+        if failing:
+            raise OperationalError("SELECT", {}, Exception("DB caída"))
+        # Un commit local que invalida mientras se carga => el mapa nace viejo
+        if len(loads) == 1:
+            registry.invalidate()
+        return SessionLocal()
+
+    registry = TokenVersionRegistry(refresh_seconds=3600, session_factory=session_factory)
+    emails = ["claims_registry_a@test.com", "claims_registry_b@test.com"]
+    for email in emails:
+        _cleanup_user(email)
+        client.post("/auth/register", json={"email": email, "password": "Student123*", "role": "STUDENT"})
+    db: Session = next(get_db())
+    a, b = db.execute(select(User.id).where(User.email.in_(emails)).order_by(User.id)).scalars().all()
+
+    assert registry.current(a) == 0
+    assert registry.current(b) == 0
+    assert len(loads) == 2  # la primera carga se invalidó durante el SELECT
+
+    # Cambio de status => token_version nuevo; borrado físico => revocado
+    db.execute(update(User).where(User.id == b).values(status=UserStatus.SUSPENDED))
+    db.commit()
+    _cleanup_user(emails[0])
+    registry.invalidate()
+    assert registry.current(a) is None
+    assert registry.current(b) == db.execute(select(User.token_version).where(User.id == b)).scalar_one()
+
+    # DB caída al recargar => se sigue con el mapa anterior (sin 500)
+    failing = True
+    registry.invalidate()
+    assert registry.current(a) is None
+    failing = False
+
+    # Solo se leen revocaciones recientes: las viejas afectan a tokens ya expirados
+    db.execute(
+        update(TokenRevocation)
+        .where(TokenRevocation.user_id.in_([a, b]))
+        .values(created_at=datetime.now(timezone.utc) - revocation_window())
+    )
+    db.commit()
+    assert purge_token_revocations(db) >= 2
+    registry.invalidate()
+    assert registry.current(a) == 0
+    assert registry.current(b) == 0
+    _cleanup_user(emails[1])
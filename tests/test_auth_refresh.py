@@ -0,0 +1,130 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select, update, delete
+from sqlalchemy.orm import Session
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core.database import get_db
+from app.core.enums import UserStatus
+from app.models.user import User
+from app.modules.auth.models import RefreshToken
+from app.modules.auth.service import AuthService
+
+client = TestClient(app, raise_server_exceptions=False)
+
+
+def _cleanup_user(email: str) -> None:
+    db: Session = next(get_db())
+    db.execute(delete(User).where(User.email == email))
+    db.commit()
+
+
+def _register_and_login(email: str, password: str, role: str) -> dict:
+    client.post("/auth/register", json={"email": email, "password": password, "role": role})
+    r = client.post("/auth/login", json={"email": email, "password": password})
+    assert r.status_code == 200
+    return r.json()
+
+
+def _refresh(refresh_token: str):
+    return client.post("/auth/refresh", json={"refresh_token": refresh_token})
+
+
+def test_login_returns_refresh_token_and_refresh_rotates_it():
+    email = "refresh_ok@test.com"
+    _cleanup_user(email)
+    tokens = _register_and_login(email, "Student123*", "STUDENT")
+    assert tokens["refresh_token"]
+
+    r = _refresh(tokens["refresh_token"])
+    assert r.status_code == 200
+    renewed = r.json()
+    assert renewed["refresh_token"] != tokens["refresh_token"]
+
+    me = client.get("/auth/me", headers={"Authorization": f"Bearer {renewed['access_token']}"})
+    assert me.status_code == 200
+    assert me.json()["email"] == email
+
+    # La rotación sigue funcionando con el token nuevo
+    assert _refresh(renewed["refresh_token"]).status_code == 200
+
+
+def test_reusing_rotated_refresh_token_revokes_the_family():
+    email = "refresh_reuse@test.com"
+    _cleanup_user(email)
+    tokens = _register_and_login(email, "Student123*", "STUDENT")
+
+    renewed = _refresh(tokens["refresh_token"]).json()
+
+    # Reuso del token ya rotado => 401 y se revoca toda la sesión
+    reuse = _refresh(tokens["refresh_token"])
+    assert reuse.status_code == 401
+    assert reuse.json()["error"]["message"] == "Refresh token inválido"
+
+    assert _refresh(renewed["refresh_token"]).status_code == 401
+
+
+def test_refresh_rejected_for_suspended_user():
+    email = "refresh_susp@test.com"
+    _cleanup_user(email)
+    tokens = _register_and_login(email, "Student123*", "STUDENT")
+
+    db: Session = next(get_db())
+    db.execute(update(User).where(User.email == email).values(status=UserStatus.SUSPENDED))
+    db.commit()
+
+    assert _refresh(tokens["refresh_token"]).status_code == 401
+
+
+def test_expired_refresh_token_is_rejected():
+    email = "refresh_expired@test.com"
+    _cleanup_user(email)
+    tokens = _register_and_login(email, "Student123*", "STUDENT")
+
+    db: Session = next(get_db())
+    user_id = db.execute(select(User.id).where(User.email == email)).scalar_one()
+    db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.user_id == user_id)
+        .values(expires_at=datetime.now(timezone.utc) - timedelta(minutes=1))
+    )
+    db.commit()
+
+    assert _refresh(tokens["refresh_token"]).status_code == 401
+
+
+def test_unknown_refresh_token_returns_401():
+    assert _refresh("x" * 43).status_code == 401
+
+
+def test_ended_sessions_are_purged():
+    email = "refresh_purge@test.com"
+    _cleanup_user(email)
+    first = _register_and_login(email, "Student123*", "STUDENT")
+    _refresh(first["refresh_token"])  # sesión con una fila usada + la vigente
+
+    db: Session = next(get_db())
+    user_id = db.execute(select(User.id).where(User.email == email)).scalar_one()
+    ended = datetime.now(timezone.utc) - timedelta(minutes=1)
+
+    def _end_sessions(*where) -> None:
+        db.execute(update(RefreshToken).where(RefreshToken.user_id == user_id, *where).values(session_expires_at=ended))
+        db.commit()
+
+    def _rows() -> int:
+        return len(db.execute(select(RefreshToken.id).where(RefreshToken.user_id == user_id)).all())
+
+    # Un login nuevo borra las sesiones terminadas de ese usuario
+    _end_sessions()
+    second = client.post("/auth/login", json={"email": email, "password": "Student123*"}).json()
+    assert _rows() == 1
+
+    # La purga global (en lotes) borra solo las terminadas
+    second_family = db.execute(select(RefreshToken.family_id).where(RefreshToken.user_id == user_id)).scalar_one()
+    third = client.post("/auth/login", json={"email": email, "password": "Student123*"}).json()
+    _end_sessions(RefreshToken.family_id == second_family)
+    assert AuthService().purge_expired_refresh_tokens(db, batch_size=1) >= 1
+    assert _rows() == 1
+    assert _refresh(second["refresh_token"]).status_code == 401
+    assert _refresh(third["refresh_token"]).status_code == 200
@@ -1,8 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from fastapi.testclient import TestClient
 from sqlalchemy import text
 
 from app.main import app
-from app.core.database import engine
+from app.core.database import SessionLocal, engine
+from app.core.enums import UserRole
+from app.core.hashing import password_hashing_pool
+from app.modules.auth.service import AuthService
 
 client = TestClient(app)
 
@@ -56,12 +61,15 @@ def test_register_duplicate_email_returns_409():
     })
     assert first.status_code == 200
 
+    # El duplicado se rechaza antes de argon2 (no ocupa el pool de hashing)
+    completed = password_hashing_pool.stats()["completed"]
     second = client.post("/auth/register", json={
         "email": email,
         "password": "Student123*",
         "role": "STUDENT",
     })
     assert second.status_code == 409
+    assert password_hashing_pool.stats()["completed"] == completed
 
 
 def test_password_is_hashed_in_db():
@@ -86,3 +94,43 @@ def test_password_is_hashed_in_db():
     assert password_hash is not None
     assert password_hash != "Student123*"
     assert "argon2" in password_hash.lower()
+
+
+def test_concurrent_duplicate_registrations_return_one_200_and_409s():
+    email = "race_reg_test@example.com"
+    _cleanup_user(email)
+
+    def register(_):
+        return client.post("/auth/register", json={
+            "email": email,
+            "password": "Student123*",
+            "role": "STUDENT",
+        }).status_code
+
+    # Todas compiten por el mismo email: ninguna debe terminar en 500
+    with ThreadPoolExecutor(max_workers=12) as pool:
+        statuses = list(pool.map(register, range(12)))
+
+    assert sorted(statuses) == [200] + [409] * 11
+
+    with engine.connect() as conn:
+        count = conn.execute(text("SELECT count(*) FROM users WHERE email = :email"), {"email": email}).scalar_one()
+    assert count == 1
+
+
+def test_register_hashes_without_holding_a_transaction(monkeypatch):
+    email = "hash_no_tx_reg_test@example.com"
+    _cleanup_user(email)
+    hash_password = password_hashing_pool.hash
+    in_transaction: list[bool] = []
+
+    with SessionLocal() as db:
+        def _hash(password: str) -> str:
+            in_transaction.append(db.in_transaction())
+            return hash_password(password)
+
+        monkeypatch.setattr(password_hashing_pool, "hash", _hash)
+        user = AuthService().register(db, email=email, password="Student123*", role=UserRole.STUDENT)
+
+    assert user.email == email
+    assert in_transaction == [False]
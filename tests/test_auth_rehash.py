@@ -0,0 +1,64 @@
+from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
+from sqlalchemy import select, delete
+from sqlalchemy.orm import Session
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.config.settings import settings
+from app.core.database import get_db
+from app.core.enums import UserRole, UserStatus
+from app.models.user import User
+
+client = TestClient(app)
+
+
+def _cleanup_user(email: str) -> None:
+    db: Session = next(get_db())
+    db.execute(delete(User).where(User.email == email))
+    db.commit()
+
+
+def _password_hash(email: str) -> str:
+    db: Session = next(get_db())
+    return db.execute(select(User.password_hash).where(User.email == email)).scalar_one()
+
+
+def test_login_rehashes_outdated_argon2_parameters():
+    email = "rehash_login@test.com"
+    password = "Student123*"
+    _cleanup_user(email)
+
+    legacy_hasher = PasswordHash((Argon2Hasher(time_cost=1, memory_cost=8192, parallelism=1),))
+    legacy_hash = legacy_hasher.hash(password)
+
+    db: Session = next(get_db())
+    db.add(User(email=email, password_hash=legacy_hash, role=UserRole.STUDENT, status=UserStatus.ACTIVE))
+    db.commit()
+
+    r = client.post("/auth/login", json={"email": email, "password": password})
+    assert r.status_code == 200
+
+    new_hash = _password_hash(email)
+    assert new_hash != legacy_hash
+    assert f"m={settings.ARGON2_MEMORY_COST},t={settings.ARGON2_TIME_COST}" in new_hash
+
+    # sigue funcionando y ya no se vuelve a re-hashear
+    r2 = client.post("/auth/login", json={"email": email, "password": password})
+    assert r2.status_code == 200
+    assert _password_hash(email) == new_hash
+
+
+def test_failed_login_does_not_rehash():
+    email = "rehash_wrong_pw@test.com"
+    _cleanup_user(email)
+
+    legacy_hash = PasswordHash((Argon2Hasher(time_cost=1, memory_cost=8192, parallelism=1),)).hash("Student123*")
+
+    db: Session = next(get_db())
+    db.add(User(email=email, password_hash=legacy_hash, role=UserRole.STUDENT, status=UserStatus.ACTIVE))
+    db.commit()
+
+    r = client.post("/auth/login", json={"email": email, "password": "WrongPass123*"})
+    assert r.status_code == 401
+    assert _password_hash(email) == legacy_hash
@@ -30,3 +30,25 @@ def test_internal_error_returns_500_json(monkeypatch):
     assert r.status_code == 500
     data = r.json()
     assert data["error"]["type"] == "InternalServerError"
+
+
+def test_unique_violation_returns_409_json():
+    from sqlalchemy import text
+    from app.core.database import engine
+    import app.main as main_module
+
+    patched_app = main_module.create_app()
+
+    @patched_app.get("/__duplicate")
+    def duplicate():
+        # Mismo email dos veces en la misma transacción => viola el índice único
+        with engine.begin() as conn:
+            for _ in range(2):
+                conn.execute(
+                    text("INSERT INTO users (email, password_hash, role, status, created_at) "
+                         "VALUES ('dup_integrity@test.com', 'x', 'STUDENT', 'ACTIVE', now())")
+                )
+
+    r = TestClient(patched_app, raise_server_exceptions=False).get("/__duplicate")
+    assert r.status_code == 409
+    assert r.json()["error"]["type"] == "ConflictError"
@@ -0,0 +1,81 @@
+from sqlalchemy import select, delete
+from sqlalchemy.orm import Session
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core.database import get_db
+from app.core.enums import TeacherProfileStatus
+from app.models.user import User
+from app.modules.teacher.models import TeacherProfile
+
+client = TestClient(app)
+
+
+def _cleanup_user(email: str) -> None:
+    db: Session = next(get_db())
+    db.execute(delete(User).where(User.email == email))
+    db.commit()
+
+
+def _register_and_login(email: str, password: str, role: str) -> str:
+    client.post("/auth/register", json={"email": email, "password": password, "role": role})
+    r = client.post("/auth/login", json={"email": email, "password": password})
+    assert r.status_code == 200
+    return r.json()["access_token"]
+
+
+def test_auth_me_returns_304_for_matching_etag():
+    email = "http_cache_me@test.com"
+    _cleanup_user(email)
+    headers = {"Authorization": f"Bearer {_register_and_login(email, 'Student123*', 'STUDENT')}"}
+
+    first = client.get("/auth/me", headers=headers)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert "private" in first.headers["cache-control"]
+
+    again = client.get("/auth/me", headers={**headers, "If-None-Match": f'"otro", W/{etag}'})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["etag"] == etag
+
+    assert client.get("/auth/me", headers={**headers, "If-None-Match": '"otro"'}).status_code == 200
+
+
+def test_teacher_profile_etag_and_last_modified_change_on_edit():
+    email = "http_cache_profile@test.com"
+    _cleanup_user(email)
+    headers = {"Authorization": f"Bearer {_register_and_login(email, 'Teacher123*', 'TEACHER')}"}
+    assert client.post("/teacher/me/profile", json={"bio": "v1", "languages": ["es"]}, headers=headers).status_code == 200
+
+    first = client.get("/teacher/me/profile", headers=headers)
+    etag, last_modified = first.headers["etag"], first.headers["last-modified"]
+
+    assert client.get("/teacher/me/profile", headers={**headers, "If-None-Match": etag}).status_code == 304
+    assert client.get("/teacher/me/profile", headers={**headers, "If-Modified-Since": last_modified}).status_code == 304
+
+    assert client.patch("/teacher/me/profile", json={"bio": "v2"}, headers=headers).status_code == 200
+    changed = client.get("/teacher/me/profile", headers={**headers, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["profile"]["bio"] == "v2"
+
+
+def test_public_teachers_etag_changes_when_result_set_changes():
+    email = "http_cache_public@test.com"
+    _cleanup_user(email)
+    token = _register_and_login(email, "Teacher123*", "TEACHER")
+    r = client.post("/teacher/me/profile", json={"bio": "bio", "languages": ["es"]}, headers={"Authorization": f"Bearer {token}"})
+    profile_id = r.json()["profile"]["id"]
+
+    first = client.get("/public/teachers?limit=200")
+    etag = first.headers["etag"]
+    assert client.get("/public/teachers?limit=200", headers={"If-None-Match": etag}).status_code == 304
+
+    db: Session = next(get_db())
+    db.execute(select(TeacherProfile).where(TeacherProfile.id == profile_id)).scalar_one().status = TeacherProfileStatus.APPROVED
+    db.commit()
+
+    changed = client.get("/public/teachers?limit=200", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert profile_id in [it["teacher_profile_id"] for it in changed.json()["items"]]
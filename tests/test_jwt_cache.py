@@ -0,0 +1,80 @@
+import os
+import time
+
+import jwt
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.config.settings import settings
+from app.modules.auth import keys as keys_module
+from app.modules.auth.security import create_access_token, decode_access_token, verified_token_cache
+
+client = TestClient(app)
+
+
+def _admin_headers() -> dict:
+    email = os.getenv("ADMIN_EMAIL", "admin@parladach.com")
+    r = client.post("/auth/login", json={"email": email, "password": os.getenv("ADMIN_PASSWORD", "Admin123*")})
+    assert r.status_code == 200, r.text
+    return {"Authorization": f"Bearer {r.json()['access_token']}"}
+
+
+def _count_decodes(monkeypatch) -> list:
+    calls = []
+    real_decode = jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(1)
+        return real_decode(*args, **kwargs)
+
+    monkeypatch.setattr(keys_module.jwt, "decode", counting_decode)
+    return calls
+
+
+def test_decode_is_cached_until_exp(monkeypatch):
+    calls = _count_decodes(monkeypatch)
+    token = create_access_token(sub="123", role="STUDENT", status="ACTIVE")
+    hits_before = verified_token_cache.hits
+
+    first = decode_access_token(token)
+    second = decode_access_token(token)
+
+    assert first["sub"] == second["sub"] == "123"
+    assert len(calls) == 1
+    assert verified_token_cache.hits == hits_before + 1
+
+
+def test_tampered_token_is_not_served_from_cache():
+    token = create_access_token(sub="124", role="STUDENT", status="ACTIVE")
+    decode_access_token(token)
+
+    header, payload, signature = token.split(".")
+    tampered = ".".join([header, payload, signature[:-2] + ("AA" if signature[-2:] != "AA" else "BB")])
+
+    with pytest.raises(jwt.InvalidTokenError):
+        decode_access_token(tampered)
+
+
+def test_expired_token_is_rejected_and_not_cached():
+    now = int(time.time())
+    token = jwt.encode(
+        {"sub": "125", "role": "STUDENT", "status": "ACTIVE", "iat": now - 120, "exp": now - 60},
+        settings.SECRET_KEY,
+        algorithm=settings.JWT_ALGORITHM,
+    )
+
+    size_before = verified_token_cache.stats()["size"]
+    with pytest.raises(jwt.ExpiredSignatureError):
+        decode_access_token(token)
+    assert verified_token_cache.stats()["size"] == size_before
+
+
+def test_caches_health_reports_hit_ratio():
+    # Métricas internas: sin token => 401; con ADMIN => 200
+    assert client.get("/health/caches").status_code == 401
+    r = client.get("/health/caches", headers=_admin_headers())
+    assert r.status_code == 200
+    data = r.json()
+    assert "hit_ratio" in data["verified_jwt"]
+    assert "hit_ratio" in data["principal"]
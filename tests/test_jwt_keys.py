@@ -0,0 +1,117 @@
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.modules.auth import jwks_router as jwks_module
+from app.modules.auth import security as security_module
+from app.modules.auth.keys import JWTKeyRing
+
+client = TestClient(app)
+
+HS_SECRET = "hs256-secret-not-used-in-asymmetric-mode"
+
+
+def _write_private_key(path, key) -> str:
+    path.write_bytes(
+        key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+    )
+    return str(path)
+
+
+def _write_public_key(path, key) -> str:
+    path.write_bytes(
+        key.public_key().public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+    )
+    return str(path)
+
+
+def _ring(private_files, public_files=()) -> JWTKeyRing:
+    return JWTKeyRing.from_files(
+        private_key_files=list(private_files),
+        public_key_files=list(public_files),
+        secret=HS_SECRET,
+        hs_algorithm="HS256",
+    )
+
+
+def test_eddsa_token_has_kid_and_verifies_with_public_jwk(tmp_path):
+    key = ed25519.Ed25519PrivateKey.generate()
+    ring = _ring([_write_private_key(tmp_path / "ed.pem", key)])
+
+    token = ring.encode({"sub": "1", "exp": 4102444800})
+    header = jwt.get_unverified_header(token)
+    assert header["alg"] == "EdDSA"
+
+    # Un tercero verifica solo con el JWKS publicado
+    jwk = jwt.PyJWKSet.from_json(ring.jwks_bytes.decode()).keys[0]
+    assert jwk.key_id == header["kid"]
+    assert jwt.decode(token, jwk.key, algorithms=["EdDSA"])["sub"] == "1"
+
+
+def test_rotation_keeps_verifying_tokens_of_previous_key(tmp_path):
+    old_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    new_key = ed25519.Ed25519PrivateKey.generate()
+    old_path = _write_private_key(tmp_path / "old.pem", old_key)
+    new_path = _write_private_key(tmp_path / "new.pem", new_key)
+
+    old_token = _ring([old_path]).encode({"sub": "7", "exp": 4102444800})
+
+    rotated = _ring([new_path, old_path])
+    assert rotated.decode(old_token)["sub"] == "7"
+    assert jwt.get_unverified_header(rotated.encode({"sub": "8", "exp": 4102444800}))["alg"] == "EdDSA"
+
+    # Clave retirada publicada solo como pública: sigue verificando
+    retired = _ring([new_path], [_write_public_key(tmp_path / "old.pub", old_key)])
+    assert retired.decode(old_token)["sub"] == "7"
+
+    # Sin la clave vieja => kid desconocido
+    with pytest.raises(jwt.InvalidTokenError):
+        _ring([new_path]).decode(old_token)
+
+
+def test_hs256_token_is_rejected_in_asymmetric_mode(tmp_path):
+    ring = _ring([_write_private_key(tmp_path / "ed.pem", ed25519.Ed25519PrivateKey.generate())])
+    forged = jwt.encode({"sub": "1", "exp": 4102444800}, HS_SECRET, algorithm="HS256")
+
+    with pytest.raises(jwt.InvalidTokenError):
+        ring.decode(forged)
+
+
+def test_login_and_me_with_asymmetric_keys(tmp_path, monkeypatch):
+    ring = _ring([_write_private_key(tmp_path / "ed.pem", ed25519.Ed25519PrivateKey.generate())])
+    monkeypatch.setattr(security_module, "jwt_key_ring", ring)
+    monkeypatch.setattr(jwks_module, "jwt_key_ring", ring)
+
+    email = "jwt_eddsa_login@test.com"
+    client.post("/auth/register", json={"email": email, "password": "Student123*", "role": "STUDENT"})
+    login = client.post("/auth/login", json={"email": email, "password": "Student123*"})
+    assert login.status_code == 200
+    token = login.json()["access_token"]
+    assert jwt.get_unverified_header(token)["alg"] == "EdDSA"
+
+    me = client.get("/auth/me", headers={"Authorization": f"Bearer {token}"})
+    assert me.status_code == 200
+
+    r = client.get("/.well-known/jwks.json")
+    assert r.status_code == 200
+    assert "max-age" in r.headers["Cache-Control"]
+    assert [k["kid"] for k in r.json()["keys"]] == [jwt.get_unverified_header(token)["kid"]]
+
+    cached = client.get("/.well-known/jwks.json", headers={"If-None-Match": r.headers["ETag"]})
+    assert cached.status_code == 304
+
+
+def test_jwks_is_empty_with_hs256():
+    r = client.get("/.well-known/jwks.json")
+    assert r.status_code == 200
+    assert r.json() == {"keys": []}
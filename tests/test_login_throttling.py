@@ -0,0 +1,103 @@
+import pytest
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from app.main import app
+from app.config.settings import settings
+from app.core.errors import TooManyRequestsError
+from app.core.hashing import PasswordHashingPool
+from app.modules.auth.throttling import InMemoryThrottleBackend, LoginThrottle, client_ip
+
+client = TestClient(app, raise_server_exceptions=False)
+
+
+def _throttle(**overrides) -> LoginThrottle:
+    options = dict(email_max_failures=2, email_window=60, ip_max_failures=100, ip_window=60)
+    options.update(overrides)
+    return LoginThrottle(InMemoryThrottleBackend(), **options)
+
+
+def test_throttle_blocks_email_after_max_failures():
+    throttle = _throttle()
+
+    throttle.check(email="a@test.com", client_ip="1.1.1.1")
+    throttle.register_failure(email="a@test.com", client_ip="1.1.1.1")
+    throttle.register_failure(email="A@test.com ", client_ip="1.1.1.1")
+
+    with pytest.raises(TooManyRequestsError) as exc_info:
+        throttle.check(email="a@test.com", client_ip="2.2.2.2")
+    assert 1 <= exc_info.value.retry_after <= 60
+
+    # otros emails desde la misma IP siguen permitidos
+    throttle.check(email="b@test.com", client_ip="1.1.1.1")
+
+
+def test_throttle_blocks_ip_across_emails():
+    throttle = _throttle(email_max_failures=100, ip_max_failures=3)
+
+    for i in range(3):
+        throttle.register_failure(email=f"user{i}@test.com", client_ip="9.9.9.9")
+
+    with pytest.raises(TooManyRequestsError):
+        throttle.check(email="other@test.com", client_ip="9.9.9.9")
+    throttle.check(email="other@test.com", client_ip="8.8.8.8")
+
+
+def test_successful_login_resets_email_counter():
+    throttle = _throttle()
+    throttle.register_failure(email="c@test.com", client_ip=None)
+    throttle.register_success(email="c@test.com")
+    throttle.register_failure(email="c@test.com", client_ip=None)
+
+    throttle.check(email="c@test.com", client_ip=None)
+
+
+def test_sliding_window_expires_old_failures():
+    backend = InMemoryThrottleBackend()
+    backend.hit("k", window=10, now=100.0)
+    backend.hit("k", window=10, now=105.0)
+
+    assert backend.count("k", window=10, now=109.0) == (2, 100.0)
+    assert backend.count("k", window=10, now=112.0) == (1, 105.0)
+    assert backend.count("k", window=10, now=200.0) == (0, None)
+
+
+def test_login_is_rejected_before_db_and_argon2(monkeypatch):
+    import app.modules.auth.service as service_module
+
+    email = "throttled_login@test.com"
+    client.post("/auth/register", json={"email": email, "password": "Student123*", "role": "STUDENT"})
+    monkeypatch.setattr(service_module, "login_throttle", _throttle())
+
+    for _ in range(2):
+        r = client.post("/auth/login", json={"email": email, "password": "WrongPass123*"})
+        assert r.status_code == 401
+
+    # si llegara a argon2 respondería 503 (pool saturado); debe cortar antes con 429
+    saturated = PasswordHashingPool(workers=0, max_queue=0)
+    saturated._admit()
+    monkeypatch.setattr(service_module, "password_hashing_pool", saturated)
+
+    r = client.post("/auth/login", json={"email": email, "password": "Student123*"})
+    assert r.status_code == 429
+    assert int(r.headers["Retry-After"]) >= 1
+    assert r.json()["error"]["type"] == "TooManyRequestsError"
+
+
+def _request(peer: str, forwarded_for: str | None = None) -> Request:
+    headers = [(b"x-forwarded-for", forwarded_for.encode())] if forwarded_for else []
+    return Request({"type": "http", "client": (peer, 1234), "headers": headers})
+
+
+def test_client_ip_trusts_forwarded_for_only_from_configured_proxies(monkeypatch):
+    # Sin proxies configurados: el header lo controla el cliente => se ignora
+    assert client_ip(_request("203.0.113.7", "1.2.3.4")) == "203.0.113.7"
+
+    monkeypatch.setattr(settings, "TRUSTED_PROXIES", ["10.0.0.0/8"])
+    # Detrás del proxy: cada cliente con su propio bucket, no el del proxy
+    assert client_ip(_request("10.0.0.2", "198.51.100.1")) == "198.51.100.1"
+    # Lo que el cliente agrega a la izquierda no sirve para rotar de bucket
+    assert client_ip(_request("10.0.0.2", "1.2.3.4, 198.51.100.1, 10.0.0.5")) == "198.51.100.1"
+    # Conexión directa (no proxy) con header falso => IP del peer
+    assert client_ip(_request("203.0.113.7", "1.2.3.4")) == "203.0.113.7"
+    assert client_ip(_request("10.0.0.2")) == "10.0.0.2"
@@ -0,0 +1,100 @@
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core.errors import ServiceUnavailableError
+from app.core.hashing import PasswordHashingPool
+
+client = TestClient(app, raise_server_exceptions=False)
+
+
+def _admin_headers() -> dict:
+    email = os.getenv("ADMIN_EMAIL", "admin@parladach.com")
+    r = client.post("/auth/login", json={"email": email, "password": os.getenv("ADMIN_PASSWORD", "Admin123*")})
+    assert r.status_code == 200, r.text
+    return {"Authorization": f"Bearer {r.json()['access_token']}"}
+
+
+def test_pool_hashes_and_verifies_in_worker_process():
+    pool = PasswordHashingPool(workers=1, max_queue=0)
+    try:
+        password_hash = pool.hash("Student123*")
+        assert "argon2" in password_hash
+        assert pool.verify("Student123*", password_hash) is True
+        assert pool.verify("WrongPass123*", password_hash) is False
+
+        stats = pool.stats()
+        assert stats["completed"] == 3
+        assert stats["in_flight"] == 0
+        assert stats["max_ms"] > 0
+    finally:
+        pool.shutdown()
+
+
+def test_pool_rejects_when_queue_is_full():
+    pool = PasswordHashingPool(workers=0, max_queue=1, retry_after=7)
+    # ocupa todos los slots (1 en ejecución + 1 en cola)
+    pool._admit()
+    pool._admit()
+
+    with pytest.raises(ServiceUnavailableError) as exc_info:
+        pool.hash("Student123*")
+
+    assert exc_info.value.retry_after == 7
+    assert pool.stats()["rejected"] == 1
+    assert pool.stats()["queue_depth"] == 1
+
+
+def test_login_returns_503_with_retry_after_when_pool_saturated(monkeypatch):
+    import app.modules.auth.service as service_module
+
+    email = "hash_pool_503@test.com"
+    client.post("/auth/register", json={"email": email, "password": "Student123*", "role": "STUDENT"})
+
+    saturated = PasswordHashingPool(workers=0, max_queue=0, retry_after=3)
+    saturated._admit()
+    monkeypatch.setattr(service_module, "password_hashing_pool", saturated)
+
+    r = client.post("/auth/login", json={"email": email, "password": "Student123*"})
+    assert r.status_code == 503
+    assert r.headers["Retry-After"] == "3"
+    assert r.json()["error"]["type"] == "ServiceUnavailableError"
+
+
+def test_hashing_health_reports_queue_depth():
+    # Métricas internas: sin token => 401; con ADMIN => 200
+    assert client.get("/health/hashing").status_code == 401
+    r = client.get("/health/hashing", headers=_admin_headers())
+    assert r.status_code == 200
+    data = r.json()
+    assert "queue_depth" in data
+    assert "avg_ms" in data
+
+
+def test_pool_caps_blocked_threads_below_capacity():
+    pool = PasswordHashingPool(workers=0, max_queue=10, max_blocking=1)
+    pool._admit(blocking=True)
+
+    # Hay capacidad, pero ya hay un hilo bloqueado esperando un hash
+    with pytest.raises(ServiceUnavailableError):
+        pool.hash("Student123*")
+    assert pool.stats()["rejected"] == 1
+
+
+def test_pool_recovers_from_broken_worker():
+    import os
+    from concurrent.futures.process import BrokenProcessPool
+
+    pool = PasswordHashingPool(workers=1, max_queue=0)
+    try:
+        assert pool.run(os.getpid) != os.getpid()
+        # Mata al worker: el pool queda BrokenProcessPool
+        with pytest.raises(BrokenProcessPool):
+            pool.run(os._exit, 1)
+        # El siguiente hash recrea el pool en lugar de fallar para siempre
+        assert "argon2" in pool.hash("Student123*")
+        assert pool.stats()["restarts"] >= 1
+    finally:
+        pool.shutdown()
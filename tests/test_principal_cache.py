@@ -0,0 +1,99 @@
+from contextlib import contextmanager
+
+from sqlalchemy import event, select, update, delete
+from sqlalchemy.orm import Session
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core.database import engine, get_db
+from app.core.enums import UserStatus
+from app.models.user import User
+from app.modules.auth.principal import principal_cache
+
+client = TestClient(app)
+
+
+def _cleanup_user(email: str) -> None:
+    db: Session = next(get_db())
+    db.execute(delete(User).where(User.email == email))
+    db.commit()
+
+
+def _register_and_login(email: str, password: str, role: str) -> str:
+    client.post("/auth/register", json={"email": email, "password": password, "role": role})
+    r = client.post("/auth/login", json={"email": email, "password": password})
+    assert r.status_code == 200
+    return r.json()["access_token"]
+
+
+@contextmanager
+def _capture_sql():
+    statements: list[str] = []
+
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _before)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _before)
+
+
+def test_second_request_skips_users_select():
+    email = "principal_cache_hit@test.com"
+    _cleanup_user(email)
+    token = _register_and_login(email, "Student123*", "STUDENT")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    assert client.get("/auth/me", headers=headers).status_code == 200
+
+    with _capture_sql() as statements:
+        r = client.get("/student/dashboard", headers=headers)
+    assert r.status_code == 200
+    assert not any("FROM users" in s for s in statements)
+
+
+def test_status_change_via_orm_invalidates_principal():
+    email = "principal_cache_orm@test.com"
+    _cleanup_user(email)
+    token = _register_and_login(email, "Student123*", "STUDENT")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    assert client.get("/auth/me", headers=headers).status_code == 200
+
+    db: Session = next(get_db())
+    user = db.execute(select(User).where(User.email == email)).scalar_one()
+    user.status = UserStatus.SUSPENDED
+    db.commit()
+    assert principal_cache.get(user.id) is None
+
+    assert client.get("/auth/me", headers=headers).status_code == 403
+
+
+def test_bulk_update_invalidates_principal():
+    email = "principal_cache_bulk@test.com"
+    _cleanup_user(email)
+    token = _register_and_login(email, "Student123*", "STUDENT")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    assert client.get("/student/dashboard", headers=headers).status_code == 200
+
+    db: Session = next(get_db())
+    db.execute(update(User).where(User.email == email).values(status=UserStatus.INACTIVE))
+    db.commit()
+
+    assert client.get("/student/dashboard", headers=headers).status_code == 403
+
+
+def test_principal_loaded_before_an_invalidation_is_not_cached():
+    from app.modules.auth import principal as principal_module
+    from app.modules.auth.principal import Principal, cache_generation, store_principal
+
+    stale = Principal(id=987654321, role="STUDENT", status=UserStatus.ACTIVE)
+    generation = cache_generation()
+    # Un commit invalida mientras la carga estaba en vuelo
+    principal_module._generation += 1
+
+    store_principal(stale, generation=generation)
+    assert principal_cache.get(stale.id) is None
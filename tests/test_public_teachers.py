@@ -1,3 +1,5 @@
+from datetime import datetime, timezone
+
 from sqlalchemy.orm import Session
 from sqlalchemy import select, delete
 from fastapi.testclient import TestClient
@@ -6,7 +8,10 @@ from app.main import app
 from app.core.database import get_db
 from app.models.user import User
 from app.modules.teacher.models import TeacherProfile
+from app.modules.teacher.schemas import PublicTeachersResponse
 from app.core.enums import TeacherProfileStatus
+from app.core.pagination import encode_cursor
+from app.modules.teacher.snapshot import catalog_snapshot
 
 client = TestClient(app)
 
@@ -66,7 +71,168 @@ def test_public_teachers_returns_only_approved_without_auth():
     draft_profile_id = r2.json()["profile"]["id"]
     assert draft_profile_id not in ids
 
+    # El JSON directo (sin response_model) respeta el schema
+    PublicTeachersResponse.model_validate(data)
+
     # no exponer campos sensibles
     for it in data["items"]:
         assert "email" not in it
         assert "user_id" not in it
+
+
+def test_public_teachers_cursor_pagination_walks_all_pages_without_duplicates():
+    emails = [f"teacher_pub_cursor_{i}@test.com" for i in range(3)]
+    expected_ids = set()
+    for email in emails:
+        _cleanup_user(email)
+        token = _register_and_login(email, "Teacher123*", "TEACHER")
+        r = client.post("/teacher/me/profile", json={"bio": "bio", "languages": ["es"]}, headers={"Authorization": f"Bearer {token}"})
+        assert r.status_code == 200
+        expected_ids.add(_set_profile_status(email, TeacherProfileStatus.APPROVED))
+
+    offset_ids = [it["teacher_profile_id"] for it in client.get("/public/teachers?limit=200").json()["items"]]
+
+    seen: list[int] = []
+    cursor = None
+    while True:
+        params = {"limit": 2} if cursor is None else {"limit": 2, "cursor": cursor}
+        resp = client.get("/public/teachers", params=params)
+        assert resp.status_code == 200
+        data = resp.json()
+        seen += [it["teacher_profile_id"] for it in data["items"]]
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    # Mismo orden que el modo offset, sin duplicados ni huecos
+    assert len(seen) == len(set(seen))
+    assert expected_ids <= set(seen)
+    assert seen[: len(offset_ids)] == offset_ids
+
+
+def test_public_teachers_rejects_invalid_cursor():
+    assert client.get("/public/teachers?cursor=no-es-un-cursor").status_code == 400
+    cursor = encode_cursor(datetime.now(timezone.utc), 1)
+    assert client.get("/public/teachers", params={"cursor": cursor}).status_code == 200
+    assert client.get("/public/teachers", params={"cursor": cursor, "offset": 1}).status_code == 400
+    # datetime sin zona (el orden en memoria no puede compararlo) => 400, no 500
+    naive = encode_cursor(datetime(2024, 1, 1), 5)
+    assert client.get("/public/teachers", params={"cursor": naive}).status_code == 400
+
+
+def test_public_teachers_language_filter_any_all_with_normalized_codes():
+    profiles = {
+        "teacher_lang_es@test.com": ["ES-cl"],
+        "teacher_lang_es_en@test.com": ["es", "EN_us", "es"],
+        "teacher_lang_it@test.com": ["it"],
+    }
+    ids = {}
+    for email, languages in profiles.items():
+        _cleanup_user(email)
+        token = _register_and_login(email, "Teacher123*", "TEACHER")
+        r = client.post("/teacher/me/profile", json={"bio": "bio", "languages": languages}, headers={"Authorization": f"Bearer {token}"})
+        assert r.status_code == 200
+        ids[email] = _set_profile_status(email, TeacherProfileStatus.APPROVED)
+
+    db: Session = next(get_db())
+    stored = db.execute(select(TeacherProfile.languages).where(TeacherProfile.id == ids["teacher_lang_es_en@test.com"])).scalar_one()
+    assert stored == ["es", "en"]
+
+    def _ids(params: dict) -> set[int]:
+        resp = client.get("/public/teachers", params={"limit": 200, **params})
+        assert resp.status_code == 200
+        return {it["teacher_profile_id"] for it in resp.json()["items"]} & set(ids.values())
+
+    assert _ids({"language": "ES"}) == {ids["teacher_lang_es@test.com"], ids["teacher_lang_es_en@test.com"]}
+    assert _ids({"language": ["en", "it"]}) == {ids["teacher_lang_es_en@test.com"], ids["teacher_lang_it@test.com"]}
+    assert _ids({"language": "es,en", "language_match": "all"}) == {ids["teacher_lang_es_en@test.com"]}
+
+    assert client.get("/public/teachers", params={"language": "español"}).status_code == 400
+
+    token = _register_and_login("teacher_lang_es@test.com", "Teacher123*", "TEACHER")
+    r = client.patch("/teacher/me/profile", json={"languages": ["??"]}, headers={"Authorization": f"Bearer {token}"})
+    assert r.status_code == 422
+
+
+def test_public_teachers_search_ranks_bio_matches_and_pages_with_cursor():
+    bios = {
+        "teacher_fts_1@test.com": ("Profesora de conversación y gramática avanzada, gramática para exámenes", ["es"]),
+        "teacher_fts_2@test.com": ("Clases de gramática para principiantes", ["es", "en"]),
+        "teacher_fts_3@test.com": ("English teacher: grammar and conversation", ["en"]),
+        "teacher_fts_draft@test.com": ("Gramática en borrador", ["es"]),
+    }
+    ids = {}
+    for email, (bio, languages) in bios.items():
+        _cleanup_user(email)
+        token = _register_and_login(email, "Teacher123*", "TEACHER")
+        r = client.post("/teacher/me/profile", json={"bio": bio, "languages": languages}, headers={"Authorization": f"Bearer {token}"})
+        assert r.status_code == 200
+        status = TeacherProfileStatus.DRAFT if "draft" in email else TeacherProfileStatus.APPROVED
+        ids[email] = _set_profile_status(email, status)
+
+    # Stemming en español (gramáticas ~ gramática) y solo APPROVED
+    resp = client.get("/public/teachers/search", params={"q": "gramáticas", "limit": 100})
+    assert resp.status_code == 200
+    found = [it["teacher_profile_id"] for it in resp.json()["items"]]
+    assert ids["teacher_fts_1@test.com"] in found
+    assert ids["teacher_fts_2@test.com"] in found
+    assert ids["teacher_fts_draft@test.com"] not in found
+    # Más apariciones => mejor rank
+    assert found.index(ids["teacher_fts_1@test.com"]) < found.index(ids["teacher_fts_2@test.com"])
+
+    # Stemming en inglés + filtro de idioma
+    resp = client.get("/public/teachers/search", params={"q": "teachers grammar", "language": "en"})
+    assert [it["teacher_profile_id"] for it in resp.json()["items"]] == [ids["teacher_fts_3@test.com"]]
+
+    # Cursor (rank, id): mismas filas que una sola página
+    paged: list[int] = []
+    params = {"q": "gramática OR grammar", "limit": 1}
+    while True:
+        data = client.get("/public/teachers/search", params=params).json()
+        paged += [it["teacher_profile_id"] for it in data["items"]]
+        if data["next_cursor"] is None:
+            break
+        params["cursor"] = data["next_cursor"]
+    single = client.get("/public/teachers/search", params={"q": "gramática OR grammar", "limit": 100}).json()
+    assert paged == [it["teacher_profile_id"] for it in single["items"]]
+
+
+def test_public_teachers_hot_pages_served_from_shared_snapshot(tmp_path, monkeypatch):
+    email = "teacher_pub_snapshot@test.com"
+    _cleanup_user(email)
+    token = _register_and_login(email, "Teacher123*", "TEACHER")
+    r = client.post("/teacher/me/profile", json={"bio": "bio snapshot", "languages": ["es"]}, headers={"Authorization": f"Bearer {token}"})
+    assert r.status_code == 200
+    profile_id = _set_profile_status(email, TeacherProfileStatus.APPROVED)
+
+    first = client.get("/public/teachers", params={"limit": 2})
+    second = client.get("/public/teachers", params={"limit": 2, "cursor": first.json()["next_cursor"]})
+
+    monkeypatch.setattr(catalog_snapshot, "path", str(tmp_path / "catalog.bin"))
+    monkeypatch.setattr(catalog_snapshot, "page_size", 2)
+    catalog_snapshot.build()
+
+    hits = catalog_snapshot.hits
+    resp = client.get("/public/teachers", params={"limit": 2}, headers={"Accept-Encoding": "gzip"})
+    assert resp.headers["content-encoding"] == "gzip"
+    assert resp.headers["vary"] == "Accept-Encoding"
+    assert resp.json() == first.json()
+    # Mismo validador que la respuesta dinámica (débil por ir comprimida)
+    assert resp.headers["etag"] == f"W/{first.headers['etag']}"
+    assert client.get("/public/teachers", params={"limit": 2}, headers={"If-None-Match": first.headers["etag"]}).status_code == 304
+
+    # Página siguiente por cursor, sin comprimir
+    resp = client.get("/public/teachers", params={"limit": 2, "cursor": first.json()["next_cursor"]}, headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in resp.headers
+    assert resp.json() == second.json()
+    assert catalog_snapshot.hits == hits + 3
+
+    # Commit local => no se sirve el snapshot viejo; el nuevo ya no incluye el perfil
+    _set_profile_status(email, TeacherProfileStatus.DRAFT)
+    ids = [it["teacher_profile_id"] for it in client.get("/public/teachers", params={"limit": 2}).json()["items"]]
+    assert profile_id not in ids
+    catalog_snapshot.build()
+    hits = catalog_snapshot.hits
+    ids = [it["teacher_profile_id"] for it in client.get("/public/teachers", params={"limit": 2}).json()["items"]]
+    assert catalog_snapshot.hits == hits + 1
+    assert profile_id not in ids
@@ -9,6 +9,7 @@ from app.main import app
 from app.core.database import get_db
 from app.models.user import User
 from app.core.enums import TeacherProfileStatus
+from app.modules.teacher.schemas import TeacherProfileListResponse
 
 client = TestClient(app)
 
@@ -78,3 +79,93 @@ def test_admin_can_list_in_review_profiles():
     data = r.json()
     assert "items" in data
     assert any(item["user_id"] == create.json()["profile"]["user_id"] for item in data["items"])
+    # Filas proyectadas => mismo JSON que el schema (campos y formato)
+    item = next(item for item in data["items"] if item["user_id"] == create.json()["profile"]["user_id"])
+    assert item == create.json()["profile"] | {"status": "IN_REVIEW", "updated_at": item["updated_at"], "version": 2}
+    TeacherProfileListResponse.model_validate(data)
+
+
+def _exact_count(*statuses: TeacherProfileStatus) -> int:
+    from sqlalchemy import func
+    from app.modules.teacher.models import TeacherProfile
+
+    db: Session = next(get_db())
+    return db.execute(
+        select(func.count()).select_from(TeacherProfile).where(TeacherProfile.status.in_(statuses))
+    ).scalar_one()
+
+
+def test_admin_list_totals_come_from_status_counters_and_cursor_pages():
+    emails = [f"teacher_admin_cursor_{i}@test.com" for i in range(3)]
+    profile_ids = []
+    for i, email in enumerate(emails):
+        _cleanup_user(email)
+        _register_user(email, "Teacher123*", "TEACHER")
+        token = _login(email, "Teacher123*")
+        create = client.post("/teacher/me/profile", json={}, headers={"Authorization": f"Bearer {token}"})
+        assert create.status_code == 200
+        profile_ids.append(create.json()["profile"]["id"])
+        _set_profile_status(email, TeacherProfileStatus.IN_REVIEW if i < 2 else TeacherProfileStatus.PAUSED)
+
+    headers = {"Authorization": f"Bearer {_login_admin_from_env_or_defaults()}"}
+
+    # Contadores por trigger == COUNT(*) real (también con varios status)
+    r = client.get("/admin/teachers?status=IN_REVIEW&status=PAUSED", headers=headers)
+    assert r.status_code == 200
+    assert r.json()["total"] == _exact_count(TeacherProfileStatus.IN_REVIEW, TeacherProfileStatus.PAUSED)
+
+    # Cursor: recorre todo sin duplicados, por id ascendente
+    seen: list[int] = []
+    params = {"status": "IN_REVIEW,PAUSED", "limit": 1, "total_mode": "none"}
+    while True:
+        data = client.get("/admin/teachers", params=params, headers=headers).json()
+        assert data["total"] is None
+        seen += [item["id"] for item in data["items"]]
+        if data["next_cursor"] is None:
+            break
+        params["cursor"] = data["next_cursor"]
+    assert seen == sorted(set(seen))
+    assert set(profile_ids) <= set(seen)
+
+    # Borrar usuarios (cascade) también descuenta
+    before = client.get("/admin/teachers?status=PAUSED", headers=headers).json()["total"]
+    _cleanup_user(emails[2])
+    after = client.get("/admin/teachers?status=PAUSED", headers=headers).json()["total"]
+    assert after == before - 1 == _exact_count(TeacherProfileStatus.PAUSED)
+
+
+def test_admin_list_created_range_with_exact_and_estimated_totals():
+    headers = {"Authorization": f"Bearer {_login_admin_from_env_or_defaults()}"}
+    params = {"created_from": "2000-01-01T00:00:00Z", "created_to": "2100-01-01T00:00:00Z"}
+
+    exact = client.get("/admin/teachers", params=params, headers=headers)
+    assert exact.status_code == 200
+    assert exact.json()["total"] == client.get("/admin/teachers", headers=headers).json()["total"]
+
+    estimate = client.get("/admin/teachers", params={**params, "total_mode": "estimate"}, headers=headers)
+    assert estimate.status_code == 200
+    assert isinstance(estimate.json()["total"], int)
+
+    empty = client.get("/admin/teachers", params={"created_to": "2000-01-01T00:00:00Z"}, headers=headers)
+    assert empty.json()["items"] == []
+    assert empty.json()["total"] == 0
+
+    # Filtro por idioma => COUNT filtrado (no los contadores por status)
+    none = client.get("/admin/teachers", params={"language": "zz"}, headers=headers)
+    assert none.status_code == 200
+    assert none.json()["total"] == 0
+    assert none.json()["items"] == []
+
+
+def test_admin_list_estimate_with_all_languages_filter():
+    headers = {"Authorization": f"Bearer {_login_admin_from_env_or_defaults()}"}
+    params = [("language", "es"), ("language", "en"), ("language_match", "all")]
+
+    # estimate compila la query con literales: el @> JSONB también debe poder
+    estimate = client.get("/admin/teachers", params=params + [("total_mode", "estimate")], headers=headers)
+    assert estimate.status_code == 200, estimate.text
+    assert isinstance(estimate.json()["total"], int)
+
+    exact = client.get("/admin/teachers", params=params, headers=headers)
+    assert exact.status_code == 200
+    assert all({"es", "en"} <= set(item["languages"]) for item in exact.json()["items"])
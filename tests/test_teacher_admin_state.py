@@ -2,11 +2,11 @@ from __future__ import annotations
 
 import os
 from sqlalchemy.orm import Session
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, event
 from fastapi.testclient import TestClient
 
 from app.main import app
-from app.core.database import get_db
+from app.core.database import engine, get_db
 from app.models.user import User
 from app.core.enums import TeacherProfileStatus
 from app.modules.teacher.models import TeacherProfile
@@ -120,3 +120,81 @@ def test_non_admin_gets_403():
 
     r = client.post("/admin/teachers/1/approve", headers={"Authorization": f"Bearer {token}"})
     assert r.status_code == 403
+
+
+def test_admin_bulk_moderation_reports_per_id_outcomes():
+    admin_token = _login_admin()
+
+    ids = {}
+    for name, initial in (("review", TeacherProfileStatus.IN_REVIEW), ("approved", TeacherProfileStatus.APPROVED), ("draft", TeacherProfileStatus.DRAFT)):
+        email = f"teacher_bulk_{name}@test.com"
+        _cleanup_user(email)
+        _register_user(email, "Teacher123*", "TEACHER")
+        token = _login(email, "Teacher123*")
+        assert client.post("/teacher/me/profile", json={}, headers={"Authorization": f"Bearer {token}"}).status_code == 200
+        ids[name] = _set_profile_status_by_user(email, initial)
+
+    # Calienta el listado público: el UPDATE masivo debe invalidarlo
+    assert ids["review"] not in [it["teacher_profile_id"] for it in client.get("/public/teachers?limit=200").json()["items"]]
+
+    missing_id = 2_000_000_000
+    r = client.post(
+        "/admin/teachers/bulk",
+        json={"action": "approve", "ids": [ids["review"], ids["approved"], ids["draft"], missing_id, ids["review"]]},
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+    assert r.status_code == 200
+    data = r.json()
+    assert data["updated"] == 1
+    assert data["items"] == [
+        {"id": ids["review"], "result": "updated", "status": "APPROVED"},
+        {"id": ids["approved"], "result": "unchanged", "status": "APPROVED"},
+        {"id": ids["draft"], "result": "invalid_transition", "status": "DRAFT"},
+        {"id": missing_id, "result": "not_found", "status": None},
+    ]
+
+    db: Session = next(get_db())
+    assert db.get(TeacherProfile, ids["review"]).status == TeacherProfileStatus.APPROVED
+    assert ids["review"] in [it["teacher_profile_id"] for it in client.get("/public/teachers?limit=200").json()["items"]]
+
+    r = client.post("/admin/teachers/bulk", json={"action": "delete", "ids": [ids["review"]]}, headers={"Authorization": f"Bearer {admin_token}"})
+    assert r.status_code == 422
+
+
+def test_approve_reads_server_values_from_returning():
+    teacher_email = "teacher_approve_returning@test.com"
+    _cleanup_user(teacher_email)
+
+    admin_token = _login_admin()
+    _register_user(teacher_email, "Teacher123*", "TEACHER")
+    teacher_token = _login(teacher_email, "Teacher123*")
+    created = client.post("/teacher/me/profile", json={}, headers={"Authorization": f"Bearer {teacher_token}"})
+    assert created.status_code == 200
+    profile_id = _set_profile_status_by_user(teacher_email, TeacherProfileStatus.IN_REVIEW)
+
+    statements: list[str] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(" ".join(statement.split()))
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        r = client.post(
+            f"/admin/teachers/{profile_id}/approve",
+            headers={"Authorization": f"Bearer {admin_token}"},
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+    assert r.status_code == 200, r.text
+
+    # updated_at / version (trigger) vuelven en el UPDATE: sin refresh posterior
+    updates = [i for i, s in enumerate(statements) if s.startswith("UPDATE teacher_profiles")]
+    assert len(updates) == 1
+    assert "RETURNING" in statements[updates[0]]
+    assert not [s for s in statements[updates[0] + 1:] if s.startswith("SELECT") and "FROM teacher_profiles" in s]
+
+    db: Session = next(get_db())
+    stored = db.get(TeacherProfile, profile_id)
+    body = r.json()["profile"]
+    assert body["version"] == stored.version
+    assert body["updated_at"] is not None
@@ -0,0 +1,110 @@
+from contextlib import contextmanager
+
+from sqlalchemy import event, select, delete
+from sqlalchemy.orm import Session
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core.database import engine, get_db
+from app.core.enums import TeacherProfileStatus
+from app.models.user import User
+from app.modules.teacher import cache as teacher_cache
+from app.modules.teacher.catalog import catalog_index
+from app.modules.teacher.models import TeacherProfile
+from app.modules.teacher.service import TeacherService
+
+client = TestClient(app)
+
+
+def _cleanup_user(email: str) -> None:
+    db: Session = next(get_db())
+    db.execute(delete(User).where(User.email == email))
+    db.commit()
+
+
+def _register_and_login(email: str, password: str, role: str) -> str:
+    client.post("/auth/register", json={"email": email, "password": password, "role": role})
+    r = client.post("/auth/login", json={"email": email, "password": password})
+    assert r.status_code == 200
+    return r.json()["access_token"]
+
+
+def _set_profile_status(profile_id: int, status: TeacherProfileStatus) -> None:
+    db: Session = next(get_db())
+    db.execute(select(TeacherProfile).where(TeacherProfile.id == profile_id)).scalar_one().status = status
+    db.commit()
+
+
+@contextmanager
+def _capture_sql():
+    statements: list[str] = []
+
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _before)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _before)
+
+
+def test_my_profile_is_read_from_db_each_time():
+    email = "teacher_cache_me@test.com"
+    _cleanup_user(email)
+    headers = {"Authorization": f"Bearer {_register_and_login(email, 'Teacher123*', 'TEACHER')}"}
+    assert client.post("/teacher/me/profile", json={"bio": "v1", "languages": ["es"]}, headers=headers).status_code == 200
+
+    # Sin cache por worker (ETag = If-Match): una sola lectura por índice único
+    with _capture_sql() as statements:
+        assert client.get("/teacher/me/profile", headers=headers).json()["profile"]["bio"] == "v1"
+    assert sum("FROM teacher_profiles" in s for s in statements) == 1
+
+    assert client.patch("/teacher/me/profile", json={"bio": "v2"}, headers=headers).status_code == 200
+    assert client.get("/teacher/me/profile", headers=headers).json()["profile"]["bio"] == "v2"
+
+
+def test_admin_list_cache_is_invalidated_only_for_affected_statuses():
+    email = "teacher_cache_admin@test.com"
+    _cleanup_user(email)
+    token = _register_and_login(email, "Teacher123*", "TEACHER")
+    r = client.post("/teacher/me/profile", json={"bio": "bio", "languages": ["es"]}, headers={"Authorization": f"Bearer {token}"})
+    profile_id = r.json()["profile"]["id"]
+
+    service_args = dict(limit=10, offset=0, total_mode="exact")
+    db: Session = next(get_db())
+    TeacherService().admin_list_profiles(db, status="PAUSED", **service_args)
+    TeacherService().admin_list_profiles(db, status="IN_REVIEW", **service_args)
+    paused_key = ((TeacherProfileStatus.PAUSED,), 10, 0, None, None, None, "exact", (), "any")
+    in_review_key = ((TeacherProfileStatus.IN_REVIEW,), 10, 0, None, None, None, "exact", (), "any")
+    assert teacher_cache.admin_list_cache.get(paused_key) is not None
+
+    # DRAFT -> IN_REVIEW: no toca las páginas de PAUSED
+    _set_profile_status(profile_id, TeacherProfileStatus.IN_REVIEW)
+    assert teacher_cache.admin_list_cache.get(paused_key) is not None
+    assert teacher_cache.admin_list_cache.get(in_review_key) is None
+
+    hits = teacher_cache.stats()["admin_list"]["hits"]
+    TeacherService().admin_list_profiles(db, status="PAUSED", **service_args)
+    assert teacher_cache.stats()["admin_list"]["hits"] == hits + 1
+
+
+def test_public_list_cache_sees_new_approvals(monkeypatch):
+    monkeypatch.setattr(catalog_index, "enabled", False)  # fuerza la ruta SQL + cache
+
+    email = "teacher_cache_public@test.com"
+    _cleanup_user(email)
+    token = _register_and_login(email, "Teacher123*", "TEACHER")
+    r = client.post("/teacher/me/profile", json={"bio": "bio", "languages": ["es"]}, headers={"Authorization": f"Bearer {token}"})
+    profile_id = r.json()["profile"]["id"]
+
+    def _ids() -> list[int]:
+        return [it["teacher_profile_id"] for it in client.get("/public/teachers?limit=200").json()["items"]]
+
+    assert profile_id not in _ids()
+    with _capture_sql() as statements:
+        _ids()
+    assert not any("FROM teacher_profiles" in s for s in statements)
+
+    _set_profile_status(profile_id, TeacherProfileStatus.APPROVED)
+    assert profile_id in _ids()
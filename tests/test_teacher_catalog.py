@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select, delete
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core.database import SessionLocal, get_db
+from app.core.enums import TeacherProfileStatus
+from app.models.user import User
+from app.modules.teacher import events
+from app.modules.teacher.catalog import CatalogEntry, CatalogIndex, _CatalogState, catalog_index
+from app.modules.teacher.models import TeacherProfile
+from app.modules.teacher.service import TeacherService
+
+client = TestClient(app)
+
+
+def _cleanup_user(email: str) -> None:
+    db: Session = next(get_db())
+    db.execute(delete(User).where(User.email == email))
+    db.commit()
+
+
+def _create_profile(email: str, bio: str, languages: list[str], status: TeacherProfileStatus) -> int:
+    _cleanup_user(email)
+    client.post("/auth/register", json={"email": email, "password": "Teacher123*", "role": "TEACHER"})
+    token = client.post("/auth/login", json={"email": email, "password": "Teacher123*"}).json()["access_token"]
+    r = client.post("/teacher/me/profile", json={"bio": bio, "languages": languages}, headers={"Authorization": f"Bearer {token}"})
+    assert r.status_code == 200
+
+    db: Session = next(get_db())
+    profile = db.execute(select(TeacherProfile).where(TeacherProfile.id == r.json()["profile"]["id"])).scalar_one()
+    profile.status = status
+    db.commit()
+    return profile.id
+
+
+def test_catalog_state_orders_filters_and_counts_facets():
+    t0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    state = _CatalogState([
+        CatalogEntry(1, "Clases de gramática", ("es",), None, t0),
+        CatalogEntry(2, "Grammar lessons", ("en",), None, t0 + timedelta(days=1)),
+        CatalogEntry(3, "Gramatica y conversación", ("es", "en"), None, t0),
+    ])
+
+    # created_at DESC, id DESC
+    assert [e.id for e in state.page(state.alive, limit=10, offset=0, after=None)] == [2, 3, 1]
+
+    base, matched = state.candidates(languages=["es"], match="any")
+    assert [e.id for e in state.page(matched, limit=10, offset=0, after=None)] == [3, 1]
+    assert state.facets(base, matched) == {"total": 2, "languages": {"es": 2, "en": 2}}
+    _, both = state.candidates(languages=["es", "en"], match="all")
+    assert [e.id for e in state.page(both, limit=10, offset=0, after=None)] == [3]
+
+    # Delta: 3 deja de tener "es"; 1 sale del catálogo (tombstone)
+    state.upsert(CatalogEntry(3, "Gramatica y conversación", ("en",), None, t0))
+    state.remove(1)
+    _, matched = state.candidates(languages=["es"], match="any")
+    assert matched == 0
+    assert state.tombstones == 2
+    assert [e.id for e in state.page(state.alive, limit=10, offset=0, after=(t0 + timedelta(days=1), 2))] == [3]
+
+
+def test_catalog_applies_commits_as_deltas_and_matches_sql_facets():
+    a = _create_profile("teacher_catalog_a@test.com", "Profesora nativa de italiano", ["it", "es"], TeacherProfileStatus.APPROVED)
+    b = _create_profile("teacher_catalog_b@test.com", "Profesor nativo de italiano", ["it"], TeacherProfileStatus.IN_REVIEW)
+
+    before = client.get("/public/teachers/facets").json()
+
+    # Aprobación vía ORM => delta (sin recarga completa)
+    rebuilds = catalog_index.rebuilds
+    db: Session = next(get_db())
+    db.execute(select(TeacherProfile).where(TeacherProfile.id == b)).scalar_one().status = TeacherProfileStatus.APPROVED
+    db.commit()
+
+    after = client.get("/public/teachers/facets").json()
+    assert after["languages"]["it"] == before["languages"]["it"] + 1
+    assert after["languages"].get("es") == before["languages"].get("es")
+    assert catalog_index.rebuilds == rebuilds
+
+    ids = [it["teacher_profile_id"] for it in client.get("/public/teachers", params={"language": "it", "limit": 200}).json()["items"]]
+    assert {a, b} <= set(ids)
+
+    # Mismos números que el fallback SQL, con y sin filtro de idioma
+    db: Session = next(get_db())
+    service = TeacherService()
+    assert client.get("/public/teachers/facets").json() == service.public_language_facets(db)
+    params = {"language": ["es", "it"], "language_match": "all"}
+    assert client.get("/public/teachers/facets", params=params).json() == service.public_language_facets(
+        db, languages=["es", "it"], language_match="all"
+    )
+
+    # q => misma búsqueda full-text que /search (stemming: "italianos" ~ "italiano")
+    searched = client.get("/public/teachers/facets", params={"q": "italianos"}).json()
+    assert searched == service.public_language_facets(db, q="italianos")
+    assert searched["languages"]["it"] >= 2
+
+    # Borrar el usuario (cascade en DB) => recarga completa
+    _cleanup_user("teacher_catalog_b@test.com")
+    final = client.get("/public/teachers/facets").json()
+    assert final["languages"]["it"] == before["languages"]["it"]
+
+
+def test_catalog_keeps_serving_while_syncing_or_after_a_failed_reload():
+    failing = False
+
+    def session_factory() -> Session:
+        if failing:
+            raise OperationalError("SELECT", {}, Exception("DB caída"))
+        return SessionLocal()
+
+    index = CatalogIndex(enabled=True, refresh_seconds=3600, session_factory=session_factory)
+    loaded = index.facets()
+    assert index.rebuilds == 1
+
+    # Otro hilo sincronizando => no se espera: se responde con el estado actual
+    index.invalidate(None)
+    with index._sync_lock:
+        assert index.facets() == loaded
+    assert index.rebuilds == 1
+
+    # Recarga fallida => se loguea y se sigue sirviendo; los deltas se conservan
+    failing = True
+    index.invalidate([events.ProfileChange(profile_id=-1, user_id=-1, statuses=frozenset())])
+    assert index.facets() == loaded
+    assert index.stats()["pending"] == 1
+
+    failing = False
+    assert index.facets() == loaded
+    assert index.rebuilds == 2
+    assert index.stats()["pending"] == 0
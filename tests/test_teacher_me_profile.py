@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from sqlalchemy.orm import Session
 from sqlalchemy import select, delete
 from fastapi.testclient import TestClient
@@ -69,9 +71,10 @@ def test_teacher_can_create_and_get_profile():
     assert data["created_at"] is not None
     assert data["updated_at"] is not None
 
-    # GET ahora debe retornar el perfil
+    # GET ahora debe retornar el perfil (mismo ETag que devolvió el POST)
     r3 = client.get("/teacher/me/profile", headers={"Authorization": f"Bearer {token}"})
     assert r3.status_code == 200
+    assert r3.headers["etag"] == r2.headers["etag"]
     data2 = r3.json()["profile"]
     assert data2["id"] == data["id"]
     assert data2["status"] == "DRAFT"
@@ -138,4 +141,76 @@ def test_teacher_patch_on_approved_sets_in_review_when_key_fields_change():
     assert data["status"] == "IN_REVIEW"
 
 
-    
\ No newline at end of file
+    
+
+def test_teacher_patch_with_stale_if_match_returns_412_without_overwriting():
+    email = "teacher_patch_if_match@test.com"
+    _cleanup_user(email)
+
+    headers = {"Authorization": f"Bearer {_register_and_login(email, 'Teacher123*', 'TEACHER')}"}
+    assert client.post("/teacher/me/profile", json={"bio": "v1"}, headers=headers).status_code == 200
+    etag = client.get("/teacher/me/profile", headers=headers).headers["etag"]
+
+    # Pestaña A edita con el ETag vigente
+    r = client.patch("/teacher/me/profile", json={"bio": "tab A"}, headers={**headers, "If-Match": etag})
+    assert r.status_code == 200
+    assert r.headers["etag"] != etag
+    assert r.json()["profile"]["version"] == 2
+
+    # Pestaña B todavía tiene el ETag viejo => 412, no pisa a A
+    r = client.patch("/teacher/me/profile", json={"bio": "tab B"}, headers={**headers, "If-Match": etag})
+    assert r.status_code == 412
+    assert client.get("/teacher/me/profile", headers=headers).json()["profile"]["bio"] == "tab A"
+
+
+def test_teacher_patch_without_changes_skips_write_and_keeps_approved():
+    email = "teacher_patch_noop@test.com"
+    _cleanup_user(email)
+
+    headers = {"Authorization": f"Bearer {_register_and_login(email, 'Teacher123*', 'TEACHER')}"}
+    assert client.post("/teacher/me/profile", json={"bio": "igual", "languages": ["es"]}, headers=headers).status_code == 200
+    _set_teacher_profile_status(email, TeacherProfileStatus.APPROVED)
+    before = client.get("/teacher/me/profile", headers=headers).json()["profile"]
+
+    r = client.patch("/teacher/me/profile", json={"bio": "igual", "languages": ["ES"]}, headers=headers)
+    assert r.status_code == 200
+    assert r.json()["profile"] == before
+
+
+def test_concurrent_profile_creation_is_idempotent():
+    email = "teacher_profile_race@test.com"
+    _cleanup_user(email)
+
+    token = _register_and_login(email, "Teacher123*", "TEACHER")
+
+    def create(_):
+        r = client.post("/teacher/me/profile", json={"bio": "Hola"}, headers={"Authorization": f"Bearer {token}"})
+        return r.status_code, r.json()["profile"]["id"]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(create, range(8)))
+
+    # Todas 200 y el mismo perfil (ON CONFLICT => se devuelve el existente)
+    assert {code for code, _ in results} == {200}
+    assert len({profile_id for _, profile_id in results}) == 1
+
+
+def test_get_profile_sees_writes_from_other_workers():
+    from sqlalchemy import update
+    from app.core.database import engine
+
+    email = "teacher_profile_other_worker@test.com"
+    _cleanup_user(email)
+    token = _register_and_login(email, "Teacher123*", "TEACHER")
+    headers = {"Authorization": f"Bearer {token}"}
+    client.post("/teacher/me/profile", json={"bio": "antes"}, headers=headers)
+    first = client.get("/teacher/me/profile", headers=headers)
+
+    # Escritura sin pasar por la sesión de este proceso (como la de otro worker)
+    with engine.begin() as conn:
+        conn.execute(update(TeacherProfile).where(TeacherProfile.id == first.json()["profile"]["id"]).values(bio="después"))
+
+    r = client.get("/teacher/me/profile", headers={**headers, "If-None-Match": first.headers["etag"]})
+    assert r.status_code == 200
+    assert r.json()["profile"]["bio"] == "después"
+    assert r.headers["etag"] != first.headers["etag"]
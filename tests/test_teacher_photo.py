@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import hashlib
+import io
+
+import pytest
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core.database import get_db
+from app.config.settings import settings
+from app.core.process_pool import BoundedProcessPool
+from app.models.user import User
+from app.modules.teacher import photos
+from app.modules.teacher.catalog import CatalogEntry
+from app.modules.teacher.models import TeacherProfile
+from app.modules.teacher.schemas import PublicTeacherItem
+
+client = TestClient(app)
+
+# Pillow no es dependencia de los tests: el render se reemplaza por uno que
+# solo etiqueta los bytes (lo que se prueba es el pipeline y el storage)
+renders: list[bytes] = []
+render_thumbnails = photos.render_thumbnails
+
+
+def _fake_render(data: bytes, sizes: tuple[int, ...]) -> dict[int, bytes]:
+    if not data.startswith(b"\xff\xd8"):
+        raise ValueError("imagen inválida")
+    renders.append(data)
+    return {size: b"thumb-%d" % size for size in sizes}
+
+
+@pytest.fixture(autouse=True)
+def _photo_pipeline(monkeypatch, tmp_path):
+    renders.clear()
+    monkeypatch.setattr(photos, "photo_storage", photos.LocalPhotoStorage(str(tmp_path)))
+    monkeypatch.setattr(photos, "thumbnail_pool", BoundedProcessPool(name="thumbnails", workers=0, max_queue=4))
+    monkeypatch.setattr(photos, "PILLOW_AVAILABLE", True)
+    monkeypatch.setattr(photos, "render_thumbnails", _fake_render)
+
+
+def _cleanup_user(email: str) -> None:
+    db: Session = next(get_db())
+    db.execute(delete(User).where(User.email == email))
+    db.commit()
+
+
+def _teacher_with_profile(email: str) -> dict:
+    _cleanup_user(email)
+    client.post("/auth/register", json={"email": email, "password": "Teacher123*", "role": "TEACHER"})
+    r = client.post("/auth/login", json={"email": email, "password": "Teacher123*"})
+    headers = {"Authorization": f"Bearer {r.json()['access_token']}"}
+    assert client.post("/teacher/me/profile", json={}, headers=headers).status_code == 200
+    return headers
+
+
+def _upload(headers: dict, body: bytes, content_type: str = "image/jpeg"):
+    return client.post(
+        "/teacher/me/profile/photo",
+        content=body,
+        headers={**headers, "Content-Type": content_type},
+    )
+
+
+def test_upload_stores_variants_by_hash_and_serves_them_immutable(monkeypatch):
+    headers = _teacher_with_profile("teacher_photo@test.com")
+    body = b"\xff\xd8" + b"foto" * 1000
+    photo_hash = hashlib.sha256(body).hexdigest()
+    small, large = min(settings.PHOTO_THUMBNAIL_SIZES), max(settings.PHOTO_THUMBNAIL_SIZES)
+
+    r = _upload(headers, body)
+    assert r.status_code == 200, r.text
+    profile = r.json()["profile"]
+    # El perfil apunta a la variante grande, nunca al original
+    assert profile["photo_url"] == f"/media/photos/{photo_hash}/{large}.jpg"
+    assert r.headers["etag"] == f'"v{profile["version"]}"'
+
+    media = client.get(f"/media/photos/{photo_hash}/{small}.jpg")
+    assert media.status_code == 200
+    assert media.content == b"thumb-%d" % small
+    assert "immutable" in media.headers["cache-control"]
+    # El original no se expone
+    assert client.get(f"/media/photos/{photo_hash}/original").status_code == 404
+
+    # Misma foto otra vez => ya está guardada, no se vuelve a procesar
+    again = _upload(headers, body)
+    assert again.status_code == 200
+    assert len(renders) == 1
+
+    # Nuevo lado intermedio configurado => la misma foto se vuelve a procesar y la variante existe
+    monkeypatch.setattr(settings, "PHOTO_THUMBNAIL_SIZES", [*settings.PHOTO_THUMBNAIL_SIZES, 320])
+    assert _upload(headers, body).status_code == 200
+    assert len(renders) == 2
+    assert client.get(f"/media/photos/{photo_hash}/320.jpg").content == b"thumb-320"
+
+    # Los listados usan la miniatura chica
+    entry = CatalogEntry(profile["id"], "", (), profile["photo_url"], None, photo_hash=photo_hash)
+    assert PublicTeacherItem.payload(entry)["photo_url"] == f"/media/photos/{photo_hash}/{small}.jpg"
+
+    # photo_url puesta a mano => deja de apuntar a las miniaturas
+    patched = client.patch("/teacher/me/profile", json={"photo_url": "https://example.com/yo.png"}, headers=headers)
+    assert patched.status_code == 200
+    db: Session = next(get_db())
+    stored = db.execute(select(TeacherProfile).where(TeacherProfile.id == profile["id"])).scalar_one()
+    assert stored.photo_hash is None
+
+
+def test_upload_rejects_bad_type_size_and_content(monkeypatch):
+    headers = _teacher_with_profile("teacher_photo_bad@test.com")
+
+    assert _upload(headers, b"GIF89a", content_type="image/gif").status_code == 415
+    assert _upload(headers, b"no es imagen").status_code == 422
+
+    monkeypatch.setattr(settings, "PHOTO_MAX_BYTES", 10)
+    assert _upload(headers, b"\xff\xd8" + b"x" * 100).status_code == 413
+    assert renders == []
+
+
+def test_upload_checks_profile_before_processing(monkeypatch):
+    headers = _teacher_with_profile("teacher_photo_checks@test.com")
+
+    # If-Match viejo => 412 sin leer ni procesar la foto
+    stale = client.post(
+        "/teacher/me/profile/photo",
+        content=b"\xff\xd8foto",
+        headers={**headers, "Content-Type": "image/jpeg", "If-Match": '"v999"'},
+    )
+    assert stale.status_code == 412
+    assert renders == []
+
+    # Sin Pillow instalado => 503 (no 500)
+    monkeypatch.setattr(photos, "PILLOW_AVAILABLE", False)
+    assert _upload(headers, b"\xff\xd8foto").status_code == 503
+
+
+def test_render_rejects_images_over_the_pixel_limit():
+    Image = pytest.importorskip("PIL.Image")
+    buffer = io.BytesIO()
+    # 42 MP: por encima del tope pero debajo del DecompressionBombError de Pillow (2x)
+    Image.new("L", (7000, 6000)).save(buffer, "PNG")
+
+    with pytest.raises(ValueError, match="píxeles"):
+        render_thumbnails(buffer.getvalue(), (160,))
@@ -84,6 +84,7 @@ def test_teacher_submit_draft_to_in_review_success():
     assert r.status_code == 200
     data = r.json()["profile"]
     assert data["status"] == "IN_REVIEW"
+    assert r.headers["etag"] == f'"v{data["version"]}"'
 
 
 def test_teacher_submit_when_not_draft_returns_409():
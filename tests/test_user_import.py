@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import io
+import json
+import os
+
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core.database import get_db
+from app.models.user import User
+from app.modules.users.importer import UserImporter, iter_csv
+
+client = TestClient(app)
+
+
+def _cleanup_users(*emails: str) -> None:
+    db: Session = next(get_db())
+    db.execute(delete(User).where(User.email.in_(emails)))
+    db.commit()
+
+
+def _login(email: str, password: str) -> str:
+    r = client.post("/auth/login", json={"email": email, "password": password})
+    assert r.status_code == 200, r.text
+    return r.json()["access_token"]
+
+
+def _admin_headers() -> dict:
+    token = _login(os.getenv("ADMIN_EMAIL", "admin@parladach.com"), os.getenv("ADMIN_PASSWORD", "Admin123*"))
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_import_csv_creates_users_and_reports_per_row_errors():
+    emails = ["import_a@test.com", "import_b@test.com", "import_existing@test.com"]
+    _cleanup_users(*emails)
+    client.post("/auth/register", json={"email": emails[2], "password": "Student123*", "role": "STUDENT"})
+
+    body = "\n".join([
+        "email,password,role,status",
+        "import_a@test.com,Student123*,STUDENT,",
+        "import_b@test.com,Teacher123*,TEACHER,ACTIVE",
+        "import_a@test.com,Student123*,STUDENT,",      # duplicado en el archivo
+        "import_existing@test.com,Student123*,STUDENT,",  # ya registrado
+        "no-es-un-email,Student123*,STUDENT,",
+        "import_admin@test.com,Admin123*,ADMIN,",       # rol no importable
+    ])
+    r = client.post(
+        "/admin/users/import",
+        content=body.encode(),
+        headers={**_admin_headers(), "Content-Type": "text/csv"},
+    )
+    assert r.status_code == 200, r.text
+    report = r.json()
+    assert report["processed"] == 6
+    assert report["created"] == 2
+    assert report["skipped_duplicate"] == 1
+    assert report["skipped_existing"] == 1
+    assert report["failed"] == 2
+    assert [e["line"] for e in report["errors"]] == [6, 7]
+
+    # Los importados pueden loguear (hash argon2 válido)
+    assert _login("import_b@test.com", "Teacher123*")
+
+
+def test_import_ndjson_in_chunks_with_inline_hashing():
+    emails = [f"import_nd_{i}@test.com" for i in range(5)]
+    _cleanup_users(*emails)
+
+    lines = [json.dumps({"email": e, "password": "Student123*", "role": "STUDENT"}) for e in emails]
+    lines.insert(2, "{no es json")
+    r = client.post(
+        "/admin/users/import",
+        content="\n".join(lines).encode(),
+        headers={**_admin_headers(), "Content-Type": "application/x-ndjson"},
+    )
+    assert r.status_code == 200, r.text
+    assert r.json()["created"] == 5
+    assert r.json()["errors"] == [{"line": 3, "email": None, "error": "Línea inválida"}]
+
+    # Mismo archivo otra vez (vía importer, chunks de 2, sin pool): todo existente
+    progress = []
+    rows = "email,password,role\n" + "\n".join(f"{e},Student123*,STUDENT" for e in emails)
+    db: Session = next(get_db())
+    report = UserImporter(chunk_size=2, hash_workers=0, progress=progress.append).run(db, iter_csv(io.StringIO(rows)))
+    assert report.created == 0
+    assert report.skipped_existing == 5
+    assert len(progress) == 3
+
+
+
+def test_import_requires_admin_and_supported_format():
+    email = "import_not_admin@test.com"
+    _cleanup_users(email)
+    client.post("/auth/register", json={"email": email, "password": "Student123*", "role": "STUDENT"})
+    token = _login(email, "Student123*")
+
+    r = client.post(
+        "/admin/users/import",
+        content=b"email,password,role\n",
+        headers={"Authorization": f"Bearer {token}", "Content-Type": "text/csv"},
+    )
+    assert r.status_code == 403
+
+    r = client.post(
+        "/admin/users/import",
+        content=b"{}",
+        headers={**_admin_headers(), "Content-Type": "application/json"},
+    )
+    assert r.status_code == 415
+
+
+def test_concurrent_import_is_rejected_with_503():
+    from app.modules.users import admin_router
+
+    headers = {**_admin_headers(), "Content-Type": "text/csv"}
+    # Otro import en curso en este proceso
+    assert admin_router._import_running.acquire(blocking=False)
+    try:
+        r = client.post("/admin/users/import", content=b"email,password,role\n", headers=headers)
+    finally:
+        admin_router._import_running.release()
+
+    assert r.status_code == 503
+    assert "Retry-After" in r.headers